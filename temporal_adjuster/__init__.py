@@ -1 +1,4 @@
+from .modules import FiscalCalendar, PeriodDecoder
 from .temporal_adjuster import TemporalAdjuster
+from .adjuster_pipeline import AdjusterPipeline
+from .streaming_adjuster import StreamingAdjuster
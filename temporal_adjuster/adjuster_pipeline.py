@@ -0,0 +1,270 @@
+import inspect
+import re
+from datetime import time as Time
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .common.decorators import BoundAdjuster
+from .common.enums import (
+	ISOWeekday,
+	Weekday,
+	get_week_start,
+	normalize_week_start,
+	normalize_weekday,
+	week_starting_on,
+)
+from .temporal_adjuster import TemporalAdjuster
+
+STEP_SEPARATOR = '|'
+ARGUMENT_SEPARATOR = ':'
+
+# Weekdays may be written with the first three letters of their name, such as 'FRI'.
+_WEEKDAY_ABBREVIATIONS = {weekday.name[:3]: weekday for weekday in Weekday}
+
+# The parameters of the adjusters whose arguments are weekdays.
+_WEEKDAY_PARAMETERS = ('weekday', 'week_start')
+
+# Times of the day are written as up to three fields, for their hours, minutes and seconds, such as '17:30' or '17:30:15.5'.
+_TIME_FIELDS = 3
+_TIME_FIELD = re.compile(r'\d{2}(?:\.\d+)?')
+
+
+def _parse_weekday(argument: str) -> Weekday:
+	weekday = _WEEKDAY_ABBREVIATIONS.get(argument.upper())
+
+	if weekday is not None:
+		return weekday
+
+	return normalize_weekday(int(argument) if argument.isdigit() else argument)
+
+
+def _is_time(parameter: inspect.Parameter) -> bool:
+	"""
+	Returns whether the given parameter takes a time of the day, such as the one of `next_time`.
+	"""
+	annotation = parameter.annotation
+
+	return annotation is Time or Time in getattr(annotation, '__args__', ())
+
+
+def _parse_argument(parameter: inspect.Parameter, argument: str) -> Any:
+	"""
+	Parses the given argument of a spec step according to its parameter. Weekdays and integers are parsed here, and other arguments, such as times, are left to the parsers of the adjuster.
+	"""
+	if parameter.name in _WEEKDAY_PARAMETERS:
+		return _parse_weekday(argument)
+
+	if parameter.annotation is int:
+		return int(argument)
+
+	return argument
+
+
+def _split_arguments(
+	parameters: List[inspect.Parameter], parts: List[str]
+) -> List[str]:
+	"""
+	Groups the given parts of a spec step into its arguments. Times of the day take the parts of their minutes and seconds as well, as in `next_time:17:30`, since they are written with the same separator as the arguments.
+	"""
+	arguments: List[str] = []
+	index = 0
+
+	for parameter in parameters:
+		if index >= len(parts):
+			break
+
+		argument = parts[index]
+		index += 1
+
+		if _is_time(parameter):
+			fields = 1
+
+			while (
+				fields < _TIME_FIELDS
+				and index < len(parts)
+				and _TIME_FIELD.fullmatch(parts[index])
+			):
+				argument = f'{argument}{ARGUMENT_SEPARATOR}{parts[index]}'
+				index += 1
+				fields += 1
+
+		arguments.append(argument)
+
+	return arguments + parts[index:]
+
+
+def _parse_step(step: str) -> BoundAdjuster:
+	"""
+	Returns the bound adjuster of the given step of a spec, such as `nth_of_month:MON:2`.
+	"""
+	name, *parts = [part.strip() for part in step.split(ARGUMENT_SEPARATOR)]
+	adjuster = getattr(TemporalAdjuster, name, None) if name.isidentifier() else None
+
+	if not hasattr(adjuster, 'bind'):
+		raise ValueError(f'Unknown adjuster in spec: {name!r}.')
+
+	parameters = [
+		parameter
+		for parameter in inspect.signature(adjuster).parameters.values()
+		if parameter.name != adjuster.target
+	]
+	arguments = _split_arguments(parameters, parts)
+	# Arguments with a default value, such as the first day of the weeks, may be left out.
+	required = sum(parameter.default is parameter.empty for parameter in parameters)
+
+	if not required <= len(arguments) <= len(parameters):
+		names = ', '.join(parameter.name for parameter in parameters) or 'none'
+		count = (
+			required
+			if required == len(parameters)
+			else f'{required} to {len(parameters)}'
+		)
+
+		raise ValueError(
+			f'The {name} adjuster takes {count} arguments in a spec ({names}), but {len(arguments)} were given.'
+		)
+
+	try:
+		return adjuster.bind(
+			**{
+				parameter.name: _parse_argument(parameter, argument)
+				for parameter, argument in zip(parameters, arguments)
+			}
+		)
+
+	except (KeyError, TypeError, ValueError) as error:
+		raise ValueError(f'Invalid argument in spec step {step!r}: {error}') from None
+
+
+# The week adjusters bind the current week start when it is left out of the spec, so the spec is parsed with the given one, which is part of the `lru_cache` key.
+@lru_cache(maxsize=4096)
+def _compile_spec(spec: str, week_start: Weekday) -> Tuple[BoundAdjuster, ...]:
+	if not spec.strip():
+		raise ValueError('The spec must have at least one step.')
+
+	with week_starting_on(week_start):
+		return tuple(_parse_step(step) for step in spec.split(STEP_SEPARATOR))
+
+
+def compile_spec(spec: str) -> Tuple[BoundAdjuster, ...]:
+	"""
+	Parses the given spec into the bound adjusters of its steps. Specs are parsed once per process, and the result is cached by spec string and current week start (see `get_week_start`), which the week adjusters bind when their week start is left out.
+
+	Args:
+	    spec (str): The spec, such as `first_day_of_next_month|next_or_same:FRI`.
+
+	Raises:
+	    ValueError: If the spec is empty, or one of its steps is invalid.
+
+	Returns:
+	    Tuple[BoundAdjuster, ...]: The bound adjusters, in the order they are applied.
+	"""
+	return _compile_spec(spec, get_week_start())
+
+
+class AdjusterPipeline:
+	"""
+	A sequence of adjusters written as a compact spec, such as `first_day_of_next_month|next_or_same:FRI|nth_of_month:MON:2`, which applies each adjuster to the result of the previous one. Each step is the name of a method of `TemporalAdjuster`, followed by its arguments other than the date, separated by colons, where the arguments with a default value may be left out. Weekdays are written as their name, the first three letters of their name or their Pythonic number, occurrences and minutes as integers, and times of the day in ISO 8601, such as `next_time:17:30`, whose colons are kept in the time.
+
+	Specs are compiled into bound adjusters (see `BoundAdjuster`) once per process, and pipelines are pickled as their spec and week start, so that they are cheap to send to workers, which compile each distinct spec once.
+
+	Examples:
+
+	```
+	>>> from datetime import date
+
+	>>> from temporal_adjuster import AdjusterPipeline
+
+	>>> pipeline = AdjusterPipeline('first_day_of_next_month|next_or_same:FRI')
+	>>> pipeline(date(2024, 6, 13))
+	datetime.date(2024, 7, 5)
+
+	```
+	"""
+
+	__slots__ = ('__spec', '__week_start', '__steps', '__hash')
+
+	# The name of the parameter of `__call__` receiving the dates, which lets batch tools, such as the parallel executor, run pipelines.
+	target = 'date'
+
+	def __init__(
+		self,
+		spec: str,
+		week_start: Optional[Union[Weekday, ISOWeekday, str, int]] = None,
+	) -> None:
+		"""
+		Args:
+		    spec (str): The spec of the pipeline.
+		    week_start (Optional[Union[Weekday, ISOWeekday, str, int]]): The first day of the weeks of the week adjusters whose week start is left out of the spec. Defaults to the current one (see `get_week_start`), which the pipeline keeps, including when it is pickled.
+
+		Raises:
+		    ValueError: If the spec is empty, or one of its steps is invalid.
+		"""
+		self.__spec = spec
+		self.__week_start = normalize_week_start(week_start)
+		self.__steps = _compile_spec(spec, self.__week_start)
+		self.__hash = hash(self.__steps)
+
+	@property
+	def spec(self) -> str:
+		"""
+		The spec of the pipeline.
+		"""
+		return self.__spec
+
+	@property
+	def week_start(self) -> Weekday:
+		"""
+		The first day of the weeks of the week adjusters whose week start is left out of the spec.
+		"""
+		return self.__week_start
+
+	@property
+	def steps(self) -> Tuple[BoundAdjuster, ...]:
+		"""
+		The bound adjusters of the pipeline, in the order they are applied.
+		"""
+		return self.__steps
+
+	def __call__(
+		self,
+		date,
+		*,
+		out: Optional[np.ndarray] = None,
+		backend: Optional[str] = None,
+	) -> Any:
+		"""
+		Adjusts the given date, or batch of dates, with each step of the pipeline in turn.
+
+		Args:
+		    date: The date, or sequence of dates, to adjust.
+		    out (Optional[np.ndarray]): An array of the same shape as the input to write the results into, for `np.ndarray` inputs.
+		    backend (Optional[str]): The name of the compute backend used for batch calls.
+
+		Returns:
+		    The adjusted date, or sequence of dates.
+		"""
+		*steps, last_step = self.__steps
+
+		for step in steps:
+			date = step(date, backend=backend)
+
+		return last_step(date, out=out, backend=backend)
+
+	def __eq__(self, other) -> bool:
+		if not isinstance(other, AdjusterPipeline):
+			return NotImplemented
+
+		return self.__steps == other.__steps
+
+	def __hash__(self) -> int:
+		return self.__hash
+
+	def __repr__(self) -> str:
+		return f'AdjusterPipeline({self.__spec!r}, week_start=Weekday.{self.__week_start.name})'
+
+	# The week start is pickled as its number, which is shorter than the enum.
+	def __reduce__(self):
+		return AdjusterPipeline, (self.__spec, int(self.__week_start))
@@ -0,0 +1,86 @@
+from typing import Any, Optional, Tuple, Union
+
+import numpy as np
+
+from .common.decorators import BoundAdjuster
+from .common.enums import ISOWeekday, Weekday
+
+STEP_SEPARATOR: str
+ARGUMENT_SEPARATOR: str
+
+def compile_spec(spec: str) -> Tuple[BoundAdjuster, ...]:
+	"""
+	Parses the given spec into the bound adjusters of its steps. Specs are parsed once per process, and the result is cached by spec string and current week start (see `get_week_start`), which the week adjusters bind when their week start is left out.
+
+	Args:
+	    spec (str): The spec, such as `first_day_of_next_month|next_or_same:FRI`.
+
+	Raises:
+	    ValueError: If the spec is empty, or one of its steps is invalid.
+
+	Returns:
+	    Tuple[BoundAdjuster, ...]: The bound adjusters, in the order they are applied.
+	"""
+
+class AdjusterPipeline:
+	"""
+	A sequence of adjusters written as a compact spec, such as `first_day_of_next_month|next_or_same:FRI|nth_of_month:MON:2`, which applies each adjuster to the result of the previous one. Each step is the name of a method of `TemporalAdjuster`, followed by its arguments other than the date, separated by colons, where the arguments with a default value may be left out. Weekdays are written as their name, the first three letters of their name or their Pythonic number, occurrences and minutes as integers, and times of the day in ISO 8601, such as `next_time:17:30`, whose colons are kept in the time.
+
+	Specs are compiled into bound adjusters (see `BoundAdjuster`) once per process, and pipelines are pickled as their spec and week start, so that they are cheap to send to workers, which compile each distinct spec once.
+	"""
+
+	target: str
+
+	def __init__(
+		self,
+		spec: str,
+		week_start: Optional[Union[Weekday, ISOWeekday, str, int]] = None,
+	) -> None:
+		"""
+		Args:
+		    spec (str): The spec of the pipeline.
+		    week_start (Optional[Union[Weekday, ISOWeekday, str, int]]): The first day of the weeks of the week adjusters whose week start is left out of the spec. Defaults to the current one (see `get_week_start`), which the pipeline keeps, including when it is pickled.
+
+		Raises:
+		    ValueError: If the spec is empty, or one of its steps is invalid.
+		"""
+
+	@property
+	def spec(self) -> str:
+		"""
+		The spec of the pipeline.
+		"""
+
+	@property
+	def week_start(self) -> Weekday:
+		"""
+		The first day of the weeks of the week adjusters whose week start is left out of the spec.
+		"""
+
+	@property
+	def steps(self) -> Tuple[BoundAdjuster, ...]:
+		"""
+		The bound adjusters of the pipeline, in the order they are applied.
+		"""
+
+	def __call__(
+		self,
+		date,
+		*,
+		out: Optional[np.ndarray] = None,
+		backend: Optional[str] = None,
+	) -> Any:
+		"""
+		Adjusts the given date, or batch of dates, with each step of the pipeline in turn.
+
+		Args:
+		    date: The date, or sequence of dates, to adjust.
+		    out (Optional[np.ndarray]): An array of the same shape as the input to write the results into, for `np.ndarray` inputs.
+		    backend (Optional[str]): The name of the compute backend used for batch calls.
+
+		Returns:
+		    The adjusted date, or sequence of dates.
+		"""
+
+	def __eq__(self, other) -> bool: ...
+	def __hash__(self) -> int: ...
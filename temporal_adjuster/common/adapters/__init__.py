@@ -0,0 +1,5 @@
+from .container_adapters import (
+	ContainerAdapter,
+	get_adapter,
+	register_adapter,
+)
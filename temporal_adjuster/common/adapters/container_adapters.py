@@ -0,0 +1,277 @@
+import sys
+from collections.abc import Mapping
+from copy import copy
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+
+
+class ContainerAdapter:
+	"""
+	Converts a container of temporal objects into a contiguous one-dimensional `np.ndarray` buffer and back. The buffer returned by `to_buffer` is owned by the caller, who writes the adjusted values into it, so it must never share memory with the input container. `from_buffer` should wrap the buffer with as few copies as possible, restoring the metadata (index, name, dtype, etc.) of the original container.
+	"""
+
+	shares_memory = False
+
+	def to_buffer(self, container: Any) -> np.ndarray:
+		"""
+		Converts the given container into a writable one-dimensional buffer.
+
+		Args:
+		    container (Any): The container to convert.
+
+		Returns:
+		    np.ndarray: A buffer holding the values of the container.
+		"""
+		raise NotImplementedError
+
+	def view(self, container: Any) -> np.ndarray:
+		"""
+		Returns the values of the given container as a one-dimensional array that may share memory with the container, so it must not be written to. Adapters whose view shares memory must set `shares_memory` to True.
+
+		Args:
+		    container (Any): The container to convert.
+
+		Returns:
+		    np.ndarray: An array holding the values of the container.
+		"""
+		return self.to_buffer(container)
+
+	def from_buffer(self, buffer: np.ndarray, container: Any) -> Any:
+		"""
+		Rebuilds a container of the same type and metadata as the original one from the given buffer.
+
+		Args:
+		    buffer (np.ndarray): The buffer holding the adjusted values.
+		    container (Any): The original container.
+
+		Returns:
+		    Any: The rebuilt container.
+		"""
+		raise NotImplementedError
+
+
+class IterableAdapter(ContainerAdapter):
+	"""
+	Adapter for generic iterables, used when no adapter is registered for the type of the container. The container is rebuilt by calling its type with a list of the adjusted values.
+	"""
+
+	def to_buffer(self, container: Any) -> np.ndarray:
+		return np.asarray(list(container))
+
+	def from_buffer(self, buffer: np.ndarray, container: Any) -> Any:
+		return type(container)(buffer.tolist())
+
+
+class SequenceAdapter(ContainerAdapter):
+	"""
+	Adapter for built-in sequences such as `list` and `tuple`. The buffer elements are handed back as they are, so no intermediate list is created.
+	"""
+
+	def to_buffer(self, container: Any) -> np.ndarray:
+		return np.asarray(container)
+
+	def from_buffer(self, buffer: np.ndarray, container: Any) -> Any:
+		return type(container)(buffer)
+
+
+class SetAdapter(SequenceAdapter):
+	"""
+	Adapter for `set` and `frozenset`.
+	"""
+
+	def to_buffer(self, container: Any) -> np.ndarray:
+		return np.fromiter(container, dtype=object, count=len(container))
+
+
+class MappingAdapter(ContainerAdapter):
+	"""
+	Adapter for `Mapping` containers, such as `dict`, whose values are adjusted while their keys are kept. Dictionaries are rebuilt as a copy of the input, keeping their type and attributes (such as the `default_factory` of a `defaultdict`), and other mappings as a `dict`.
+	"""
+
+	def to_buffer(self, container: Any) -> np.ndarray:
+		return np.asarray(list(container.values()))
+
+	def from_buffer(self, buffer: np.ndarray, container: Any) -> Any:
+		adjusted = zip(container.keys(), buffer)
+
+		if isinstance(container, dict):
+			output = copy(container)
+			output.update(adjusted)
+
+			return output
+
+		return dict(adjusted)
+
+
+class NDArrayAdapter(ContainerAdapter):
+	"""
+	Adapter for `np.ndarray` of any shape. The shape and dtype of the input array are kept, and the buffer is returned as the output without any further copy.
+	"""
+
+	shares_memory = True
+
+	def to_buffer(self, container: np.ndarray) -> np.ndarray:
+		return np.array(container, copy=True)
+
+	def view(self, container: np.ndarray) -> np.ndarray:
+		return container
+
+	def from_buffer(self, buffer: np.ndarray, container: np.ndarray) -> np.ndarray:
+		return buffer
+
+
+class SeriesAdapter(ContainerAdapter):
+	"""
+	Adapter for `pd.Series`. The index, name and dtype of the input series are kept.
+	"""
+
+	shares_memory = True
+
+	def to_buffer(self, container: Any) -> np.ndarray:
+		return container.to_numpy(copy=True)
+
+	def view(self, container: Any) -> np.ndarray:
+		return container.to_numpy()
+
+	def from_buffer(self, buffer: np.ndarray, container: Any) -> Any:
+		return type(container)(
+			buffer, index=container.index, name=container.name, copy=False
+		)
+
+
+class IndexAdapter(ContainerAdapter):
+	"""
+	Adapter for `pd.Index` and its subclasses, such as `pd.DatetimeIndex`. The name and dtype of the input index are kept.
+	"""
+
+	shares_memory = True
+
+	def to_buffer(self, container: Any) -> np.ndarray:
+		return container.to_numpy(copy=True)
+
+	def view(self, container: Any) -> np.ndarray:
+		return container.to_numpy()
+
+	def from_buffer(self, buffer: np.ndarray, container: Any) -> Any:
+		import pandas as pd
+
+		return pd.Index(buffer, name=container.name, copy=False)
+
+
+class ArrowArrayAdapter(ContainerAdapter):
+	"""
+	Adapter for `pa.Array`. The Arrow type of the input array is kept.
+	"""
+
+	shares_memory = True
+
+	def to_buffer(self, container: Any) -> np.ndarray:
+		return container.to_numpy(zero_copy_only=False, writable=True)
+
+	def view(self, container: Any) -> np.ndarray:
+		return container.to_numpy(zero_copy_only=False)
+
+	def from_buffer(self, buffer: np.ndarray, container: Any) -> Any:
+		import pyarrow as pa
+
+		return pa.array(buffer, type=container.type)
+
+
+class ArrowChunkedArrayAdapter(ArrowArrayAdapter):
+	"""
+	Adapter for `pa.ChunkedArray`. The Arrow type of the input array is kept, and the output has a single chunk.
+	"""
+
+	def to_buffer(self, container: Any) -> np.ndarray:
+		return np.array(container.to_numpy(), copy=True)
+
+	def view(self, container: Any) -> np.ndarray:
+		return container.to_numpy()
+
+	def from_buffer(self, buffer: np.ndarray, container: Any) -> Any:
+		import pyarrow as pa
+
+		return pa.chunked_array([pa.array(buffer, type=container.type)])
+
+
+_adapters: Dict[type, ContainerAdapter] = {}
+_resolved: Dict[type, ContainerAdapter] = {}
+_fallback = IterableAdapter()
+_mapping_fallback = MappingAdapter()
+
+
+def register_adapter(container_type: type, adapter: ContainerAdapter) -> None:
+	"""
+	Registers the adapter used to convert containers of the given type, and of its subclasses, in batch calls. Registering an adapter for a type that already has one replaces it.
+
+	Args:
+	    container_type (type): The type of the container.
+	    adapter (ContainerAdapter): The adapter to use for the type.
+	"""
+	if not isinstance(adapter, ContainerAdapter):
+		raise TypeError(
+			f'The adapter must be an instance of ContainerAdapter, but is {type(adapter).__name__}.'
+		)
+
+	_adapters[container_type] = adapter
+	_resolved.clear()
+
+
+def _register_pandas_adapters() -> None:
+	import pandas as pd
+
+	register_adapter(pd.Series, SeriesAdapter())
+	register_adapter(pd.Index, IndexAdapter())
+
+
+def _register_arrow_adapters() -> None:
+	import pyarrow as pa
+
+	register_adapter(pa.Array, ArrowArrayAdapter())
+	register_adapter(pa.ChunkedArray, ArrowChunkedArrayAdapter())
+
+
+# Adapters for optional dependencies are only registered once the dependency has been imported by the caller, so that importing this package stays cheap.
+_lazy_adapters: Dict[str, Callable[[], None]] = {
+	'pandas': _register_pandas_adapters,
+	'pyarrow': _register_arrow_adapters,
+}
+
+
+def _register_loaded_lazy_adapters() -> None:
+	for module in [module for module in _lazy_adapters if module in sys.modules]:
+		_lazy_adapters.pop(module)()
+
+
+def get_adapter(container: Any) -> ContainerAdapter:
+	"""
+	Returns the adapter registered for the type of the given container, or for its closest registered base class. Mappings without a registered adapter are handled by `MappingAdapter`, and other containers by a generic iterable adapter.
+
+	Args:
+	    container (Any): The container to adapt.
+
+	Returns:
+	    ContainerAdapter: The adapter for the container.
+	"""
+	container_type = type(container)
+	adapter: Optional[ContainerAdapter] = _resolved.get(container_type)
+
+	if adapter is None:
+		_register_loaded_lazy_adapters()
+
+		adapter = next(
+			(_adapters[cls] for cls in container_type.__mro__ if cls in _adapters),
+			_mapping_fallback if isinstance(container, Mapping) else _fallback,
+		)
+		_resolved[container_type] = adapter
+
+	return adapter
+
+
+register_adapter(list, SequenceAdapter())
+register_adapter(tuple, SequenceAdapter())
+register_adapter(dict, MappingAdapter())
+register_adapter(set, SetAdapter())
+register_adapter(frozenset, SetAdapter())
+register_adapter(np.ndarray, NDArrayAdapter())
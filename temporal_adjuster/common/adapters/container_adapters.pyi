@@ -0,0 +1,74 @@
+from typing import Any
+
+import numpy as np
+
+class ContainerAdapter:
+	"""
+	Converts a container of temporal objects into a contiguous one-dimensional `np.ndarray` buffer and back. The buffer returned by `to_buffer` is owned by the caller, who writes the adjusted values into it, so it must never share memory with the input container. `from_buffer` should wrap the buffer with as few copies as possible, restoring the metadata (index, name, dtype, etc.) of the original container.
+	"""
+
+	shares_memory: bool
+
+	def to_buffer(self, container: Any) -> np.ndarray:
+		"""
+		Converts the given container into a writable one-dimensional buffer.
+
+		Args:
+		    container (Any): The container to convert.
+
+		Returns:
+		    np.ndarray: A buffer holding the values of the container.
+		"""
+
+	def view(self, container: Any) -> np.ndarray:
+		"""
+		Returns the values of the given container as a one-dimensional array that may share memory with the container, so it must not be written to. Adapters whose view shares memory must set `shares_memory` to True.
+
+		Args:
+		    container (Any): The container to convert.
+
+		Returns:
+		    np.ndarray: An array holding the values of the container.
+		"""
+
+	def from_buffer(self, buffer: np.ndarray, container: Any) -> Any:
+		"""
+		Rebuilds a container of the same type and metadata as the original one from the given buffer.
+
+		Args:
+		    buffer (np.ndarray): The buffer holding the adjusted values.
+		    container (Any): The original container.
+
+		Returns:
+		    Any: The rebuilt container.
+		"""
+
+class IterableAdapter(ContainerAdapter): ...
+class SequenceAdapter(ContainerAdapter): ...
+class SetAdapter(SequenceAdapter): ...
+class MappingAdapter(ContainerAdapter): ...
+class NDArrayAdapter(ContainerAdapter): ...
+class SeriesAdapter(ContainerAdapter): ...
+class IndexAdapter(ContainerAdapter): ...
+class ArrowArrayAdapter(ContainerAdapter): ...
+class ArrowChunkedArrayAdapter(ArrowArrayAdapter): ...
+
+def register_adapter(container_type: type, adapter: ContainerAdapter) -> None:
+	"""
+	Registers the adapter used to convert containers of the given type, and of its subclasses, in batch calls. Registering an adapter for a type that already has one replaces it.
+
+	Args:
+	    container_type (type): The type of the container.
+	    adapter (ContainerAdapter): The adapter to use for the type.
+	"""
+
+def get_adapter(container: Any) -> ContainerAdapter:
+	"""
+	Returns the adapter registered for the type of the given container, or for its closest registered base class. Mappings without a registered adapter are handled by `MappingAdapter`, and other containers by a generic iterable adapter.
+
+	Args:
+	    container (Any): The container to adapt.
+
+	Returns:
+	    ContainerAdapter: The adapter for the container.
+	"""
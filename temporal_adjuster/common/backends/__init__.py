@@ -0,0 +1,20 @@
+from .compute_backends import (
+	ComputeBackend,
+	NumbaBackend,
+	NumPyBackend,
+	PythonBackend,
+	get_backend,
+	register_backend,
+	set_backend,
+)
+from .dispatch_thresholds import (
+	DEFAULT_THRESHOLD,
+	calibrate,
+	calibration_arguments,
+	get_threshold,
+	host_thresholds_path,
+	load_thresholds,
+	reset_thresholds,
+	save_thresholds,
+	set_thresholds,
+)
@@ -0,0 +1,217 @@
+from importlib.util import find_spec
+from threading import Lock
+from types import FunctionType
+from typing import Callable, Dict, Optional
+
+import numpy as np
+
+
+class ComputeBackend:
+	"""
+	Computes the batch calls of the adjusters. A backend turns the vectorized kernel of a method into the function that adjusts arrays of `np.datetime64[D]` values, or returns None to adjust them one by one with the scalar method. Every backend must give the same results as the scalar method.
+	"""
+
+	name = ''
+
+	def is_available(self) -> bool:
+		"""
+		Returns whether the dependencies of the backend are installed.
+		"""
+		return True
+
+	def prepare(self, kernel: Callable) -> Optional[Callable]:
+		"""
+		Returns the function that adjusts the day numbers of a batch in place of the given kernel, which takes the same arguments, or None to adjust each item with the scalar method.
+
+		Args:
+		    kernel (Callable): The vectorized kernel of the method.
+
+		Returns:
+		    Optional[Callable]: The function computing the batch.
+		"""
+		raise NotImplementedError
+
+
+class PythonBackend(ComputeBackend):
+	"""
+	Adjusts every item with the pure-Python scalar method. It only depends on the standard library (and `dateutil`), and is the reference for the other backends. Arrays in units finer than microseconds are still adjusted by the NumPy kernels, as `datetime` objects would truncate them.
+	"""
+
+	name = 'python'
+
+	def prepare(self, kernel: Callable) -> Optional[Callable]:
+		return None
+
+
+class NumPyBackend(ComputeBackend):
+	"""
+	Adjusts whole arrays at once with the vectorized NumPy kernels. This is the default backend.
+	"""
+
+	name = 'numpy'
+
+	def prepare(self, kernel: Callable) -> Optional[Callable]:
+		return kernel
+
+
+def _is_kernel_function(value) -> bool:
+	return isinstance(value, FunctionType) and value.__module__.startswith(
+		'temporal_adjuster.'
+	)
+
+
+class NumbaBackend(ComputeBackend):
+	"""
+	Adjusts whole arrays at once with the vectorized kernels compiled by Numba, releasing the GIL while computing. Each kernel is compiled on its first use, along with the calendar functions it calls. Kernels that Numba cannot compile, such as the ones raising errors with formatted messages, run as NumPy kernels instead.
+	"""
+
+	name = 'numba'
+
+	def __init__(self) -> None:
+		self.__kernels: Dict[Callable, Callable] = {}
+		self.__functions: Dict[Callable, Callable] = {}
+		self.__lock = Lock()
+		self.__available: Optional[bool] = None
+
+	def is_available(self) -> bool:
+		if self.__available is None:
+			self.__available = find_spec('numba') is not None
+
+		return self.__available
+
+	def prepare(self, kernel: Callable) -> Optional[Callable]:
+		compiled = self.__kernels.get(kernel)
+
+		if compiled is None:
+			with self.__lock:
+				compiled = self.__kernels.get(kernel)
+
+				if compiled is None:
+					compiled = self.__kernels[kernel] = self.__compile(kernel)
+
+		return compiled
+
+	def __compile(self, kernel: Callable) -> Callable:
+		"""
+		Returns a function that runs the compiled version of the given kernel, or the kernel itself if it cannot be compiled.
+		"""
+		import numba
+
+		compiled_functions = self.__functions
+
+		def jit(function: FunctionType):
+			# Numba only calls compiled functions, so the functions called by the kernel are compiled too, through a copy of their globals.
+			if function not in compiled_functions:
+				function_globals = dict(function.__globals__)
+
+				for name in function.__code__.co_names:
+					if _is_kernel_function(function_globals.get(name)):
+						function_globals[name] = jit(function_globals[name])
+
+				compiled_functions[function] = numba.njit(nogil=True)(
+					FunctionType(
+						function.__code__,
+						function_globals,
+						function.__name__,
+						function.__defaults__,
+						function.__closure__,
+					)
+				)
+
+			return compiled_functions[function]
+
+		compiled_kernel = jit(kernel)
+		failed = False
+
+		def run(days, **parameters):
+			nonlocal failed
+
+			if not failed:
+				try:
+					return compiled_kernel(
+						days,
+						**{
+							name: int(value)
+							if isinstance(value, (int, np.integer))
+							else value
+							for name, value in parameters.items()
+						},
+					)
+
+				except numba.core.errors.NumbaError:
+					failed = True
+
+			return kernel(days, **parameters)
+
+		return run
+
+
+_backends: Dict[str, ComputeBackend] = {}
+_default_backend = 'numpy'
+
+
+def register_backend(backend: ComputeBackend) -> None:
+	"""
+	Registers the given backend under its name. Registering a backend with the name of another one replaces it.
+
+	Args:
+	    backend (ComputeBackend): The backend to register.
+	"""
+	if not isinstance(backend, ComputeBackend):
+		raise TypeError(
+			f'The backend must be an instance of ComputeBackend, but is {type(backend).__name__}.'
+		)
+
+	_backends[backend.name] = backend
+
+
+def get_backend(name: Optional[str] = None) -> ComputeBackend:
+	"""
+	Returns the backend registered under the given name, or the default backend.
+
+	Args:
+	    name (Optional[str]): The name of the backend.
+
+	Raises:
+	    ValueError: If no backend is registered under the given name.
+	    ImportError: If the dependencies of the backend are not installed.
+
+	Returns:
+	    ComputeBackend: The backend.
+	"""
+	name = name or _default_backend
+	backend = _backends.get(name)
+
+	if backend is None:
+		raise ValueError(
+			f'Unknown backend: {name}. The available backends are: {", ".join(_backends)}.'
+		)
+
+	if not backend.is_available():
+		raise ImportError(
+			f'The {name} backend is not available, as its dependencies are not installed.'
+		)
+
+	return backend
+
+
+def set_backend(name: str) -> None:
+	"""
+	Sets the backend used by the batch calls that do not select one.
+
+	Args:
+	    name (str): The name of the backend.
+
+	Raises:
+	    ValueError: If no backend is registered under the given name.
+	    ImportError: If the dependencies of the backend are not installed.
+	"""
+	global _default_backend
+
+	get_backend(name)
+	_default_backend = name
+
+
+register_backend(PythonBackend())
+register_backend(NumPyBackend())
+register_backend(NumbaBackend())
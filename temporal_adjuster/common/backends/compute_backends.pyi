@@ -0,0 +1,74 @@
+from typing import Callable, Optional
+
+class ComputeBackend:
+	"""
+	Computes the batch calls of the adjusters. A backend turns the vectorized kernel of a method into the function that adjusts arrays of `np.datetime64[D]` values, or returns None to adjust them one by one with the scalar method. Every backend must give the same results as the scalar method.
+	"""
+
+	name: str
+
+	def is_available(self) -> bool:
+		"""
+		Returns whether the dependencies of the backend are installed.
+		"""
+
+	def prepare(self, kernel: Callable) -> Optional[Callable]:
+		"""
+		Returns the function that adjusts the day numbers of a batch in place of the given kernel, which takes the same arguments, or None to adjust each item with the scalar method.
+
+		Args:
+		    kernel (Callable): The vectorized kernel of the method.
+
+		Returns:
+		    Optional[Callable]: The function computing the batch.
+		"""
+
+class PythonBackend(ComputeBackend):
+	"""
+	Adjusts every item with the pure-Python scalar method. It only depends on the standard library (and `dateutil`), and is the reference for the other backends. Arrays in units finer than microseconds are still adjusted by the NumPy kernels, as `datetime` objects would truncate them.
+	"""
+
+class NumPyBackend(ComputeBackend):
+	"""
+	Adjusts whole arrays at once with the vectorized NumPy kernels. This is the default backend.
+	"""
+
+class NumbaBackend(ComputeBackend):
+	"""
+	Adjusts whole arrays at once with the vectorized kernels compiled by Numba, releasing the GIL while computing. Each kernel is compiled on its first use, along with the calendar functions it calls. Kernels that Numba cannot compile, such as the ones raising errors with formatted messages, run as NumPy kernels instead.
+	"""
+
+def register_backend(backend: ComputeBackend) -> None:
+	"""
+	Registers the given backend under its name. Registering a backend with the name of another one replaces it.
+
+	Args:
+	    backend (ComputeBackend): The backend to register.
+	"""
+
+def get_backend(name: Optional[str] = None) -> ComputeBackend:
+	"""
+	Returns the backend registered under the given name, or the default backend.
+
+	Args:
+	    name (Optional[str]): The name of the backend.
+
+	Raises:
+	    ValueError: If no backend is registered under the given name.
+	    ImportError: If the dependencies of the backend are not installed.
+
+	Returns:
+	    ComputeBackend: The backend.
+	"""
+
+def set_backend(name: str) -> None:
+	"""
+	Sets the backend used by the batch calls that do not select one.
+
+	Args:
+	    name (str): The name of the backend.
+
+	Raises:
+	    ValueError: If no backend is registered under the given name.
+	    ImportError: If the dependencies of the backend are not installed.
+	"""
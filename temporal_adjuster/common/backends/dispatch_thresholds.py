@@ -0,0 +1,290 @@
+import inspect
+import json
+import os
+import socket
+import warnings
+from datetime import time
+from pathlib import Path
+from timeit import Timer
+from typing import Callable, Dict, Iterable, Mapping, Optional, Union
+
+import numpy as np
+
+# Inputs with fewer items than the threshold of their method are adjusted one by one, as the setup of the vectorized kernels costs more than it saves.
+DEFAULT_THRESHOLD = 2
+
+# Crossovers measured by `calibrate` on a typical host, for the methods whose scalar version is the cheapest compared to their kernel.
+_BUILT_IN_THRESHOLDS: Dict[str, int] = {
+	'first_day_of_iso_year': 8,
+	'first_day_of_last_month': 4,
+	'first_day_of_last_quarter': 4,
+	'first_day_of_last_year': 4,
+	'first_day_of_month': 16,
+	'first_day_of_next_month': 4,
+	'first_day_of_next_quarter': 4,
+	'first_day_of_quarter': 16,
+	'first_day_of_year': 8,
+	'first_of_month': 4,
+	'first_of_next_year': 4,
+	'first_of_year': 4,
+	'last_day_of_last_iso_year': 4,
+	'last_day_of_last_month': 4,
+	'last_day_of_last_quarter': 4,
+	'last_day_of_last_year': 4,
+	'last_day_of_month': 8,
+	'last_day_of_next_month': 4,
+	'last_day_of_next_quarter': 4,
+	'last_day_of_next_year': 4,
+	'last_day_of_quarter': 4,
+	'last_day_of_year': 16,
+	'nth_of_month': 16,
+	'nth_of_quarter': 8,
+	'nth_of_year': 8,
+}
+
+_thresholds: Dict[str, int] = dict(_BUILT_IN_THRESHOLDS)
+_host_thresholds_loaded = False
+
+
+def host_thresholds_path() -> Path:
+	"""
+	Returns the path of the thresholds saved for this host, which is read from the `TEMPORAL_ADJUSTER_THRESHOLDS` environment variable if it is set, or is in the user cache directory otherwise.
+	"""
+	path = os.environ.get('TEMPORAL_ADJUSTER_THRESHOLDS')
+
+	if path:
+		return Path(path)
+
+	cache = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+
+	return Path(cache) / 'temporal_adjuster' / f'thresholds-{socket.gethostname()}.json'
+
+
+def _load_host_thresholds() -> None:
+	global _host_thresholds_loaded
+
+	_host_thresholds_loaded = True
+
+	try:
+		load_thresholds()
+
+	except (OSError, ValueError):
+		# Hosts that were not calibrated keep the built-in defaults.
+		pass
+
+
+def get_threshold(method: str) -> int:
+	"""
+	Returns the minimum number of items for which batch calls of the given method use the vectorized kernel. The thresholds saved for this host are loaded on first use.
+
+	Args:
+	    method (str): The name of the method.
+
+	Returns:
+	    int: The threshold of the method.
+	"""
+	if not _host_thresholds_loaded:
+		_load_host_thresholds()
+
+	return _thresholds.get(method, DEFAULT_THRESHOLD)
+
+
+def _is_threshold(threshold) -> bool:
+	"""
+	Returns whether the given value is a valid threshold, a non-negative integer.
+	"""
+	return (
+		isinstance(threshold, (int, np.integer))
+		and not isinstance(threshold, bool)
+		and threshold >= 0
+	)
+
+
+def set_thresholds(thresholds: Mapping[str, int]) -> None:
+	"""
+	Sets the thresholds of the given methods, keeping the ones of the other methods.
+
+	Args:
+	    thresholds (Mapping[str, int]): The thresholds, by method name.
+
+	Raises:
+	    ValueError: If a threshold is not a non-negative integer.
+	"""
+	for method, threshold in thresholds.items():
+		if not _is_threshold(threshold):
+			raise ValueError(
+				f'The threshold of {method} must be a non-negative integer, but is {threshold!r}.'
+			)
+
+	_thresholds.update(
+		{method: int(threshold) for method, threshold in thresholds.items()}
+	)
+
+
+def reset_thresholds() -> None:
+	"""
+	Restores the built-in thresholds, discarding the calibrated ones.
+	"""
+	global _host_thresholds_loaded
+
+	_thresholds.clear()
+	_thresholds.update(_BUILT_IN_THRESHOLDS)
+	_host_thresholds_loaded = True
+
+
+def save_thresholds(path: Union[str, Path, None] = None) -> Path:
+	"""
+	Saves the current thresholds, so that they are loaded by the next processes on this host.
+
+	Args:
+	    path (Union[str, Path, None]): The file to save the thresholds to. Defaults to the path of the thresholds of this host.
+
+	Returns:
+	    Path: The path of the saved file.
+	"""
+	path = Path(path) if path else host_thresholds_path()
+	path.parent.mkdir(parents=True, exist_ok=True)
+	path.write_text(
+		json.dumps(
+			{'host': socket.gethostname(), 'thresholds': _thresholds},
+			indent='\t',
+			sort_keys=True,
+		)
+	)
+
+	return path
+
+
+def load_thresholds(path: Union[str, Path, None] = None) -> Dict[str, int]:
+	"""
+	Loads thresholds saved by `save_thresholds`. Entries that are not non-negative integers are skipped with a warning, and their methods keep their built-in thresholds.
+
+	Args:
+	    path (Union[str, Path, None]): The file to load the thresholds from. Defaults to the path of the thresholds of this host.
+
+	Raises:
+	    OSError: If the file cannot be read.
+	    ValueError: If the file does not hold thresholds.
+
+	Returns:
+	    Dict[str, int]: The loaded thresholds.
+	"""
+	content = json.loads(Path(path or host_thresholds_path()).read_text())
+	thresholds = content.get('thresholds') if isinstance(content, dict) else None
+
+	if not isinstance(thresholds, dict):
+		raise ValueError('The file does not hold dispatch thresholds.')
+
+	valid = {}
+
+	for method, threshold in thresholds.items():
+		if _is_threshold(threshold):
+			valid[method] = threshold
+			continue
+
+		warnings.warn(
+			f'Ignoring the invalid dispatch threshold of {method}, {threshold!r}, in {path or host_thresholds_path()}.',
+			stacklevel=2,
+		)
+		valid[method] = _BUILT_IN_THRESHOLDS.get(method, DEFAULT_THRESHOLD)
+
+	set_thresholds(valid)
+
+	return valid
+
+
+def calibration_arguments(method: Callable, dates: np.ndarray) -> Dict:
+	"""
+	Returns representative arguments for a batch call of the given method on the given dates, as measured by `calibrate`, so that benchmarks can call every method with a vectorized kernel alike, such as `method(**calibration_arguments(method, dates))`.
+
+	Args:
+	    method (Callable): The method, such as `TemporalAdjuster.first_day_of_month`.
+	    dates (np.ndarray): The `np.datetime64[D]` dates of the batch. The methods adjusting the time of the day get them with a time of the day.
+
+	Returns:
+	    Dict: The arguments of the call, by parameter name.
+	"""
+	from ..enums import Weekday
+
+	# The methods adjusting the time of the day take dates with a time of the day.
+	if getattr(method, 'time_of_day', False):
+		dates = dates.astype('datetime64[s]') + np.timedelta64(45_296, 's')
+
+	samples = {
+		method.target: dates,
+		'weekday': Weekday.MONDAY,
+		'n': 1,
+		'minutes': 15,
+		'time': time(17, 30),
+	}
+
+	return {
+		name: samples[name]
+		for name in inspect.signature(method).parameters
+		if name in samples
+	}
+
+
+def _seconds_per_call(function: Callable) -> float:
+	"""
+	Returns the best time of a call of the given function, measured over runs of at least a few milliseconds.
+	"""
+	timer = Timer(function)
+	number = 1
+
+	while timer.timeit(number) < 0.005:
+		number *= 2
+
+	return min(timer.repeat(repeat=3, number=number)) / number
+
+
+def calibrate(
+	methods: Optional[Iterable[Callable]] = None, max_size: int = 256
+) -> Dict[str, int]:
+	"""
+	Measures, for each of the given methods, the smallest input for which the vectorized kernel is faster than adjusting the items one by one, and sets the thresholds accordingly. Call `save_thresholds` afterwards to keep them for the next processes on this host.
+
+	Args:
+	    methods (Optional[Iterable[Callable]]): The methods to calibrate. Defaults to every method of `TemporalAdjuster` with a vectorized kernel.
+	    max_size (int): The largest input to measure. Methods whose kernel is never faster get a threshold of twice this size.
+
+	Returns:
+	    Dict[str, int]: The measured thresholds, by method name.
+	"""
+	if methods is None:
+		from ...temporal_adjuster import TemporalAdjuster
+
+		methods = [
+			method
+			for method in (
+				getattr(TemporalAdjuster, name) for name in dir(TemporalAdjuster)
+			)
+			if getattr(method, 'kernel', None) is not None
+		]
+
+	thresholds = {}
+
+	for method in methods:
+		threshold = 2 * max_size
+		size = 1
+
+		while size <= max_size:
+			arguments = calibration_arguments(
+				method,
+				np.datetime64('2000-01-03') + np.arange(size) * np.timedelta64(37, 'D'),
+			)
+
+			scalar = _seconds_per_call(lambda: method(**arguments, backend='python'))
+			vector = _seconds_per_call(lambda: method(**arguments, backend='numpy'))
+
+			if vector <= scalar:
+				threshold = size
+				break
+
+			size *= 2
+
+		thresholds[method.__name__] = threshold
+
+	set_thresholds(thresholds)
+
+	return thresholds
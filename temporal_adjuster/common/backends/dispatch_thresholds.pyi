@@ -0,0 +1,90 @@
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Mapping, Optional, Union
+
+import numpy as np
+
+DEFAULT_THRESHOLD: int
+
+def host_thresholds_path() -> Path:
+	"""
+	Returns the path of the thresholds saved for this host, which is read from the `TEMPORAL_ADJUSTER_THRESHOLDS` environment variable if it is set, or is in the user cache directory otherwise.
+	"""
+
+def get_threshold(method: str) -> int:
+	"""
+	Returns the minimum number of items for which batch calls of the given method use the vectorized kernel. The thresholds saved for this host are loaded on first use.
+
+	Args:
+	    method (str): The name of the method.
+
+	Returns:
+	    int: The threshold of the method.
+	"""
+
+def set_thresholds(thresholds: Mapping[str, int]) -> None:
+	"""
+	Sets the thresholds of the given methods, keeping the ones of the other methods.
+
+	Args:
+	    thresholds (Mapping[str, int]): The thresholds, by method name.
+
+	Raises:
+	    ValueError: If a threshold is not a non-negative integer.
+	"""
+
+def reset_thresholds() -> None:
+	"""
+	Restores the built-in thresholds, discarding the calibrated ones.
+	"""
+
+def save_thresholds(path: Union[str, Path, None] = None) -> Path:
+	"""
+	Saves the current thresholds, so that they are loaded by the next processes on this host.
+
+	Args:
+	    path (Union[str, Path, None]): The file to save the thresholds to. Defaults to the path of the thresholds of this host.
+
+	Returns:
+	    Path: The path of the saved file.
+	"""
+
+def load_thresholds(path: Union[str, Path, None] = None) -> Dict[str, int]:
+	"""
+	Loads thresholds saved by `save_thresholds`. Entries that are not non-negative integers are skipped with a warning, and their methods keep their built-in thresholds.
+
+	Args:
+	    path (Union[str, Path, None]): The file to load the thresholds from. Defaults to the path of the thresholds of this host.
+
+	Raises:
+	    OSError: If the file cannot be read.
+	    ValueError: If the file does not hold thresholds.
+
+	Returns:
+	    Dict[str, int]: The loaded thresholds.
+	"""
+
+def calibration_arguments(method: Callable, dates: np.ndarray) -> Dict:
+	"""
+	Returns representative arguments for a batch call of the given method on the given dates, as measured by `calibrate`, so that benchmarks can call every method with a vectorized kernel alike, such as `method(**calibration_arguments(method, dates))`.
+
+	Args:
+	    method (Callable): The method, such as `TemporalAdjuster.first_day_of_month`.
+	    dates (np.ndarray): The `np.datetime64[D]` dates of the batch. The methods adjusting the time of the day get them with a time of the day.
+
+	Returns:
+	    Dict: The arguments of the call, by parameter name.
+	"""
+
+def calibrate(
+	methods: Optional[Iterable[Callable]] = None, max_size: int = 256
+) -> Dict[str, int]:
+	"""
+	Measures, for each of the given methods, the smallest input for which the vectorized kernel is faster than adjusting the items one by one, and sets the thresholds accordingly. Call `save_thresholds` afterwards to keep them for the next processes on this host.
+
+	Args:
+	    methods (Optional[Iterable[Callable]]): The methods to calibrate. Defaults to every method of `TemporalAdjuster` with a vectorized kernel.
+	    max_size (int): The largest input to measure. Methods whose kernel is never faster get a threshold of twice this size.
+
+	Returns:
+	    Dict[str, int]: The measured thresholds, by method name.
+	"""
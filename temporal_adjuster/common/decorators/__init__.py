@@ -1 +1,2 @@
+from .bound_adjuster import AdjusterPlan, BoundAdjuster
 from .sequence_processor import sequenceable
@@ -0,0 +1,322 @@
+import inspect
+import sys
+from functools import partial
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..exceptions import DateError
+from ..profiling import phase_timer
+
+
+class AdjusterPlan(NamedTuple):
+	"""
+	The parts of an adjuster decorated with `sequenceable` that a `BoundAdjuster` calls directly.
+	"""
+
+	function: Callable
+	signature: inspect.Signature
+	target: str
+	normalize: Dict[str, Callable]
+	adjust_batch: Callable
+	adjust_scalar: Callable
+
+
+# Marks the dates that cannot be adjusted, such as the ones of months without a 5th Friday.
+_NO_DAY = np.iinfo(np.int64).min
+
+
+def _day_number(date) -> int:
+	"""
+	Returns the day number, counted from 1970-01-01, of the given date, `datetime` or `np.datetime64` value.
+	"""
+	return int(np.datetime64(date, 'D').astype(np.int64))
+
+
+def is_datetime_scalar(value) -> bool:
+	"""
+	Returns whether the given value is a single `np.datetime64` value, or a `pd.Timestamp` or `pd.NaT` if pandas has been imported, which are adjusted by the vectorized kernels instead of the function itself.
+	"""
+	if isinstance(value, np.datetime64):
+		return True
+
+	pandas = sys.modules.get('pandas')
+
+	return pandas is not None and (
+		isinstance(value, pandas.Timestamp) or value is pandas.NaT
+	)
+
+
+def _bind(adjuster: Callable, parameters: Dict[str, Any]) -> 'BoundAdjuster':
+	"""
+	Rebuilds a pickled `BoundAdjuster`.
+	"""
+	return adjuster.bind(**parameters)
+
+
+class BoundAdjuster:
+	"""
+	An adjuster with every argument but the date bound, such as `TemporalAdjuster.next.bind(Weekday.FRIDAY)`. The arguments are validated and normalized once, when the adjuster is bound, so that each call only computes the adjusted dates. Bound adjusters are callable on single dates and on batches, as the adjusters they come from, and are hashable, so that they can be used as rules in sets and as dictionary keys. Two bound adjusters are equal if they bind the same arguments of the same adjuster.
+
+	Examples:
+
+	```
+	>>> from datetime import date
+
+	>>> from temporal_adjuster import TemporalAdjuster
+	>>> from temporal_adjuster.common.enums import Weekday
+
+	>>> next_friday = TemporalAdjuster.next.bind(Weekday.FRIDAY)
+	>>> next_friday(date(2024, 6, 13))
+	datetime.date(2024, 6, 14)
+
+	```
+	"""
+
+	# The name of the parameter of `__call__` receiving the dates, which lets batch tools, such as the parallel executor, run bound adjusters.
+	target = 'date'
+
+	def __init__(
+		self,
+		adjuster: Callable,
+		plan: AdjusterPlan,
+		args: Sequence[Any],
+		kwargs: Dict[str, Any],
+	) -> None:
+		"""
+		Args:
+		    adjuster (Callable): The adjuster decorated with `sequenceable`.
+		    plan (AdjusterPlan): The parts of the adjuster.
+		    args (Sequence[Any]): The positional arguments to bind.
+		    kwargs (Dict[str, Any]): The keyword arguments to bind.
+
+		Raises:
+		    TypeError: If the arguments do not match the adjuster, the target argument is given, an argument is missing or an argument is a sequence.
+		"""
+		bound_args = plan.signature.bind_partial(*args, **kwargs)
+
+		if plan.target in bound_args.arguments:
+			raise TypeError(
+				f'The {plan.target} argument of {adjuster.__name__} cannot be bound, as it is given on each call.'
+			)
+
+		bound_args.apply_defaults()
+
+		parameters = {}
+
+		for name in plan.signature.parameters:
+			if name == plan.target:
+				continue
+
+			if name not in bound_args.arguments:
+				raise TypeError(
+					f'{adjuster.__name__} is missing the {name} argument to be bound.'
+				)
+
+			value = bound_args.arguments[name]
+
+			if name in plan.normalize:
+				value = plan.normalize[name](value)
+
+			if hasattr(value, '__iter__') and not isinstance(value, str):
+				raise TypeError(
+					f'The {name} argument of a bound adjuster must be a single value, but is {type(value).__name__}.'
+				)
+
+			parameters[name] = value
+
+		self.__adjuster = adjuster
+		self.__plan = plan
+		self.__parameters = parameters
+		self.__key: Tuple = (adjuster, tuple(parameters.items()))
+		self.__hash = hash(self.__key)
+
+		# The arguments before the date are bound positionally and the others by keyword, so that single dates are adjusted with a single positional argument.
+		names = list(plan.signature.parameters)
+		position = names.index(plan.target)
+
+		self.__scalar = partial(
+			plan.function,
+			*(parameters[name] for name in names[:position]),
+			**{name: parameters[name] for name in names[position + 1 :]},
+		)
+
+	@property
+	def adjuster(self) -> Callable:
+		"""
+		The adjuster whose arguments are bound.
+		"""
+		return self.__adjuster
+
+	@property
+	def parameters(self) -> Dict[str, Any]:
+		"""
+		The bound arguments, normalized, by parameter name.
+		"""
+		return dict(self.__parameters)
+
+	@property
+	def kernel(self) -> Optional[Callable]:
+		"""
+		The vectorized kernel of the adjuster, if it has one.
+		"""
+		return getattr(self.__adjuster, 'kernel', None)
+
+	def __call__(
+		self,
+		date,
+		*,
+		out: Optional[np.ndarray] = None,
+		backend: Optional[str] = None,
+		output: Optional[str] = None,
+		input: Optional[str] = None,
+	):
+		"""
+		Adjusts the given date, or batch of dates, with the bound arguments.
+
+		Args:
+		    date: The date, or sequence of dates, to adjust.
+		    out (Optional[np.ndarray]): An array of the same shape as the input to write the results into, for `np.ndarray` inputs.
+		    backend (Optional[str]): The name of the compute backend used for batch calls.
+		    output (Optional[str]): The type of the array of adjusted days returned by batch calls, 'ordinal', 'epoch_days' or 'datetime64', instead of a container of dates (see `sequenceable`).
+		    input (Optional[str]): The mode of the dates of batch calls given as integers, 'ordinal' or 'epoch_days', such as an `array.array` or a `memoryview` (see `sequenceable`).
+
+		Returns:
+		    The adjusted date, or sequence of dates.
+		"""
+		if date is None or not hasattr(date, '__iter__') or isinstance(date, str):
+			if out is not None:
+				raise TypeError('The out parameter is only supported for batch calls.')
+
+			if output is not None:
+				raise TypeError(
+					'The output parameter is only supported for batch calls.'
+				)
+
+			if input is not None:
+				raise TypeError(
+					'The input parameter is only supported for batch calls.'
+				)
+
+			if is_datetime_scalar(date):
+				arguments = dict(self.__parameters)
+				arguments[self.__plan.target] = date
+
+				return self.__plan.adjust_scalar(arguments)
+
+			return self.__scalar(date)
+
+		arguments = dict(self.__parameters)
+		arguments[self.__plan.target] = date
+
+		return self.__plan.adjust_batch(
+			arguments,
+			out,
+			backend,
+			phase_timer(self.__plan.function.__name__),
+			output,
+			input,
+		)
+
+	def __adjust_days(self, days: np.ndarray) -> np.ndarray:
+		"""
+		Adjusts the given day numbers with the vectorized kernel, marking the ones that cannot be adjusted with `_NO_DAY`.
+		"""
+		try:
+			return self.kernel(days, **self.__parameters)
+
+		except DateError:
+			adjusted = np.full(days.shape, _NO_DAY)
+
+			for index in range(days.size):
+				try:
+					adjusted[index] = self.kernel(
+						days[index : index + 1], **self.__parameters
+					)[0]
+
+				except DateError:
+					pass
+
+			return adjusted
+
+	def preimage(self, start, end=None) -> List[Tuple[Any, Any]]:
+		"""
+		Returns the intervals of dates that are adjusted to the given date, or to a date of the given range, such as the dates whose last Friday of the month falls in a given week. This lets filters on adjusted dates be turned into range scans on the dates themselves.
+
+		The intervals are computed from the calendar, without adjusting every date: each target date has a single candidate interval, such as the month before it for `first_day_of_next_month`, which is kept if the adjuster maps both of its bounds to a target. Adjacent intervals are merged, so the preimage of a range of targets is a single interval, unless some dates in between cannot be adjusted, as with `nth_of_month`.
+
+		Args:
+		    start: The target date, or the first target date of the range, as a `date`, `datetime` or `np.datetime64` value. Times of the day are ignored.
+		    end: The last target date of the range, included. Defaults to the start date.
+
+		Raises:
+		    NotImplementedError: If the adjuster has no preimage.
+
+		Returns:
+		    List[Tuple[Any, Any]]: The sorted, disjoint intervals of dates, as pairs of their first and last dates, included. The dates are `np.datetime64[D]` values if the start date is one, and `date` objects otherwise.
+		"""
+		preimage = getattr(self.__adjuster, 'preimage', None)
+
+		if preimage is None or self.kernel is None:
+			raise NotImplementedError(
+				f'{self.__adjuster.__name__} does not support preimage queries.'
+			)
+
+		first = _day_number(start)
+		last = _day_number(start if end is None else end)
+
+		if last < first:
+			return []
+
+		targets = np.arange(first, last + 1, dtype=np.int64)
+		lows, highs = preimage(targets, **self.__parameters)
+
+		# Most candidate intervals are shared by many targets, such as the month mapped to each day of the next month.
+		candidates = np.unique(
+			np.stack(np.broadcast_arrays(lows, highs), axis=-1), axis=0
+		)
+		adjusted = self.__adjust_days(candidates.reshape(-1)).reshape(candidates.shape)
+		valid = (
+			(adjusted[:, 0] == adjusted[:, 1])
+			& (adjusted[:, 0] >= first)
+			& (adjusted[:, 0] <= last)
+		)
+
+		intervals: List[List[int]] = []
+
+		for low, high in candidates[valid].tolist():
+			if intervals and low <= intervals[-1][1] + 1:
+				intervals[-1][1] = max(intervals[-1][1], high)
+
+			else:
+				intervals.append([low, high])
+
+		if isinstance(start, np.datetime64):
+			return [
+				(np.datetime64(low, 'D'), np.datetime64(high, 'D'))
+				for low, high in intervals
+			]
+
+		return [
+			(np.datetime64(low, 'D').item(), np.datetime64(high, 'D').item())
+			for low, high in intervals
+		]
+
+	def __eq__(self, other) -> bool:
+		if not isinstance(other, BoundAdjuster):
+			return NotImplemented
+
+		return self.__key == other.__key
+
+	def __hash__(self) -> int:
+		return self.__hash
+
+	def __repr__(self) -> str:
+		arguments = ', '.join(
+			f'{name}={value!r}' for name, value in self.__parameters.items()
+		)
+
+		return f'{self.__adjuster.__name__}.bind({arguments})'
+
+	def __reduce__(self):
+		return _bind, (self.__adjuster, self.__parameters)
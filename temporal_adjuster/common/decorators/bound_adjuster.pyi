@@ -0,0 +1,107 @@
+import inspect
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+class AdjusterPlan(NamedTuple):
+	"""
+	The parts of an adjuster decorated with `sequenceable` that a `BoundAdjuster` calls directly.
+	"""
+
+	function: Callable
+	signature: inspect.Signature
+	target: str
+	normalize: Dict[str, Callable]
+	adjust_batch: Callable
+	adjust_scalar: Callable
+
+def is_datetime_scalar(value) -> bool:
+	"""
+	Returns whether the given value is a single `np.datetime64` value, or a `pd.Timestamp` or `pd.NaT` if pandas has been imported, which are adjusted by the vectorized kernels instead of the function itself.
+	"""
+
+class BoundAdjuster:
+	"""
+	An adjuster with every argument but the date bound, such as `TemporalAdjuster.next.bind(Weekday.FRIDAY)`. The arguments are validated and normalized once, when the adjuster is bound, so that each call only computes the adjusted dates. Bound adjusters are callable on single dates and on batches, as the adjusters they come from, and are hashable, so that they can be used as rules in sets and as dictionary keys. Two bound adjusters are equal if they bind the same arguments of the same adjuster.
+	"""
+
+	target: str
+
+	def __init__(
+		self,
+		adjuster: Callable,
+		plan: AdjusterPlan,
+		args: Sequence[Any],
+		kwargs: Dict[str, Any],
+	) -> None:
+		"""
+		Args:
+		    adjuster (Callable): The adjuster decorated with `sequenceable`.
+		    plan (AdjusterPlan): The parts of the adjuster.
+		    args (Sequence[Any]): The positional arguments to bind.
+		    kwargs (Dict[str, Any]): The keyword arguments to bind.
+
+		Raises:
+		    TypeError: If the arguments do not match the adjuster, the target argument is given, an argument is missing or an argument is a sequence.
+		"""
+
+	@property
+	def adjuster(self) -> Callable:
+		"""
+		The adjuster whose arguments are bound.
+		"""
+
+	@property
+	def parameters(self) -> Dict[str, Any]:
+		"""
+		The bound arguments, normalized, by parameter name.
+		"""
+
+	@property
+	def kernel(self) -> Optional[Callable]:
+		"""
+		The vectorized kernel of the adjuster, if it has one.
+		"""
+
+	def __call__(
+		self,
+		date,
+		*,
+		out: Optional[np.ndarray] = None,
+		backend: Optional[str] = None,
+		output: Optional[str] = None,
+		input: Optional[str] = None,
+	):
+		"""
+		Adjusts the given date, or batch of dates, with the bound arguments.
+
+		Args:
+		    date: The date, or sequence of dates, to adjust.
+		    out (Optional[np.ndarray]): An array of the same shape as the input to write the results into, for `np.ndarray` inputs.
+		    backend (Optional[str]): The name of the compute backend used for batch calls.
+		    output (Optional[str]): The type of the array of adjusted days returned by batch calls, 'ordinal', 'epoch_days' or 'datetime64', instead of a container of dates (see `sequenceable`).
+		    input (Optional[str]): The mode of the dates of batch calls given as integers, 'ordinal' or 'epoch_days', such as an `array.array` or a `memoryview` (see `sequenceable`).
+
+		Returns:
+		    The adjusted date, or sequence of dates.
+		"""
+
+	def preimage(self, start, end=None) -> List[Tuple[Any, Any]]:
+		"""
+		Returns the intervals of dates that are adjusted to the given date, or to a date of the given range, such as the dates whose last Friday of the month falls in a given week. This lets filters on adjusted dates be turned into range scans on the dates themselves.
+
+		The intervals are computed from the calendar, without adjusting every date: each target date has a single candidate interval, such as the month before it for `first_day_of_next_month`, which is kept if the adjuster maps both of its bounds to a target. Adjacent intervals are merged, so the preimage of a range of targets is a single interval, unless some dates in between cannot be adjusted, as with `nth_of_month`.
+
+		Args:
+		    start: The target date, or the first target date of the range, as a `date`, `datetime` or `np.datetime64` value. Times of the day are ignored.
+		    end: The last target date of the range, included. Defaults to the start date.
+
+		Raises:
+		    NotImplementedError: If the adjuster has no preimage.
+
+		Returns:
+		    List[Tuple[Any, Any]]: The sorted, disjoint intervals of dates, as pairs of their first and last dates, included. The dates are `np.datetime64[D]` values if the start date is one, and `date` objects otherwise.
+		"""
+
+	def __eq__(self, other) -> bool: ...
+	def __hash__(self) -> int: ...
@@ -1,46 +1,843 @@
 import inspect
+from datetime import date as Date
 from functools import wraps
-from typing import Sequence, TypeVar, Union
+from types import MethodType
+from typing import Callable, Dict, Optional, Sequence, Tuple, TypeVar, Union
 
 import numpy as np
 
+from ..adapters import get_adapter
+from ..backends import get_backend, get_threshold
+from ..parallel import DEFAULT_CHUNK_SIZE, run_kernel
+from ..profiling import phase_timer
+from .bound_adjuster import AdjusterPlan, BoundAdjuster, is_datetime_scalar
+
 T = TypeVar('T')
 
+DAY_DTYPE = np.dtype('datetime64[D]')
+
+# Number of ticks of a day in the units of `np.datetime64` supported by the vectorized kernels.
+_TICKS_PER_DAY = {
+	'D': 1,
+	'h': 24,
+	'm': 24 * 60,
+	's': 24 * 60 * 60,
+	'ms': 24 * 60 * 60 * 10**3,
+	'us': 24 * 60 * 60 * 10**6,
+	'ns': 24 * 60 * 60 * 10**9,
+}
+
+# The ordinal of 1970-01-01, the first day of the day numbers of `np.datetime64[D]`.
+_EPOCH_ORDINAL = Date(1970, 1, 1).toordinal()
+
+# The values of `NaT` and of the latest date of the `np.datetime64` dtypes, in ticks of their unit.
+_NAT_TICKS = np.iinfo(np.int64).min
+_MAX_TICKS = np.iinfo(np.int64).max
+
+# Sorted inputs are split into lanes of this many items, whose runs of items adjusted to the same date are found side by side.
+SORTED_LANE_SIZE = 64
+
+# Sorted inputs are adjusted item by item when their runs of items adjusted to the same date hold fewer than this many items on average.
+MIN_RUN_LENGTH = 16
+
+
+def _as_python_objects(buffer: np.ndarray) -> np.ndarray:
+	"""
+	Returns the given buffer if it already holds Python objects, or an object array of `date` or `datetime` objects if it holds `np.datetime64` values. Units finer than microseconds are truncated to microseconds, as `datetime` does not support them.
+	"""
+	if buffer.dtype.kind != 'M':
+		return buffer
+
+	unit, _ = np.datetime_data(buffer.dtype)
+
+	if unit in ('ns', 'ps', 'fs', 'as'):
+		buffer = buffer.astype('datetime64[us]')
 
-def sequenceable(target: str):
+	return buffer.astype(object)
+
+
+def _as_days(values: np.ndarray) -> np.ndarray:
 	"""
-	This decorator is used to process if a sequence of values passed as an argument to a function. The function is called for each value in the sequence, and the result is stored in the same position in the sequence.
+	Returns the days of the given values, as an array of `np.datetime64[D]` values of the same shape. The time of the day of `np.datetime64` values is dropped, and `date` and `datetime` objects are converted through their ordinals, which is several times faster than casting them.
 	"""
+	if values.dtype.kind == 'M':
+		return values.astype(DAY_DTYPE, copy=False)
+
+	flat = values.reshape(-1)
+
+	try:
+		ordinals = np.fromiter(map(Date.toordinal, flat), np.int64, flat.size)
+
+	# Other values, such as None or strings, are left to NumPy.
+	except TypeError:
+		return values.astype(DAY_DTYPE)
+
+	return (ordinals - _EPOCH_ORDINAL).view(DAY_DTYPE).reshape(values.shape)
+
+
+def _days_from_integers(integers: np.ndarray, input: str) -> np.ndarray:
+	"""
+	Returns the days held by the given integers, read from the input of a batch call, as an array of `np.datetime64[D]` values. The `int64` epoch days are not copied, as they are already the values of `np.datetime64[D]`.
+	"""
+	if integers.dtype.kind not in 'iu':
+		raise TypeError(
+			f'The dates of the {input} input must be integers, such as an array.array or a memoryview cast to a format of integers, but are {integers.dtype}.'
+		)
+
+	# Buffers of raw bytes, such as a memoryview of `bytes`, have a format of single bytes, which would be read as one date per byte.
+	if integers.dtype.itemsize == 1:
+		raise TypeError(
+			f"The dates of the {input} input must be integers of more than one byte, but are {integers.dtype}, as in a buffer of raw bytes. Cast it to the format of its integers first, such as memoryview(buffer).cast('q') for int64 values."
+		)
+
+	if input == 'ordinal':
+		return (integers.astype(np.int64) - _EPOCH_ORDINAL).view(DAY_DTYPE)
+
+	return integers.astype(np.int64, copy=False).view(DAY_DTYPE)
+
+
+def _as_integers(values: np.ndarray, dtype: np.dtype) -> np.ndarray:
+	"""
+	Returns the given integers in the given integer dtype, such as the one of the input of a batch call.
+	"""
+	limits = np.iinfo(dtype)
+
+	if values.size and (values.min() < limits.min or values.max() > limits.max):
+		raise OverflowError(f'The adjusted dates are out of the range of {dtype}.')
+
+	return values.astype(dtype, copy=False)
+
+
+def _as_ordinals(days: np.ndarray) -> np.ndarray:
+	"""
+	Returns the proleptic Gregorian ordinals of the given `np.datetime64[D]` values, as returned by `date.toordinal`.
+	"""
+	if np.isnat(days).any():
+		raise ValueError('The adjusted dates hold NaT values, which have no ordinal.')
+
+	return _as_integers(days.view(np.int64) + _EPOCH_ORDINAL, np.dtype(np.int32))
+
+
+# Converters of the adjusted `np.datetime64[D]` values of a batch call to each output mode.
+_OUTPUTS: Dict[str, Callable[[np.ndarray], np.ndarray]] = {
+	'ordinal': _as_ordinals,
+	'epoch_days': lambda days: days.view(np.int64),
+	'datetime64': lambda days: days,
+}
+
+# The input modes of batch calls, whose dates are integers.
+_INPUTS = ('ordinal', 'epoch_days')
+
+
+def _is_sequence(value) -> bool:
+	"""
+	Returns whether the given argument value is a sequence to be processed in a batch.
+	"""
+	return (
+		value is not None and hasattr(value, '__iter__') and not isinstance(value, str)
+	)
+
+
+def _ticks_per_day(dtype: np.dtype) -> Optional[int]:
+	"""
+	Returns the number of ticks of a day in the given dtype, if it is a `np.datetime64` dtype whose unit divides a day, or None otherwise.
+	"""
+	if dtype.kind != 'M':
+		return None
+
+	unit, count = np.datetime_data(dtype)
+
+	if unit not in _TICKS_PER_DAY:
+		return None
+
+	ticks, remainder = divmod(_TICKS_PER_DAY[unit], count)
+
+	return ticks if remainder == 0 else None
+
+
+def _is_sorted(flat: np.ndarray) -> bool:
+	"""
+	Returns whether the given values are sorted, comparing them a chunk at a time, so that no array of the size of the input is allocated, and unsorted inputs are usually detected on their first chunk.
+	"""
+	for start in range(0, flat.size, DEFAULT_CHUNK_SIZE):
+		chunk = flat[start : start + DEFAULT_CHUNK_SIZE + 1]
+
+		if not (chunk[1:] >= chunk[:-1]).all():
+			return False
+
+	return True
+
+
+def _sorted_runs(
+	ticks: np.ndarray,
+	ticks_per_day: int,
+	adjust_days: Callable,
+	last_days: Callable,
+) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+	"""
+	Returns the positions of the first items of the runs of items adjusted to the same day number, and the adjusted day numbers of the runs, if the given values, in ticks, are sorted and hold few enough runs for finding them to be faster than adjusting every item, or None otherwise.
+
+	The given functions adjust day numbers, and return the last day number adjusted to each adjusted one, as the preimages do, so that each run is found by adjusting its first item and searching for the first item after its last day. The runs of each lane of `SORTED_LANE_SIZE` items are found side by side, so that the searches are vectorized.
+	"""
+	flat = ticks.reshape(-1)
+
+	if flat.size < 2 * SORTED_LANE_SIZE or flat[-1] < flat[0] or not _is_sorted(flat):
+		return None
+
+	positions = np.arange(0, flat.size, SORTED_LANE_SIZE)
+	lane_ends = np.minimum(positions + SORTED_LANE_SIZE, flat.size)
+	limit = _MAX_TICKS // ticks_per_day
+	found_positions, found_days = [], []
+	found = 0
+
+	while positions.size:
+		days = adjust_days(flat[positions] // ticks_per_day)
+		found_positions.append(positions)
+		found_days.append(days)
+		found += positions.size
+
+		if found * MIN_RUN_LENGTH > flat.size:
+			return None
+
+		# The items after the latest day whose ticks fit in `np.int64` are all on that day.
+		after = last_days(days) + 1
+		ends = np.where(
+			after > limit,
+			flat.size,
+			np.searchsorted(flat, np.minimum(after, limit) * ticks_per_day),
+		)
+
+		# The items from the start of each lane to the end of its first run are half of a run on average.
+		if (
+			len(found_positions) == 1
+			and np.mean(np.minimum(ends, lane_ends) - positions) * 2 < MIN_RUN_LENGTH
+		):
+			return None
+
+		following = ends < lane_ends
+		positions, lane_ends = ends[following], lane_ends[following]
+
+	positions = np.concatenate(found_positions)
+	days = np.concatenate(found_days)
+	order = np.argsort(positions, kind='stable')
+	positions, days = positions[order], days[order]
+
+	# The runs spanning several lanes are found once per lane.
+	starts = np.flatnonzero(np.append(True, days[1:] != days[:-1]))
+
+	return positions[starts], days[starts]
+
+
+def _fill_runs(
+	starts: np.ndarray,
+	days: np.ndarray,
+	ticks: np.ndarray,
+	ticks_per_day: int,
+	output: np.ndarray,
+	dtype: np.dtype,
+) -> None:
+	"""
+	Writes the day numbers of the given runs of items into the given output, in ticks, with the offsets of the given values into their day added back, a chunk at a time, so that no array of the size of the input is allocated.
+	"""
+	flat = ticks.reshape(-1)
+
+	for start in range(0, flat.size, DEFAULT_CHUNK_SIZE):
+		stop = min(start + DEFAULT_CHUNK_SIZE, flat.size)
+		first = np.searchsorted(starts, start, side='right') - 1
+		last = np.searchsorted(starts, stop, side='left')
+		bounds = np.append(np.maximum(starts[first:last], start), stop)
+		chunk_days = np.repeat(days[first:last], np.diff(bounds))
+
+		output[start:stop] = (
+			_join_days(
+				chunk_days, flat[start:stop] % ticks_per_day, ticks_per_day, dtype
+			)
+			if ticks_per_day > 1
+			else chunk_days
+		)
+
+
+def _normalize_timestamp(value):
+	"""
+	Returns the given `pd.Timestamp` with its wall time and UTC offset recomputed from the instant it holds, as a wall time replaced into a gap of a daylight saving time transition keeps the UTC offset it had before, such as 2024-03-31 02:30+01:00 in Berlin, which is 03:30+02:00.
+	"""
+	if value.tzinfo is None:
+		return value
+
+	return value.tz_convert(value.tz)
+
+
+def _join_days(
+	days: np.ndarray, offsets: np.ndarray, ticks_per_day: int, dtype: np.dtype
+) -> np.ndarray:
+	"""
+	Returns the values, in ticks, of the given adjusted day numbers with the given offsets into their day added back.
+	"""
+	limit = np.iinfo(np.int64).max // ticks_per_day - 1
+
+	if days.size and (days.min() < -limit or days.max() > limit):
+		raise OverflowError(f'The adjusted dates are out of the range of {dtype}.')
+
+	return days * ticks_per_day + offsets
+
+
+def _check_output(output: str, out, time_of_day: bool) -> None:
+	"""
+	Validates the `output` argument of a batch call.
+	"""
+	if output not in _OUTPUTS:
+		raise ValueError(
+			f'The output must be one of {", ".join(map(repr, _OUTPUTS))}, but is {output!r}.'
+		)
+
+	if out is not None:
+		raise TypeError('The out parameter is not supported with an output mode.')
+
+	if time_of_day:
+		raise TypeError(
+			'The output modes only hold days, and cannot hold the time of the day.'
+		)
+
+
+def _check_input(input: str, out, time_of_day: bool) -> None:
+	"""
+	Validates the `input` argument of a batch call.
+	"""
+	if input not in _INPUTS:
+		raise ValueError(
+			f'The input must be one of {", ".join(map(repr, _INPUTS))}, but is {input!r}.'
+		)
+
+	if out is not None:
+		raise TypeError('The out parameter is not supported with an input mode.')
+
+	if time_of_day:
+		raise TypeError(
+			'The input modes only hold days, and cannot hold the time of the day.'
+		)
+
+
+def _check_out(target_value, out) -> None:
+	"""
+	Validates the `out` argument of a batch call.
+	"""
+	if not isinstance(target_value, np.ndarray):
+		raise TypeError(
+			f'The out parameter is only supported for np.ndarray inputs, but the input is {type(target_value).__name__}.'
+		)
+
+	if not isinstance(out, np.ndarray):
+		raise TypeError(
+			f'The out parameter must be a np.ndarray, but is {type(out).__name__}.'
+		)
+
+	if out.shape != target_value.shape:
+		raise ValueError(
+			f'The out parameter must have the same shape as the input, {target_value.shape}, but has shape {out.shape}.'
+		)
+
+
+class _InstanceAdjuster:
+	"""
+	An adjuster defined as a method, got from an instance of its class, such as `FiscalCalendar().first_day_of_fiscal_year`. It is called as a bound method, and its `bind` method binds the instance along with the other arguments.
+	"""
+
+	__slots__ = ('__func__', '__self__')
+
+	def __init__(self, adjuster: Callable, instance) -> None:
+		self.__func__ = adjuster
+		self.__self__ = instance
+
+	def __call__(self, *args, **kwargs):
+		return self.__func__(self.__self__, *args, **kwargs)
+
+	def bind(self, *args, **kwargs) -> BoundAdjuster:
+		"""
+		Returns a reusable adjuster with the instance and the given arguments bound, which only takes the dates to adjust (see `BoundAdjuster`).
+		"""
+		return self.__func__.bind(self.__self__, *args, **kwargs)
+
+	@property
+	def __signature__(self) -> inspect.Signature:
+		return inspect.signature(MethodType(self.__func__, self.__self__))
+
+	def __getattr__(self, name: str):
+		# Attributes of the adjuster, such as its name and its kernel, are shared by its instances.
+		if name == '__wrapped__':
+			raise AttributeError(name)
+
+		return getattr(self.__func__, name)
+
+	def __eq__(self, other) -> bool:
+		if not isinstance(other, _InstanceAdjuster):
+			return NotImplemented
+
+		return self.__func__ is other.__func__ and self.__self__ == other.__self__
+
+	def __hash__(self) -> int:
+		return hash((self.__func__, self.__self__))
+
+	def __repr__(self) -> str:
+		return f'<adjuster {self.__func__.__qualname__} of {self.__self__!r}>'
+
+	def __reduce__(self):
+		return getattr, (self.__self__, self.__func__.__name__)
+
+
+class _AdjusterMethod:
+	"""
+	Holds an adjuster defined as a method in the dictionary of its class. The adjuster itself is returned when it is got from the class, and an `_InstanceAdjuster` when it is got from an instance, so that both `FiscalCalendar.first_day_of_fiscal_year.bind(calendar)` and `calendar.first_day_of_fiscal_year.bind()` work.
+	"""
+
+	def __init__(self, adjuster: Callable) -> None:
+		self.__adjuster = adjuster
+
+	def __get__(self, instance, owner=None):
+		if instance is None:
+			return self.__adjuster
+
+		return _InstanceAdjuster(self.__adjuster, instance)
+
+
+def sequenceable(
+	target: str,
+	normalize: Optional[Dict[str, Callable]] = None,
+	kernel: Optional[Callable] = None,
+	broadcast: Sequence[str] = (),
+	preimage: Optional[Callable] = None,
+	time_of_day: bool = False,
+):
+	"""
+	This decorator is used to process if a sequence of values passed as an argument to a function. The function is called for each value in the sequence, and the result is stored in the same position in the sequence. Arrays of any shape keep their shape, and the values of mappings, such as `dict`, are adjusted while their keys are kept. Arrays of `np.datetime64` values, in days or in units down to nanoseconds, are adjusted at once by the vectorized kernel of the function, if it has one: only their day is adjusted, and their time of the day is kept exactly. `NaT` values are kept as they are.
+
+	Single `np.datetime64` values and `pd.Timestamp` values are adjusted as in batch calls, and keep their type, unit and time zone: their day is adjusted as a `date`, and their time of the day, by the kernel of the functions adjusting it.
+
+	Batch calls on `np.ndarray` inputs also accept an `out` keyword argument, an array of the same shape as the input into which the results are written, as in NumPy ufuncs. The input itself may be passed as `out` to adjust it in place. When `out` is contiguous and has the dtype of the input, the vectorized kernels write each chunk of results straight into it, without allocating any array of the size of the input.
+
+	Batch calls also accept an `output` keyword argument, to get the adjusted days as a `np.ndarray` instead of a container of dates: 'ordinal' for `int32` proleptic Gregorian ordinals, as returned by `date.toordinal`, 'epoch_days' for `int64` day numbers counted from 1970-01-01, with `NaT` as the smallest `int64`, and 'datetime64' for `np.datetime64[D]` values. The dates are converted to days at once and adjusted by the vectorized kernel, without creating any `date` object, and their time of the day is dropped.
+
+	Batch calls also accept an `input` keyword argument, 'ordinal' or 'epoch_days', for dates given as integers in one of these modes, such as an `array.array`, a `memoryview` or any other object supporting the buffer protocol, which is read in place. Buffers of single bytes, such as a `memoryview` of `bytes`, must be cast to the format of their integers first, such as with `memoryview.cast('q')`. The adjusted days are then returned in the same mode and integer dtype, unless an `output` mode is also given.
+
+	Batch calls also accept a `backend` keyword argument, the name of the compute backend to use instead of the default one (see `temporal_adjuster.common.backends`). Without it, arrays smaller than the dispatch threshold of the function are adjusted one by one (see `calibrate`).
+
+	The decorated function also gets a `bind` method, which binds every argument but the target one, and returns a reusable `BoundAdjuster` that only takes the dates to adjust. Methods got from an instance of their class bind that instance as well, as in `FiscalCalendar().first_day_of_fiscal_year.bind()`.
+
+	Args:
+	    target (str): The name of the parameter that may receive a sequence.
+	    normalize (Optional[Dict[str, Callable]]): Parsers for other parameters, applied once per batch call instead of once per item.
+	    kernel (Optional[Callable]): The vectorized version of the function, which takes the day numbers of the dates (see `np.datetime64[D]`) followed by the other parameters as keyword arguments, and returns the adjusted day numbers.
+	    broadcast (Sequence[str]): The names of other parameters that, in batch calls, may also receive a sequence. Their values are broadcast against the target sequence, so that each item is adjusted with its own parameters.
+	    preimage (Optional[Callable]): The inverse of the function, which takes the day numbers of target dates followed by the other parameters as keyword arguments, and returns the first and last day numbers of the only interval of dates that may be adjusted to each target (see `BoundAdjuster.preimage`).
+	    time_of_day (bool): Whether the function adjusts the time of the day. Its kernel then takes the values of the dates in ticks of their unit, instead of their day numbers, and the number of ticks in a day as `ticks_per_day` keyword argument, and returns the adjusted values in ticks.
+	"""
+	normalize = normalize or {}
 
 	def decorator(func):
+		# Get the function signature
+		sig = inspect.signature(func)
+
+		def adjust_batch(
+			arguments: Dict, out, backend, timer, output=None, input=None
+		) -> Sequence[T]:
+			"""
+			Adjusts the batch held by the target argument, given the bound and normalized arguments of the call.
+			"""
+			target_value = arguments[target]
+
+			if output is not None:
+				_check_output(output, out, time_of_day)
+
+			if input is not None:
+				_check_input(input, out, time_of_day)
+
+			if out is not None:
+				_check_out(target_value, out)
+
+			# The dates of the input modes are integers, which are returned in the same mode and dtype unless another output mode is given.
+			result_dtype = None
+
+			if input is not None:
+				integers = np.asarray(target_value)
+				values = _days_from_integers(integers, input)
+
+				if output is None:
+					output, result_dtype = input, integers.dtype
+
+			else:
+				adapter = get_adapter(target_value)
+				values = adapter.view(target_value)
+
+			# The output modes only hold days, so the dates are converted to days at once and always adjusted by the kernel, instead of being adjusted as `date` objects.
+			if output is not None:
+				values = _as_days(values)
+
+			broadcast_values = {
+				name: np.broadcast_to(np.asarray(arguments[name]), values.shape)
+				for name in broadcast
+				if _is_sequence(arguments.get(name))
+			}
+
+			ticks_per_day = _ticks_per_day(values.dtype)
+
+			# Small inputs are adjusted one by one, unless a backend is requested, as the vectorized kernels cost more to set up than they save. Units finer than microseconds are always adjusted by the kernels, as `datetime` objects would truncate them.
+			compute = (
+				get_backend(backend).prepare(kernel)
+				if kernel is not None
+				and ticks_per_day is not None
+				and (
+					backend is not None
+					or output is not None
+					or ticks_per_day > _TICKS_PER_DAY['us']
+					or values.size >= get_threshold(func.__name__)
+				)
+				else None
+			)
+
+			# Backends adjusting items one by one, such as the python backend, would truncate them as well.
+			if (
+				compute is None
+				and kernel is not None
+				and ticks_per_day is not None
+				and ticks_per_day > _TICKS_PER_DAY['us']
+			):
+				compute = kernel
+
+			if compute is not None:
+				parameters = {
+					name: broadcast_values.get(name, value)
+					for name, value in arguments.items()
+					if name != target
+				}
+
+				# Values with a time of day are split into their day and the offset into that day, which is added back to the adjusted day, unless the kernel adjusts the time of day itself, in which case it takes the whole values, in ticks.
+				ticks = values.view(np.int64)
+				splits_days = not time_of_day and ticks_per_day > 1
+
+				if time_of_day:
+					parameters['ticks_per_day'] = ticks_per_day
+
+				# `NaT` is the smallest value, so finding one does not allocate an array of the size of the input, unlike `np.isnat`.
+				has_missing = bool(ticks.size) and ticks.min() == _NAT_TICKS
+
+				def adjust_ticks(chunk: np.ndarray, **chunk_parameters) -> np.ndarray:
+					"""
+					Adjusts the given chunk of the values, in ticks, so that the temporaries of the conversions only hold a chunk.
+					"""
+					if has_missing:
+						missing = chunk == _NAT_TICKS
+						chunk = np.where(missing, 0, chunk)
+
+					if splits_days:
+						days, offsets = np.divmod(chunk, ticks_per_day)
+						adjusted = _join_days(
+							compute(days, **chunk_parameters),
+							offsets,
+							ticks_per_day,
+							values.dtype,
+						)
+
+					else:
+						adjusted = compute(chunk, **chunk_parameters)
+
+					if has_missing:
+						adjusted = np.where(missing, _NAT_TICKS, adjusted)
+
+					return adjusted
+
+				# The results are written straight into `out` when it holds values of the input dtype, so that no array of the size of the input is allocated.
+				writes_out = (
+					out is not None
+					and out.dtype == values.dtype
+					and out.flags.c_contiguous
+				)
+				adjusted_ticks = (
+					out.view(np.int64).reshape(-1)
+					if writes_out
+					else np.empty(ticks.size, dtype=np.int64)
+				)
+
+				def adjust_days(days: np.ndarray) -> np.ndarray:
+					"""
+					Adjusts the given day numbers of a sorted input if the adjuster has a preimage, or returns them unchanged otherwise, so that the runs of the input span whole periods, such as the items of a month for `first_day_of_month`, or single days.
+					"""
+					if preimage is None:
+						return days
+
+					return run_kernel(compute, days, parameters)
+
+				def last_days(days: np.ndarray) -> np.ndarray:
+					"""
+					Returns the last day number adjusted to each of the given adjusted ones, from the preimage of the adjuster, if it has one.
+					"""
+					if preimage is None:
+						return days
+
+					return np.broadcast_to(preimage(days, **parameters)[1], days.shape)
+
+				# Time-ordered inputs, such as event logs, hold long runs of items adjusted to the same date, and only need a few items of each run to be adjusted.
+				runs = (
+					_sorted_runs(ticks, ticks_per_day, adjust_days, last_days)
+					if not time_of_day and not has_missing and not broadcast_values
+					else None
+				)
+
+				timer.lap('convert_in')
+
+				if runs is not None:
+					starts, run_days = runs
+
+					if preimage is None:
+						run_days = run_kernel(compute, run_days, parameters)
+
+					_fill_runs(
+						starts,
+						run_days,
+						ticks,
+						ticks_per_day,
+						adjusted_ticks,
+						values.dtype,
+					)
+
+				else:
+					run_kernel(
+						adjust_ticks,
+						ticks,
+						parameters,
+						broadcast_values,
+						output=adjusted_ticks,
+					)
+
+				buffer = adjusted_ticks.view(values.dtype).reshape(values.shape)
+
+				if out is not None and not writes_out:
+					out[...] = buffer
+
+				timer.lap('compute')
+
+			else:
+				if out is not None:
+					buffer = out
+
+				# The days of the output modes may be the input array itself.
+				elif output is not None:
+					buffer = values.copy()
+
+				elif adapter.shares_memory:
+					buffer = adapter.to_buffer(target_value)
+
+				else:
+					buffer = values
+
+				# Arrays of any shape are adjusted item by item in C order, through flat views of the input, the parameters and the output.
+				flat_values = values.reshape(-1)
+				flat_buffer = buffer if buffer.ndim == 1 else buffer.flat
+				items = _as_python_objects(flat_values)
+				broadcast_items = {
+					name: value.reshape(-1).tolist()
+					for name, value in broadcast_values.items()
+				}
+				# NaT values become None, and are kept as they are, as in the vectorized path.
+				keeps_missing = values.dtype.kind == 'M'
+
+				timer.lap('convert_in')
+
+				for index, item in enumerate(items):
+					if item is None and keeps_missing:
+						flat_buffer[index] = flat_values[index]
+						continue
+
+					arguments[target] = item
+
+					for name, value in broadcast_items.items():
+						arguments[name] = value[index]
+
+					flat_buffer[index] = func(**arguments)
+
+				timer.lap('compute')
+
+			if result_dtype is not None:
+				result = _as_integers(_OUTPUTS[output](buffer), result_dtype)
+
+			elif output is not None:
+				result = _OUTPUTS[output](buffer)
+
+			elif out is not None:
+				result = out
+
+			else:
+				result = adapter.from_buffer(buffer, target_value)
+
+			timer.lap('convert_out')
+			timer.commit()
+
+			return result
+
+		def adjust_datetime64(arguments: Dict, value: np.datetime64) -> np.datetime64:
+			"""
+			Adjusts the given `np.datetime64` value, given the bound and normalized arguments of the call, and returns a value of the same unit. The value is adjusted on Python integers, which cost less than NumPy scalars and cannot overflow.
+			"""
+			ticks = int(value.astype(np.int64))
+
+			if ticks == _NAT_TICKS:
+				return value
+
+			ticks_per_day = _ticks_per_day(value.dtype)
+
+			# Without a kernel, or in units coarser than a day, the value is adjusted as a `date` or `datetime` object, as the items of small arrays.
+			if kernel is None or ticks_per_day is None:
+				arguments[target] = _as_python_objects(np.array([value]))[0]
+
+				return np.array([func(**arguments)], dtype=value.dtype)[0]
+
+			parameters = {
+				name: argument for name, argument in arguments.items() if name != target
+			}
+
+			if time_of_day:
+				adjusted = int(kernel(ticks, ticks_per_day=ticks_per_day, **parameters))
+
+			else:
+				days, offset = divmod(ticks, ticks_per_day)
+
+				# The day is adjusted as a `date` by the function, which is faster than the kernel on a single value, unless it is out of the range of `date`.
+				try:
+					arguments[target] = Date.fromordinal(days + _EPOCH_ORDINAL)
+
+				except (ValueError, OverflowError):
+					adjusted_days = int(kernel(days, **parameters))
+
+				else:
+					adjusted_days = func(**arguments).toordinal() - _EPOCH_ORDINAL
+
+				adjusted = adjusted_days * ticks_per_day + offset
+
+			if not _NAT_TICKS < adjusted <= _MAX_TICKS:
+				raise OverflowError(
+					f'The adjusted date is out of the range of {value.dtype}.'
+				)
+
+			return np.int64(adjusted).view(value.dtype)
+
+		def adjust_scalar(arguments: Dict) -> T:
+			"""
+			Adjusts the single `np.datetime64` value or `pd.Timestamp` held by the target argument, given the bound and normalized arguments of the call, and returns a value of the same type. The day of timestamps is adjusted as a `date`, as the `relativedelta` arithmetic of the functions is several times slower on timestamps, and their time of the day by the kernel, which keeps their nanoseconds.
+			"""
+			value = arguments[target]
+
+			if isinstance(value, np.datetime64):
+				return adjust_datetime64(arguments, value)
+
+			import pandas as pd
+
+			if value is pd.NaT:
+				return value
+
+			if kernel is None:
+				return func(**arguments)
+
+			if not time_of_day:
+				day = Date(value.year, value.month, value.day)
+				arguments[target] = day
+				adjusted = func(**arguments)
+
+				if adjusted == day:
+					return value
+
+				return _normalize_timestamp(
+					value.replace(
+						year=adjusted.year, month=adjusted.month, day=adjusted.day
+					)
+				)
+
+			# Timestamps with a time zone are adjusted on their wall time, as `datetime` objects are, and get back their time zone with the adjusted fields.
+			wall = value if value.tzinfo is None else value.tz_localize(None)
+			adjusted = pd.Timestamp(adjust_datetime64(arguments, wall.to_datetime64()))
+
+			if value.tzinfo is None:
+				return adjusted
+
+			fields = {
+				'year': adjusted.year,
+				'month': adjusted.month,
+				'day': adjusted.day,
+				'hour': adjusted.hour,
+				'minute': adjusted.minute,
+				'second': adjusted.second,
+				'microsecond': adjusted.microsecond,
+			}
+
+			# Replacing the nanoseconds of a timestamp in a coarser unit would change its unit to nanoseconds.
+			if getattr(value, 'unit', 'ns') == 'ns':
+				fields['nanosecond'] = adjusted.nanosecond
+
+			return _normalize_timestamp(value.replace(**fields))
+
 		@wraps(func)
-		def wrapper(*args, **kwargs) -> Union[T, Sequence[T]]:
-			# Get the function signature
-			sig = inspect.signature(func)
+		def wrapper(
+			*args, out=None, backend=None, output=None, input=None, **kwargs
+		) -> Union[T, Sequence[T]]:
+			timer = phase_timer(func.__name__)
+
 			bound_args = sig.bind(*args, **kwargs)
 			bound_args.apply_defaults()
 
 			# Determine if the target parameter is in args or kwargs
 			target_value = bound_args.arguments.get(target)
+			is_batch = _is_sequence(target_value)
 
-			if (
-				target_value is not None
-				and hasattr(target_value, '__iter__')
-				and not isinstance(target_value, str)
-			):
-				convert_type = type(target_value)
-				target_value = np.asarray(list(target_value))
+			if not is_batch and out is not None:
+				raise TypeError('The out parameter is only supported for batch calls.')
 
-				for index, item in np.ndenumerate(target_value):
-					bound_args.arguments[target] = item
-					result = func(*bound_args.args, **bound_args.kwargs)
-					target_value[index[0]] = result
+			if not is_batch and output is not None:
+				raise TypeError(
+					'The output parameter is only supported for batch calls.'
+				)
 
-				return convert_type(target_value.tolist())
+			if not is_batch and input is not None:
+				raise TypeError(
+					'The input parameter is only supported for batch calls.'
+				)
 
-			else:
+			if not is_batch and not is_datetime_scalar(target_value):
 				return func(*args, **kwargs)
 
+			timer.lap('bind')
+
+			arguments = bound_args.arguments
+
+			for name, parser in normalize.items():
+				if name in arguments:
+					arguments[name] = parser(arguments[name])
+
+			timer.lap('normalize')
+
+			if not is_batch:
+				return adjust_scalar(arguments)
+
+			return adjust_batch(arguments, out, backend, timer, output, input)
+
+		def bind(*args, **kwargs) -> BoundAdjuster:
+			"""
+			Returns a reusable adjuster with the given arguments bound, which only takes the dates to adjust (see `BoundAdjuster`).
+			"""
+			return BoundAdjuster(
+				wrapper,
+				AdjusterPlan(func, sig, target, normalize, adjust_batch, adjust_scalar),
+				args,
+				kwargs,
+			)
+
+		# Lets batch tools, such as the parallel executor, find the batch parameter and the kernel.
+		wrapper.target = target
+		wrapper.kernel = kernel
+		wrapper.preimage = preimage
+		wrapper.time_of_day = time_of_day
+		wrapper.bind = bind
+
+		# Methods, such as the ones of `FiscalCalendar`, take their instance as first argument, which their `bind` method must also bind when they are got from an instance.
+		if next(iter(sig.parameters), None) == 'self':
+			return _AdjusterMethod(wrapper)
+
 		return wrapper
 
 	return decorator
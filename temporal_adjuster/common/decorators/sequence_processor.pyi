@@ -1,8 +1,35 @@
-from typing import TypeVar
+from typing import Callable, Dict, Optional, Sequence, TypeVar
 
 T = TypeVar('T')
 
-def sequenceable(target: str):
+def sequenceable(
+	target: str,
+	normalize: Optional[Dict[str, Callable]] = None,
+	kernel: Optional[Callable] = None,
+	broadcast: Sequence[str] = (),
+	preimage: Optional[Callable] = None,
+	time_of_day: bool = False,
+):
 	"""
-	This decorator is used to process if a sequence of values passed as an argument to a function. The function is called for each value in the sequence, and the result is stored in the same position in the sequence.
+	This decorator is used to process if a sequence of values passed as an argument to a function. The function is called for each value in the sequence, and the result is stored in the same position in the sequence. Arrays of any shape keep their shape, and the values of mappings, such as `dict`, are adjusted while their keys are kept. Arrays of `np.datetime64` values, in days or in units down to nanoseconds, are adjusted at once by the vectorized kernel of the function, if it has one: only their day is adjusted, and their time of the day is kept exactly. `NaT` values are kept as they are.
+
+	Single `np.datetime64` values and `pd.Timestamp` values are adjusted as in batch calls, and keep their type, unit and time zone: their day is adjusted as a `date`, and their time of the day, by the kernel of the functions adjusting it.
+
+	Batch calls on `np.ndarray` inputs also accept an `out` keyword argument, an array of the same shape as the input into which the results are written, as in NumPy ufuncs. The input itself may be passed as `out` to adjust it in place. When `out` is contiguous and has the dtype of the input, the vectorized kernels write each chunk of results straight into it, without allocating any array of the size of the input.
+
+	Batch calls also accept an `output` keyword argument, to get the adjusted days as a `np.ndarray` instead of a container of dates: 'ordinal' for `int32` proleptic Gregorian ordinals, as returned by `date.toordinal`, 'epoch_days' for `int64` day numbers counted from 1970-01-01, with `NaT` as the smallest `int64`, and 'datetime64' for `np.datetime64[D]` values. The dates are converted to days at once and adjusted by the vectorized kernel, without creating any `date` object, and their time of the day is dropped.
+
+	Batch calls also accept an `input` keyword argument, 'ordinal' or 'epoch_days', for dates given as integers in one of these modes, such as an `array.array`, a `memoryview` or any other object supporting the buffer protocol, which is read in place. Buffers of single bytes, such as a `memoryview` of `bytes`, must be cast to the format of their integers first, such as with `memoryview.cast('q')`. The adjusted days are then returned in the same mode and integer dtype, unless an `output` mode is also given.
+
+	Batch calls also accept a `backend` keyword argument, the name of the compute backend to use instead of the default one (see `temporal_adjuster.common.backends`). Without it, arrays smaller than the dispatch threshold of the function are adjusted one by one (see `calibrate`).
+
+	The decorated function also gets a `bind` method, which binds every argument but the target one, and returns a reusable `BoundAdjuster` that only takes the dates to adjust. Methods got from an instance of their class bind that instance as well, as in `FiscalCalendar().first_day_of_fiscal_year.bind()`.
+
+	Args:
+	    target (str): The name of the parameter that may receive a sequence.
+	    normalize (Optional[Dict[str, Callable]]): Parsers for other parameters, applied once per batch call instead of once per item.
+	    kernel (Optional[Callable]): The vectorized version of the function, which takes the day numbers of the dates (see `np.datetime64[D]`) followed by the other parameters as keyword arguments, and returns the adjusted day numbers.
+	    broadcast (Sequence[str]): The names of other parameters that, in batch calls, may also receive a sequence. Their values are broadcast against the target sequence, so that each item is adjusted with its own parameters.
+	    preimage (Optional[Callable]): The inverse of the function, which takes the day numbers of target dates followed by the other parameters as keyword arguments, and returns the first and last day numbers of the only interval of dates that may be adjusted to each target (see `BoundAdjuster.preimage`).
+	    time_of_day (bool): Whether the function adjusts the time of the day. Its kernel then takes the values of the dates in ticks of their unit, instead of their day numbers, and the number of ticks in a day as `ticks_per_day` keyword argument, and returns the adjusted values in ticks.
 	"""
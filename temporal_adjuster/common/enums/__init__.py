@@ -1 +1,7 @@
-from .day_of_week import ISOWeekday, Weekday
+from .day_of_week import ISOWeekday, Weekday, normalize_weekday, normalize_weekdays
+from .week_start import (
+	get_week_start,
+	normalize_week_start,
+	set_week_start,
+	week_starting_on,
+)
@@ -1,4 +1,7 @@
 from enum import IntEnum
+from typing import Iterable, Union
+
+import numpy as np
 
 
 class Weekday(IntEnum):
@@ -33,3 +36,67 @@ class ISOWeekday(IntEnum):
 	FRIDAY = 5
 	SATURDAY = 6
 	SUNDAY = 7
+
+
+def normalize_weekday(
+	weekday: Union[Weekday, ISOWeekday, str, int, Iterable],
+) -> Union[Weekday, np.ndarray]:
+	"""
+	Parses the given weekday to the Pythonic format. Sequences of weekdays are parsed into an array of Pythonic weekday values.
+
+	Args:
+	    weekday (Union[Weekday, ISOWeekday, str, int, Iterable]): The weekday, or sequence of weekdays, to parse.
+
+	Returns:
+	    Union[Weekday, np.ndarray]: The parsed weekday, or an `np.int64` array of the parsed weekdays.
+	"""
+	if type(weekday) == Weekday:
+		return weekday
+
+	elif type(weekday) == str:
+		return Weekday[weekday.upper()]
+
+	elif isinstance(weekday, (int, np.integer)) and not isinstance(weekday, ISOWeekday):
+		return Weekday(int(weekday))
+
+	elif isinstance(weekday, ISOWeekday):
+		return Weekday[weekday.name]
+
+	else:
+		return normalize_weekdays(weekday)
+
+
+def normalize_weekdays(weekdays: Iterable) -> np.ndarray:
+	"""
+	Parses the given sequence of weekdays to an array of Pythonic weekday values. Integer arrays are validated without iterating over them, and other sequences are parsed once per distinct weekday.
+
+	Args:
+	    weekdays (Iterable): The weekdays to parse, as `Weekday`, `ISOWeekday`, `str` or `int` values.
+
+	Raises:
+	    ValueError: If an integer weekday is not between 0 and 6.
+
+	Returns:
+	    np.ndarray: An `np.int64` array of the parsed weekdays.
+	"""
+	if np.dtype(getattr(weekdays, 'dtype', object)).kind in 'iu':
+		values = np.asarray(weekdays, dtype=np.int64)
+		invalid = (values < 0) | (values > 6)
+
+		if invalid.any():
+			raise ValueError(f'{values[invalid][0]} is not a valid Weekday')
+
+		return values
+
+	# IntEnum members of Weekday and ISOWeekday hash like their int values, so the type is part of the key.
+	parsed = {}
+
+	def parse(weekday) -> int:
+		key = (type(weekday), weekday)
+
+		if key not in parsed:
+			parsed[key] = normalize_weekday(weekday).value
+
+		return parsed[key]
+
+	return np.array([parse(weekday) for weekday in weekdays], dtype=np.int64)
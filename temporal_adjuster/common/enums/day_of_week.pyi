@@ -1,4 +1,7 @@
 from enum import IntEnum
+from typing import Iterable
+
+import numpy as np
 
 class Weekday(IntEnum):
 	"""
@@ -31,3 +34,30 @@ class ISOWeekday(IntEnum):
 	FRIDAY: int
 	SATURDAY: int
 	SUNDAY: int
+
+def normalize_weekday(
+	weekday: Weekday | ISOWeekday | str | int | Iterable,
+) -> Weekday | np.ndarray:
+	"""
+	Parses the given weekday to the Pythonic format. Sequences of weekdays are parsed into an array of Pythonic weekday values.
+
+	Args:
+	    weekday (Union[Weekday, ISOWeekday, str, int, Iterable]): The weekday, or sequence of weekdays, to parse.
+
+	Returns:
+	    Union[Weekday, np.ndarray]: The parsed weekday, or an `np.int64` array of the parsed weekdays.
+	"""
+
+def normalize_weekdays(weekdays: Iterable) -> np.ndarray:
+	"""
+	Parses the given sequence of weekdays to an array of Pythonic weekday values. Integer arrays are validated without iterating over them, and other sequences are parsed once per distinct weekday.
+
+	Args:
+	    weekdays (Iterable): The weekdays to parse, as `Weekday`, `ISOWeekday`, `str` or `int` values.
+
+	Raises:
+	    ValueError: If an integer weekday is not between 0 and 6.
+
+	Returns:
+	    np.ndarray: An `np.int64` array of the parsed weekdays.
+	"""
@@ -0,0 +1,64 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional, Union
+
+from .day_of_week import ISOWeekday, Weekday, normalize_weekday
+
+_default_week_start = Weekday.MONDAY
+_active_week_start = ContextVar('temporal_adjuster_week_start', default=None)
+
+
+def get_week_start() -> Weekday:
+	"""
+	Returns the first day of the weeks used by the week adjusters when no week start is given: the one of the current context (see `week_starting_on`), or the process-wide one otherwise (see `set_week_start`). Defaults to Monday.
+
+	Returns:
+	    Weekday: The first day of the weeks.
+	"""
+	week_start = _active_week_start.get()
+
+	return _default_week_start if week_start is None else week_start
+
+
+def set_week_start(weekday: Union[Weekday, ISOWeekday, str, int]) -> None:
+	"""
+	Sets, for the whole process, the first day of the weeks used by the week adjusters when no week start is given, such as Sunday in the United States. Bound adjusters (see `BoundAdjuster`) keep the week start they were bound with.
+
+	Args:
+	    weekday (Union[Weekday, ISOWeekday, str, int]): The first day of the weeks.
+	"""
+	global _default_week_start
+
+	_default_week_start = normalize_weekday(weekday)
+
+
+@contextmanager
+def week_starting_on(weekday: Union[Weekday, ISOWeekday, str, int]) -> Iterator[None]:
+	"""
+	Sets the first day of the weeks used by the week adjusters called in the current context when no week start is given, overriding the process-wide setting (see `set_week_start`).
+
+	Args:
+	    weekday (Union[Weekday, ISOWeekday, str, int]): The first day of the weeks.
+	"""
+	token = _active_week_start.set(normalize_weekday(weekday))
+
+	try:
+		yield
+
+	finally:
+		_active_week_start.reset(token)
+
+
+def normalize_week_start(
+	week_start: Optional[Union[Weekday, ISOWeekday, str, int]],
+) -> Weekday:
+	"""
+	Parses the given first day of the weeks to the Pythonic format, or returns the current one (see `get_week_start`) if it is None.
+
+	Args:
+	    week_start (Optional[Union[Weekday, ISOWeekday, str, int]]): The first day of the weeks.
+
+	Returns:
+	    Weekday: The parsed first day of the weeks.
+	"""
+	return get_week_start() if week_start is None else normalize_weekday(week_start)
@@ -0,0 +1,8 @@
+from .shared_memory_executor import SharedMemoryExecutor
+from .thread_pool import (
+	DEFAULT_CHUNK_SIZE,
+	ThreadOptions,
+	run_kernel,
+	set_threads,
+	threads,
+)
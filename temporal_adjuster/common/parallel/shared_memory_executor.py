@@ -0,0 +1,273 @@
+import inspect
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from os import cpu_count
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from ..backends import get_backend
+
+
+class _SharedArray(NamedTuple):
+	"""
+	The description of an array placed in shared memory, which is sent to the workers instead of its data.
+	"""
+
+	name: str
+	shape: Tuple[int, ...]
+	dtype: str
+
+
+def _attach(
+	shared_array: _SharedArray,
+) -> Tuple[shared_memory.SharedMemory, np.ndarray]:
+	"""
+	Attaches to the shared memory block of the given array. The block is owned by the calling process, which unlinks it after the call.
+	"""
+	block = shared_memory.SharedMemory(name=shared_array.name)
+
+	return block, np.ndarray(
+		shared_array.shape, dtype=np.dtype(shared_array.dtype), buffer=block.buf
+	)
+
+
+def _run_slice(
+	method: Callable,
+	arguments: Dict[str, Any],
+	shared: Dict[str, _SharedArray],
+	out: _SharedArray,
+	start: int,
+	stop: int,
+	backend: str,
+) -> None:
+	"""
+	Runs the given method on a slice of the shared arrays, writing its results into the same slice of the shared output array. This is the task of every worker.
+	"""
+	blocks = []
+
+	try:
+		for name, shared_array in shared.items():
+			block, array = _attach(shared_array)
+			blocks.append(block)
+			arguments[name] = array[start:stop]
+
+		block, output = _attach(out)
+		blocks.append(block)
+
+		method(**arguments, out=output[start:stop], backend=backend)
+
+	finally:
+		# Views of the blocks must be released before they are closed.
+		arguments.clear()
+		output = None
+
+		for block in blocks:
+			block.close()
+
+
+class SharedMemoryExecutor:
+	"""
+	Runs batch calls of the adjusters on large `np.ndarray` inputs in a pool of processes. The input and the per-item parameters are copied once into `multiprocessing.shared_memory` blocks, and each worker writes the results of its own slice into a shared output block, so that only the names of the blocks and the slice bounds are sent to the workers, instead of pickled arrays. The results are then copied from the output block into `out`, or into a new array, as the blocks are released when the call returns.
+
+	Examples:
+
+	```
+	>>> import numpy as np
+
+	>>> from temporal_adjuster import TemporalAdjuster
+	>>> from temporal_adjuster.common.enums import Weekday
+	>>> from temporal_adjuster.common.parallel import SharedMemoryExecutor
+
+	>>> dates = np.arange('2000-01-01', '2100-01-01', dtype='datetime64[D]')
+
+	>>> with SharedMemoryExecutor(max_workers=4) as executor:
+	...     fridays = executor.run(TemporalAdjuster.last_of_month, Weekday.FRIDAY, dates)
+	```
+	"""
+
+	def __init__(
+		self,
+		max_workers: Optional[int] = None,
+		min_chunk_size: int = 1_000_000,
+		mp_context=None,
+	) -> None:
+		"""
+		Args:
+		    max_workers (Optional[int]): The number of worker processes. Defaults to the number of CPUs.
+		    min_chunk_size (int): The minimum number of items processed by each worker. Inputs with less than two chunks are adjusted in the calling process.
+		    mp_context: The multiprocessing context used to start the workers.
+		"""
+		self.max_workers = max_workers or cpu_count() or 1
+		self.min_chunk_size = max(1, min_chunk_size)
+		self.__mp_context = mp_context
+		self.__pool: Optional[ProcessPoolExecutor] = None
+
+	def __enter__(self) -> 'SharedMemoryExecutor':
+		return self
+
+	def __exit__(self, *_) -> None:
+		self.shutdown()
+
+	def shutdown(self) -> None:
+		"""
+		Stops the worker processes.
+		"""
+		if self.__pool is not None:
+			self.__pool.shutdown()
+			self.__pool = None
+
+	def __get_pool(self) -> ProcessPoolExecutor:
+		"""
+		Returns the pool of worker processes, starting it on first use.
+		"""
+		if self.__pool is None:
+			self.__pool = ProcessPoolExecutor(
+				max_workers=self.max_workers, mp_context=self.__mp_context
+			)
+
+		return self.__pool
+
+	def run(
+		self,
+		method: Callable,
+		*args,
+		out: Optional[np.ndarray] = None,
+		backend: Optional[str] = None,
+		**kwargs,
+	) -> np.ndarray:
+		"""
+		Runs a batch call of the given adjuster on the worker processes. The arguments are the same as for a direct call, and the batch argument must be a `np.ndarray`. Arguments with one value per item, such as a sequence of weekdays, must have the shape of the batch argument, and are split among the workers along with it.
+
+		Args:
+		    method (Callable): The adjuster to run, such as `TemporalAdjuster.next`.
+		    out (Optional[np.ndarray]): An array of the same shape as the input to write the results into.
+		    backend (Optional[str]): The name of the compute backend used by the workers. Defaults to the default backend of the calling process.
+
+		Raises:
+		    TypeError: If the method is not an adjuster, or its batch argument is not a `np.ndarray` of dates with a fixed size dtype.
+		    ValueError: If an argument with one value per item does not have the shape of the batch argument.
+
+		Returns:
+		    np.ndarray: The adjusted dates, with the dtype of the input.
+		"""
+		target = getattr(method, 'target', None)
+
+		if target is None:
+			raise TypeError(
+				f'{getattr(method, "__name__", method)} does not support batch calls.'
+			)
+
+		arguments = inspect.signature(method).bind(*args, **kwargs).arguments
+		target_value = arguments.get(target)
+
+		if (
+			not isinstance(target_value, np.ndarray)
+			or target_value.ndim == 0
+			or target_value.dtype.hasobject
+		):
+			raise TypeError(
+				f'The {target} argument of a parallel call must be a np.ndarray of np.datetime64 values.'
+			)
+
+		# Arguments of another shape would be given whole to each worker, instead of being split along with the batch argument.
+		for name, value in arguments.items():
+			if name == target or isinstance(value, str) or np.ndim(value) == 0:
+				continue
+
+			if np.shape(value) != target_value.shape:
+				raise ValueError(
+					f'The {name} argument of a parallel call must have the shape of the {target} argument, {target_value.shape}, but has shape {np.shape(value)}.'
+				)
+
+		bounds = self.__chunk_bounds(target_value.shape[0])
+
+		# The workers may not share the settings of this process, so the backend is always given.
+		backend = get_backend(backend).name
+
+		if len(bounds) < 2:
+			return method(**arguments, out=out, backend=backend)
+
+		blocks: Dict[str, shared_memory.SharedMemory] = {}
+
+		def allocate(shape: Tuple[int, ...], dtype: np.dtype) -> _SharedArray:
+			block = shared_memory.SharedMemory(
+				create=True, size=max(1, int(np.prod(shape)) * dtype.itemsize)
+			)
+			blocks[block.name] = block
+
+			return _SharedArray(block.name, shape, dtype.str)
+
+		def view(shared_array: _SharedArray) -> np.ndarray:
+			return np.ndarray(
+				shared_array.shape,
+				dtype=np.dtype(shared_array.dtype),
+				buffer=blocks[shared_array.name].buf,
+			)
+
+		try:
+			# Arguments with one value per item are split among the workers, through shared memory when possible.
+			shared: Dict[str, _SharedArray] = {}
+			sliced: Dict[str, Any] = {}
+
+			for name, value in arguments.items():
+				if isinstance(value, str) or np.ndim(value) == 0:
+					continue
+
+				if isinstance(value, np.ndarray):
+					if value.dtype.hasobject:
+						sliced[name] = value
+
+					else:
+						shared[name] = allocate(value.shape, value.dtype)
+						view(shared[name])[...] = value
+
+				else:
+					# Python objects cannot be shared, so they are sent with each slice instead.
+					sliced[name] = value
+
+			shared_out = allocate(target_value.shape, target_value.dtype)
+
+			pool = self.__get_pool()
+			futures = [
+				pool.submit(
+					_run_slice,
+					method,
+					{
+						name: sliced[name][start:stop] if name in sliced else value
+						for name, value in arguments.items()
+						if name not in shared
+					},
+					shared,
+					shared_out,
+					start,
+					stop,
+					backend,
+				)
+				for start, stop in bounds
+			]
+
+			for future in futures:
+				future.result()
+
+			if out is None:
+				out = view(shared_out).copy()
+
+			else:
+				out[...] = view(shared_out)
+
+			return out
+
+		finally:
+			for block in blocks.values():
+				block.close()
+				block.unlink()
+
+	def __chunk_bounds(self, size: int) -> List[Tuple[int, int]]:
+		"""
+		Splits the given number of items into at most one contiguous chunk per worker, each of at least the minimum chunk size.
+		"""
+		chunks = max(1, min(self.max_workers, size // self.min_chunk_size))
+		edges = np.linspace(0, size, chunks + 1).astype(int)
+
+		return list(zip(edges[:-1].tolist(), edges[1:].tolist()))
@@ -0,0 +1,55 @@
+from typing import Callable, Optional
+
+import numpy as np
+
+class SharedMemoryExecutor:
+	"""
+	Runs batch calls of the adjusters on large `np.ndarray` inputs in a pool of processes. The input and the per-item parameters are copied once into `multiprocessing.shared_memory` blocks, and each worker writes the results of its own slice into a shared output block, so that only the names of the blocks and the slice bounds are sent to the workers, instead of pickled arrays. The results are then copied from the output block into `out`, or into a new array, as the blocks are released when the call returns.
+	"""
+
+	max_workers: int
+	min_chunk_size: int
+
+	def __init__(
+		self,
+		max_workers: Optional[int] = None,
+		min_chunk_size: int = 1_000_000,
+		mp_context=None,
+	) -> None:
+		"""
+		Args:
+		    max_workers (Optional[int]): The number of worker processes. Defaults to the number of CPUs.
+		    min_chunk_size (int): The minimum number of items processed by each worker. Inputs with less than two chunks are adjusted in the calling process.
+		    mp_context: The multiprocessing context used to start the workers.
+		"""
+
+	def __enter__(self) -> 'SharedMemoryExecutor': ...
+	def __exit__(self, *_) -> None: ...
+	def shutdown(self) -> None:
+		"""
+		Stops the worker processes.
+		"""
+
+	def run(
+		self,
+		method: Callable,
+		*args,
+		out: Optional[np.ndarray] = None,
+		backend: Optional[str] = None,
+		**kwargs,
+	) -> np.ndarray:
+		"""
+		Runs a batch call of the given adjuster on the worker processes. The arguments are the same as for a direct call, and the batch argument must be a `np.ndarray`. Arguments with one value per item, such as a sequence of weekdays, must have the shape of the batch argument, and are split among the workers along with it.
+
+		Args:
+		    method (Callable): The adjuster to run, such as `TemporalAdjuster.next`.
+		    out (Optional[np.ndarray]): An array of the same shape as the input to write the results into.
+		    backend (Optional[str]): The name of the compute backend used by the workers. Defaults to the default backend of the calling process.
+
+		Raises:
+		    TypeError: If the method is not an adjuster, or its batch argument is not a `np.ndarray` of dates with a fixed size dtype.
+		    ValueError: If an argument with one value per item does not have the shape of the batch argument.
+
+		Returns:
+		    np.ndarray: The adjusted dates, with the dtype of the input.
+		"""
@@ -0,0 +1,184 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from os import cpu_count
+from threading import Lock
+from typing import Callable, Collection, Dict, Iterator, NamedTuple, Optional
+
+import numpy as np
+
+# Number of items of each chunk, small enough for the kernel temporaries of a chunk to stay in the CPU cache.
+DEFAULT_CHUNK_SIZE = 1 << 15
+
+
+class ThreadOptions(NamedTuple):
+	"""
+	The options of the multi-threaded execution of the vectorized kernels.
+	"""
+
+	max_workers: int
+	chunk_size: int
+
+
+_default_options: Optional[ThreadOptions] = None
+_active_options = ContextVar('temporal_adjuster_thread_options', default=None)
+
+_pools: Dict[int, ThreadPoolExecutor] = {}
+_pools_lock = Lock()
+
+
+def _make_options(max_workers: Optional[int], chunk_size: int) -> ThreadOptions:
+	if chunk_size < 1:
+		raise ValueError(f'The chunk size must be positive, but is {chunk_size}.')
+
+	return ThreadOptions(max_workers or cpu_count() or 1, chunk_size)
+
+
+def set_threads(
+	max_workers: Optional[int] = None,
+	chunk_size: int = DEFAULT_CHUNK_SIZE,
+	enabled: bool = True,
+) -> None:
+	"""
+	Enables or disables, for the whole process, the multi-threaded execution of the vectorized kernels. Large arrays are split into chunks, which are adjusted in parallel by a pool of threads, as NumPy releases the GIL while computing.
+
+	Args:
+	    max_workers (Optional[int]): The number of threads. Defaults to the number of CPUs.
+	    chunk_size (int): The number of items adjusted by each task.
+	    enabled (bool): Whether to enable multi-threading.
+
+	Raises:
+	    ValueError: If the chunk size is not positive.
+	"""
+	global _default_options
+
+	_default_options = _make_options(max_workers, chunk_size) if enabled else None
+
+
+@contextmanager
+def threads(
+	max_workers: Optional[int] = None,
+	chunk_size: int = DEFAULT_CHUNK_SIZE,
+	enabled: bool = True,
+) -> Iterator[None]:
+	"""
+	Enables or disables the multi-threaded execution of the vectorized kernels for the batch calls made in the current context, overriding the process-wide setting (see `set_threads`).
+
+	Args:
+	    max_workers (Optional[int]): The number of threads. Defaults to the number of CPUs.
+	    chunk_size (int): The number of items adjusted by each task.
+	    enabled (bool): Whether to enable multi-threading.
+
+	Raises:
+	    ValueError: If the chunk size is not positive.
+	"""
+	token = _active_options.set(
+		_make_options(max_workers, chunk_size) if enabled else ThreadOptions(1, 1)
+	)
+
+	try:
+		yield
+
+	finally:
+		_active_options.reset(token)
+
+
+def _disable_nested_threads() -> None:
+	"""
+	Keeps the batch calls made by kernels, such as the ones building the fiscal calendar tables, from waiting on the pool they run in.
+	"""
+	_active_options.set(ThreadOptions(1, 1))
+
+
+def _get_pool(max_workers: int) -> ThreadPoolExecutor:
+	"""
+	Returns the shared pool of the given number of threads, starting it on first use.
+	"""
+	with _pools_lock:
+		pool = _pools.get(max_workers)
+
+		if pool is None:
+			pool = _pools[max_workers] = ThreadPoolExecutor(
+				max_workers=max_workers,
+				thread_name_prefix='temporal_adjuster',
+				initializer=_disable_nested_threads,
+			)
+
+		return pool
+
+
+def run_kernel(
+	kernel: Callable,
+	days: np.ndarray,
+	parameters: Dict,
+	chunked: Collection[str] = (),
+	output: Optional[np.ndarray] = None,
+) -> np.ndarray:
+	"""
+	Runs the given vectorized kernel on the given day numbers. Arrays spanning at least two chunks are adjusted in chunks, on a pool of threads if multi-threading is enabled, or one after the other otherwise, which bounds the memory used by the temporaries of the kernel.
+
+	Args:
+	    kernel (Callable): The vectorized kernel.
+	    days (np.ndarray): The day numbers to adjust.
+	    parameters (Dict): The other arguments of the kernel.
+	    chunked (Collection[str]): The names of the parameters that are arrays of the same shape as the day numbers, which are split along with them.
+	    output (Optional[np.ndarray]): A flat `int64` array of the size of the day numbers, into which each chunk writes its results, such as a view of the `out` argument of a batch call. It may be the day numbers themselves.
+
+	Returns:
+	    np.ndarray: The adjusted day numbers, which are held by the output array if one is given.
+	"""
+	options = _active_options.get() or _default_options
+	threaded = options is not None and options.max_workers > 1
+	chunk_size = options.chunk_size if threaded else DEFAULT_CHUNK_SIZE
+
+	if days.size < 2 * chunk_size:
+		if output is None:
+			return kernel(days, **parameters)
+
+		output[...] = kernel(days, **parameters).reshape(-1)
+
+		return output.reshape(days.shape)
+
+	flat_days = days.reshape(-1)
+	flat_parameters = {
+		name: value.reshape(-1) if name in chunked else value
+		for name, value in parameters.items()
+	}
+
+	if output is None:
+		output = np.empty(flat_days.size, dtype=np.int64)
+
+	def adjust_chunk(start: int, stop: int) -> None:
+		output[start:stop] = kernel(
+			flat_days[start:stop],
+			**{
+				name: value[start:stop] if name in chunked else value
+				for name, value in flat_parameters.items()
+			},
+		)
+
+	starts = range(0, flat_days.size, chunk_size)
+
+	# Without threads, the chunks are adjusted one after the other, so that the temporaries of the kernel hold a single chunk at a time, instead of several copies of the whole array.
+	if not threaded:
+		for start in starts:
+			adjust_chunk(start, min(start + chunk_size, flat_days.size))
+
+		return output.reshape(days.shape)
+
+	pool = _get_pool(options.max_workers)
+	futures = [
+		pool.submit(adjust_chunk, start, min(start + chunk_size, flat_days.size))
+		for start in starts
+	]
+
+	try:
+		# Errors are raised in order, so that the first invalid item is reported, as without threads.
+		for future in futures:
+			future.result()
+
+	finally:
+		for future in futures:
+			future.cancel()
+
+	return output.reshape(days.shape)
@@ -0,0 +1,68 @@
+from contextlib import contextmanager
+from typing import Callable, Collection, Dict, Iterator, NamedTuple, Optional
+
+import numpy as np
+
+DEFAULT_CHUNK_SIZE: int
+
+class ThreadOptions(NamedTuple):
+	"""
+	The options of the multi-threaded execution of the vectorized kernels.
+	"""
+
+	max_workers: int
+	chunk_size: int
+
+def set_threads(
+	max_workers: Optional[int] = None,
+	chunk_size: int = ...,
+	enabled: bool = True,
+) -> None:
+	"""
+	Enables or disables, for the whole process, the multi-threaded execution of the vectorized kernels. Large arrays are split into chunks, which are adjusted in parallel by a pool of threads, as NumPy releases the GIL while computing.
+
+	Args:
+	    max_workers (Optional[int]): The number of threads. Defaults to the number of CPUs.
+	    chunk_size (int): The number of items adjusted by each task.
+	    enabled (bool): Whether to enable multi-threading.
+
+	Raises:
+	    ValueError: If the chunk size is not positive.
+	"""
+
+@contextmanager
+def threads(
+	max_workers: Optional[int] = None,
+	chunk_size: int = ...,
+	enabled: bool = True,
+) -> Iterator[None]:
+	"""
+	Enables or disables the multi-threaded execution of the vectorized kernels for the batch calls made in the current context, overriding the process-wide setting (see `set_threads`).
+
+	Args:
+	    max_workers (Optional[int]): The number of threads. Defaults to the number of CPUs.
+	    chunk_size (int): The number of items adjusted by each task.
+	    enabled (bool): Whether to enable multi-threading.
+
+	Raises:
+	    ValueError: If the chunk size is not positive.
+	"""
+
+def run_kernel(
+	kernel: Callable,
+	days: np.ndarray,
+	parameters: Dict,
+	chunked: Collection[str] = (),
+) -> np.ndarray:
+	"""
+	Runs the given vectorized kernel on the given day numbers. Arrays spanning at least two chunks are adjusted in chunks, on a pool of threads if multi-threading is enabled, or one after the other otherwise, which bounds the memory used by the temporaries of the kernel.
+
+	Args:
+	    kernel (Callable): The vectorized kernel.
+	    days (np.ndarray): The day numbers to adjust.
+	    parameters (Dict): The other arguments of the kernel.
+	    chunked (Collection[str]): The names of the parameters that are arrays of the same shape as the day numbers, which are split along with them.
+
+	Returns:
+	    np.ndarray: The adjusted day numbers.
+	"""
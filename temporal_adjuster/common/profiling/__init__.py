@@ -0,0 +1 @@
+from .batch_profiler import PHASES, BatchProfile, phase_timer, profile
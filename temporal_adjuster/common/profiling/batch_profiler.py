@@ -0,0 +1,130 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Dict, Iterator
+
+PHASES = ('bind', 'normalize', 'convert_in', 'compute', 'convert_out')
+
+_active_profile = ContextVar('temporal_adjuster_batch_profile', default=None)
+
+
+class BatchProfile:
+	"""
+	Accumulates the time spent in each phase of the batch calls made while it is active. The phases are, in order: `bind` (binding the arguments to the signature), `normalize` (parsing arguments such as the weekday), `convert_in` (converting the input container), `compute` (the adjustment itself) and `convert_out` (rebuilding the output container).
+	"""
+
+	def __init__(self) -> None:
+		self.calls: Dict[str, int] = {}
+		self.timings: Dict[str, Dict[str, float]] = {}
+
+	def record(self, method: str, timings: Dict[str, float]) -> None:
+		"""
+		Adds the phase timings of a single batch call to the profile.
+
+		Args:
+		    method (str): The name of the method that was called.
+		    timings (Dict[str, float]): The seconds spent in each phase.
+		"""
+		self.calls[method] = self.calls.get(method, 0) + 1
+		method_timings = self.timings.setdefault(method, dict.fromkeys(PHASES, 0.0))
+
+		for phase, seconds in timings.items():
+			method_timings[phase] += seconds
+
+	@property
+	def totals(self) -> Dict[str, float]:
+		"""
+		Returns the seconds spent in each phase, summed over every profiled method.
+		"""
+		totals = dict.fromkeys(PHASES, 0.0)
+
+		for method_timings in self.timings.values():
+			for phase, seconds in method_timings.items():
+				totals[phase] += seconds
+
+		return totals
+
+	def report(self) -> str:
+		"""
+		Returns a plain-text table with the time spent in each phase, per method and in total.
+		"""
+		header = f'{"method":<24}{"calls":>8}' + ''.join(
+			f'{phase:>13}' for phase in PHASES
+		)
+		rows = [header, '-' * len(header)]
+
+		for method, method_timings in sorted(self.timings.items()):
+			rows.append(
+				f'{method:<24}{self.calls[method]:>8}'
+				+ ''.join(f'{method_timings[phase]:>13.6f}' for phase in PHASES)
+			)
+
+		totals = self.totals
+		rows.append(
+			f'{"total":<24}{sum(self.calls.values()):>8}'
+			+ ''.join(f'{totals[phase]:>13.6f}' for phase in PHASES)
+		)
+
+		return '\n'.join(rows)
+
+	def __repr__(self) -> str:
+		return f'BatchProfile(calls={self.calls!r}, totals={self.totals!r})'
+
+
+class PhaseTimer:
+	"""
+	Measures the phases of a single batch call. The laps are only added to the active profile when the call is committed, so calls that turn out not to be batch calls are never recorded.
+	"""
+
+	__slots__ = ('_profile', '_method', '_last', '_timings')
+
+	def __init__(self, profile: BatchProfile, method: str) -> None:
+		self._profile = profile
+		self._method = method
+		self._timings: Dict[str, float] = {}
+		self._last = perf_counter()
+
+	def lap(self, phase: str) -> None:
+		now = perf_counter()
+		self._timings[phase] = self._timings.get(phase, 0.0) + now - self._last
+		self._last = now
+
+	def commit(self) -> None:
+		self._profile.record(self._method, self._timings)
+
+
+class _NullPhaseTimer:
+	__slots__ = ()
+
+	def lap(self, phase: str) -> None:
+		pass
+
+	def commit(self) -> None:
+		pass
+
+
+_NULL_TIMER = _NullPhaseTimer()
+
+
+def phase_timer(method: str):
+	"""
+	Returns a timer for the phases of a batch call of the given method. If no profile is active, a timer that does nothing is returned.
+	"""
+	profile = _active_profile.get()
+
+	return _NULL_TIMER if profile is None else PhaseTimer(profile, method)
+
+
+@contextmanager
+def profile() -> Iterator[BatchProfile]:
+	"""
+	Context manager that profiles every batch call made inside it, in the current thread or task.
+	"""
+	batch_profile = BatchProfile()
+	token = _active_profile.set(batch_profile)
+
+	try:
+		yield batch_profile
+
+	finally:
+		_active_profile.reset(token)
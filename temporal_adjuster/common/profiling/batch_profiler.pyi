@@ -0,0 +1,52 @@
+from contextlib import contextmanager
+from typing import Dict, Iterator, Tuple
+
+PHASES: Tuple[str, ...]
+
+class BatchProfile:
+	"""
+	Accumulates the time spent in each phase of the batch calls made while it is active. The phases are, in order: `bind` (binding the arguments to the signature), `normalize` (parsing arguments such as the weekday), `convert_in` (converting the input container), `compute` (the adjustment itself) and `convert_out` (rebuilding the output container).
+	"""
+
+	calls: Dict[str, int]
+	timings: Dict[str, Dict[str, float]]
+
+	def record(self, method: str, timings: Dict[str, float]) -> None:
+		"""
+		Adds the phase timings of a single batch call to the profile.
+
+		Args:
+		    method (str): The name of the method that was called.
+		    timings (Dict[str, float]): The seconds spent in each phase.
+		"""
+
+	@property
+	def totals(self) -> Dict[str, float]:
+		"""
+		Returns the seconds spent in each phase, summed over every profiled method.
+		"""
+
+	def report(self) -> str:
+		"""
+		Returns a plain-text table with the time spent in each phase, per method and in total.
+		"""
+
+class PhaseTimer:
+	"""
+	Measures the phases of a single batch call. The laps are only added to the active profile when the call is committed, so calls that turn out not to be batch calls are never recorded.
+	"""
+
+	def __init__(self, profile: BatchProfile, method: str) -> None: ...
+	def lap(self, phase: str) -> None: ...
+	def commit(self) -> None: ...
+
+def phase_timer(method: str):
+	"""
+	Returns a timer for the phases of a batch call of the given method. If no profile is active, a timer that does nothing is returned.
+	"""
+
+@contextmanager
+def profile() -> Iterator[BatchProfile]:
+	"""
+	Context manager that profiles every batch call made inside it, in the current thread or task.
+	"""
@@ -1,2 +1,8 @@
+from .date_dimension import _TemporalAdjusterForDateDimension
+from .fiscal_calendar import FiscalCalendar
 from .first_and_last_day_operations import _TemporalAdjusterForFirstAndLastDays
+from .iso_week_operations import _TemporalAdjusterForISOWeeks
+from .period_buckets import MISSING_CODE, PeriodDecoder, _TemporalAdjusterForBuckets
+from .quarter_operations import _TemporalAdjusterForQuarters
+from .time_of_day_operations import _TemporalAdjusterForTimeOfDay
 from .weekday_operations import _TemporalAdjusterForWeekday
@@ -0,0 +1,93 @@
+import inspect
+from typing import Dict, Optional, Union
+
+import numpy as np
+
+from ..common.enums import ISOWeekday, Weekday, normalize_week_start
+from .first_and_last_day_operations import _TemporalAdjusterForFirstAndLastDays
+from .iso_week_operations import _TemporalAdjusterForISOWeeks
+from .quarter_operations import _TemporalAdjusterForQuarters
+from .weekday_operations import _TemporalAdjusterForWeekday
+
+# The adjusters of the columns of the date dimension, in the order they are defined, and whether they take the first day of the weeks.
+_DAY_ADJUSTERS = [
+	(name, method.kernel, 'week_start' in inspect.signature(method).parameters)
+	for cls in (
+		_TemporalAdjusterForFirstAndLastDays,
+		_TemporalAdjusterForQuarters,
+		_TemporalAdjusterForISOWeeks,
+	)
+	for name, method in ((name, getattr(cls, name)) for name in vars(cls))
+	if name.startswith(('first_day_of_', 'last_day_of_'))
+]
+_WEEKDAY_ADJUSTERS = [
+	(name, getattr(_TemporalAdjusterForWeekday, name).kernel)
+	for name in vars(_TemporalAdjusterForWeekday)
+	if name.startswith(('first_of_', 'last_of_'))
+]
+
+
+class _TemporalAdjusterForDateDimension:
+	@staticmethod
+	def date_dimension(
+		start,
+		end,
+		week_start: Optional[Union[Weekday, ISOWeekday, str, int]] = None,
+	) -> Dict[str, np.ndarray]:
+		"""
+		Returns a date dimension table, with one row per day of the given range, and the results of the first and last day adjusters as columns, such as `first_day_of_month` or `last_day_of_next_quarter`, as well as the ones of the `first_of_*` and `last_of_*` adjusters for each weekday, such as `first_of_month_friday`. Each column is computed at once by the vectorized kernel of its adjuster, so that a table spanning a century is built in a fraction of a second. The table is returned as a dictionary of columns, which can be turned into a data frame with `pd.DataFrame(table)`.
+
+		Args:
+		    start: The first day of the range, as a `date`, `datetime` or `np.datetime64` value. Times of the day are ignored.
+		    end: The last day of the range, included.
+		    week_start (Optional[Union[Weekday, ISOWeekday, str, int]]): The first day of the weeks of the week columns. Defaults to the current week start (see `get_week_start`).
+
+		Raises:
+		    ValueError: If the range ends before it starts.
+
+		Returns:
+		    Dict[str, np.ndarray]: The columns of the table, as `np.datetime64[D]` arrays, by name, starting with the `date` column holding the days of the range.
+
+		Examples:
+
+		```
+		>>> from datetime import date
+
+		>>> from temporal_adjuster import TemporalAdjuster
+
+		>>> table = TemporalAdjuster.date_dimension(date(2024, 6, 13), date(2024, 6, 14))
+
+		>>> table['last_day_of_month']
+		array(['2024-06-30', '2024-06-30'], dtype='datetime64[D]')
+
+		>>> table['first_of_next_month_monday']
+		array(['2024-07-01', '2024-07-01'], dtype='datetime64[D]')
+
+		```
+		"""
+		first = np.datetime64(start, 'D')
+		last = np.datetime64(end, 'D')
+
+		if last < first:
+			raise ValueError(
+				f'The range of the date dimension ends on {last}, before it starts on {first}.'
+			)
+
+		days = np.arange(first, last + 1, dtype='datetime64[D]').view(np.int64)
+
+		columns = {'date': days.view('datetime64[D]')}
+
+		week_parameters = {'week_start': normalize_week_start(week_start)}
+
+		for name, kernel, takes_week_start in _DAY_ADJUSTERS:
+			columns[name] = np.asarray(
+				kernel(days, **week_parameters) if takes_week_start else kernel(days)
+			).view('datetime64[D]')
+
+		for name, kernel in _WEEKDAY_ADJUSTERS:
+			for weekday in Weekday:
+				columns[f'{name}_{weekday.name.lower()}'] = np.asarray(
+					kernel(days, weekday=weekday)
+				).view('datetime64[D]')
+
+		return columns
@@ -1,58 +1,97 @@
+from typing import Optional, Union
+
 from dateutil.relativedelta import relativedelta
 
 from ..common.decorators import sequenceable
+from ..common.enums import ISOWeekday, Weekday, normalize_week_start
 from ..common.types.dates import DateT
+from .kernels import preimage_kernels as preimages
+from .kernels import first_and_last_day_kernels as kernels
+from .kernels.calendar import month_start, year_start
 
 
 class _TemporalAdjusterForFirstAndLastDays:
 	@staticmethod
-	@sequenceable(target='date')
-	def first_day_of_week(date: DateT) -> DateT:
-		"""
-		Returns the first day of the week of the given date. The week starts on Monday.
+	@sequenceable(
+		target='date',
+		normalize={'week_start': normalize_week_start},
+		kernel=kernels.first_day_of_week,
+		preimage=preimages.week(),
+	)
+	def first_day_of_week(
+		date: DateT,
+		week_start: Optional[Union[Weekday, ISOWeekday, str, int]] = None,
+	) -> DateT:
+		"""
+		Returns the first day of the week of the given date. The week starts on Monday, unless another week start is given or set.
 
 		Args:
 		    date (DateT): The date to adjust.
+		    week_start (Optional[Union[Weekday, ISOWeekday, str, int]]): The first day of the weeks. Defaults to the current week start (see `get_week_start`), which is Monday unless set otherwise.
 
 		Returns:
 		    DateT: The first day of the week of the given date.
 		"""
-		return date - relativedelta(days=date.weekday())
+		week_start = normalize_week_start(week_start)
+
+		return date - relativedelta(days=(date.weekday() - week_start) % 7)
 
 	@staticmethod
-	@sequenceable(target='date')
-	def first_day_of_next_week(date: DateT) -> DateT:
-		"""
-		Returns the first day of the next week of the given date. The week starts on Monday.
+	@sequenceable(
+		target='date',
+		normalize={'week_start': normalize_week_start},
+		kernel=kernels.first_day_of_next_week,
+		preimage=preimages.week(1),
+	)
+	def first_day_of_next_week(
+		date: DateT,
+		week_start: Optional[Union[Weekday, ISOWeekday, str, int]] = None,
+	) -> DateT:
+		"""
+		Returns the first day of the next week of the given date. The week starts on Monday, unless another week start is given or set.
 
 		Args:
 		    date (DateT): The date to adjust.
+		    week_start (Optional[Union[Weekday, ISOWeekday, str, int]]): The first day of the weeks. Defaults to the current week start (see `get_week_start`), which is Monday unless set otherwise.
 
 		Returns:
 		    DateT: The first day of the next week of the given date.
 		"""
 		return _TemporalAdjusterForFirstAndLastDays.first_day_of_week(
-			date
+			date, week_start
 		) + relativedelta(weeks=1)
 
 	@staticmethod
-	@sequenceable(target='date')
-	def first_day_of_last_week(date: DateT) -> DateT:
-		"""
-		Returns the first day of the last week of the given date. The week starts on Monday.
+	@sequenceable(
+		target='date',
+		normalize={'week_start': normalize_week_start},
+		kernel=kernels.first_day_of_last_week,
+		preimage=preimages.week(-1),
+	)
+	def first_day_of_last_week(
+		date: DateT,
+		week_start: Optional[Union[Weekday, ISOWeekday, str, int]] = None,
+	) -> DateT:
+		"""
+		Returns the first day of the last week of the given date. The week starts on Monday, unless another week start is given or set.
 
 		Args:
 		    date (DateT): The date to adjust.
+		    week_start (Optional[Union[Weekday, ISOWeekday, str, int]]): The first day of the weeks. Defaults to the current week start (see `get_week_start`), which is Monday unless set otherwise.
 
 		Returns:
 		    DateT: The first day of the next week of the given date.
 		"""
 		return _TemporalAdjusterForFirstAndLastDays.first_day_of_week(
-			date
+			date, week_start
 		) + relativedelta(weeks=-1)
 
 	@staticmethod
-	@sequenceable(target='date')
+	@sequenceable(
+		target='date',
+		kernel=kernels.first_day_of_month,
+		preimage=preimages.period(month_start),
+	)
 	def first_day_of_month(date: DateT) -> DateT:
 		"""
 		Returns the first day of the month of the given date.
@@ -66,7 +105,11 @@ class _TemporalAdjusterForFirstAndLastDays:
 		return date.replace(day=1)
 
 	@staticmethod
-	@sequenceable(target='date')
+	@sequenceable(
+		target='date',
+		kernel=kernels.first_day_of_next_month,
+		preimage=preimages.period(month_start, 1),
+	)
 	def first_day_of_next_month(date: DateT) -> DateT:
 		"""
 		Returns the first day of the next month of the given date.
@@ -82,7 +125,11 @@ class _TemporalAdjusterForFirstAndLastDays:
 		) + relativedelta(months=1)
 
 	@staticmethod
-	@sequenceable(target='date')
+	@sequenceable(
+		target='date',
+		kernel=kernels.first_day_of_last_month,
+		preimage=preimages.period(month_start, -1),
+	)
 	def first_day_of_last_month(date: DateT) -> DateT:
 		"""
 		Returns the first day of the last month of the given date.
@@ -98,7 +145,11 @@ class _TemporalAdjusterForFirstAndLastDays:
 		) + relativedelta(months=-1)
 
 	@staticmethod
-	@sequenceable(target='date')
+	@sequenceable(
+		target='date',
+		kernel=kernels.first_day_of_year,
+		preimage=preimages.period(year_start),
+	)
 	def first_day_of_year(date: DateT) -> DateT:
 		"""
 		Returns the first day of the year of the given date.
@@ -112,7 +163,11 @@ class _TemporalAdjusterForFirstAndLastDays:
 		return date.replace(month=1, day=1)
 
 	@staticmethod
-	@sequenceable(target='date')
+	@sequenceable(
+		target='date',
+		kernel=kernels.first_day_of_next_year,
+		preimage=preimages.period(year_start, 1),
+	)
 	def first_day_of_next_year(date: DateT) -> DateT:
 		"""
 		Returns the first day of the next year of the given date.
@@ -128,7 +183,11 @@ class _TemporalAdjusterForFirstAndLastDays:
 		) + relativedelta(years=1)
 
 	@staticmethod
-	@sequenceable(target='date')
+	@sequenceable(
+		target='date',
+		kernel=kernels.first_day_of_last_year,
+		preimage=preimages.period(year_start, -1),
+	)
 	def first_day_of_last_year(date: DateT) -> DateT:
 		"""
 		Returns the first day of the last year of the given date.
@@ -144,53 +203,86 @@ class _TemporalAdjusterForFirstAndLastDays:
 		) + relativedelta(years=-1)
 
 	@staticmethod
-	@sequenceable(target='date')
-	def last_day_of_week(date: DateT) -> DateT:
-		"""
-		Returns the last day of the week of the given date. The week ends on Sunday.
+	@sequenceable(
+		target='date',
+		normalize={'week_start': normalize_week_start},
+		kernel=kernels.last_day_of_week,
+		preimage=preimages.week(),
+	)
+	def last_day_of_week(
+		date: DateT,
+		week_start: Optional[Union[Weekday, ISOWeekday, str, int]] = None,
+	) -> DateT:
+		"""
+		Returns the last day of the week of the given date. The week ends on Sunday, unless another week start is given or set.
 
 		Args:
 		    date (DateT): The date to adjust.
+		    week_start (Optional[Union[Weekday, ISOWeekday, str, int]]): The first day of the weeks. Defaults to the current week start (see `get_week_start`), which is Monday unless set otherwise.
 
 		Returns:
 		    DateT: The last day of the week of the given date.
 		"""
-		return date + relativedelta(days=6 - date.weekday())
+		week_start = normalize_week_start(week_start)
+
+		return date + relativedelta(days=6 - (date.weekday() - week_start) % 7)
 
 	@staticmethod
-	@sequenceable(target='date')
-	def last_day_of_next_week(date: DateT) -> DateT:
-		"""
-		Returns the last day of the next week of the given date. The week ends on Sunday.
+	@sequenceable(
+		target='date',
+		normalize={'week_start': normalize_week_start},
+		kernel=kernels.last_day_of_next_week,
+		preimage=preimages.week(1),
+	)
+	def last_day_of_next_week(
+		date: DateT,
+		week_start: Optional[Union[Weekday, ISOWeekday, str, int]] = None,
+	) -> DateT:
+		"""
+		Returns the last day of the next week of the given date. The week ends on Sunday, unless another week start is given or set.
 
 		Args:
 		    date (DateT): The date to adjust.
+		    week_start (Optional[Union[Weekday, ISOWeekday, str, int]]): The first day of the weeks. Defaults to the current week start (see `get_week_start`), which is Monday unless set otherwise.
 
 		Returns:
 		    DateT: The last day of the next week of the given date.
 		"""
 		return _TemporalAdjusterForFirstAndLastDays.last_day_of_week(
-			date
+			date, week_start
 		) + relativedelta(weeks=1)
 
 	@staticmethod
-	@sequenceable(target='date')
-	def last_day_of_last_week(date: DateT) -> DateT:
-		"""
-		Returns the last day of the last week of the given date. The week ends on Sunday.
+	@sequenceable(
+		target='date',
+		normalize={'week_start': normalize_week_start},
+		kernel=kernels.last_day_of_last_week,
+		preimage=preimages.week(-1),
+	)
+	def last_day_of_last_week(
+		date: DateT,
+		week_start: Optional[Union[Weekday, ISOWeekday, str, int]] = None,
+	) -> DateT:
+		"""
+		Returns the last day of the last week of the given date. The week ends on Sunday, unless another week start is given or set.
 
 		Args:
 		    date (DateT): The date to adjust.
+		    week_start (Optional[Union[Weekday, ISOWeekday, str, int]]): The first day of the weeks. Defaults to the current week start (see `get_week_start`), which is Monday unless set otherwise.
 
 		Returns:
 		    DateT: The last day of the last week of the given date.
 		"""
 		return _TemporalAdjusterForFirstAndLastDays.last_day_of_week(
-			date
+			date, week_start
 		) + relativedelta(weeks=-1)
 
 	@staticmethod
-	@sequenceable(target='date')
+	@sequenceable(
+		target='date',
+		kernel=kernels.last_day_of_month,
+		preimage=preimages.period(month_start),
+	)
 	def last_day_of_month(date: DateT) -> DateT:
 		"""
 		Returns the last day of the month of the given date.
@@ -204,7 +296,11 @@ class _TemporalAdjusterForFirstAndLastDays:
 		return date.replace(day=1) + relativedelta(months=1, days=-1)
 
 	@staticmethod
-	@sequenceable(target='date')
+	@sequenceable(
+		target='date',
+		kernel=kernels.last_day_of_next_month,
+		preimage=preimages.period(month_start, 1),
+	)
 	def last_day_of_next_month(date: DateT) -> DateT:
 		"""
 		Returns the last day of the next month of the given date.
@@ -220,7 +316,11 @@ class _TemporalAdjusterForFirstAndLastDays:
 		)
 
 	@staticmethod
-	@sequenceable(target='date')
+	@sequenceable(
+		target='date',
+		kernel=kernels.last_day_of_last_month,
+		preimage=preimages.period(month_start, -1),
+	)
 	def last_day_of_last_month(date: DateT) -> DateT:
 		"""
 		Returns the last day of the last month of the given date.
@@ -236,7 +336,11 @@ class _TemporalAdjusterForFirstAndLastDays:
 		) + relativedelta(days=-1)
 
 	@staticmethod
-	@sequenceable(target='date')
+	@sequenceable(
+		target='date',
+		kernel=kernels.last_day_of_year,
+		preimage=preimages.period(year_start),
+	)
 	def last_day_of_year(date: DateT) -> DateT:
 		"""
 		Returns the last day of the year of the given date.
@@ -250,7 +354,11 @@ class _TemporalAdjusterForFirstAndLastDays:
 		return date.replace(month=12, day=31)
 
 	@staticmethod
-	@sequenceable(target='date')
+	@sequenceable(
+		target='date',
+		kernel=kernels.last_day_of_next_year,
+		preimage=preimages.period(year_start, 1),
+	)
 	def last_day_of_next_year(date: DateT) -> DateT:
 		"""
 		Returns the last day of the next year of the given date.
@@ -266,7 +374,11 @@ class _TemporalAdjusterForFirstAndLastDays:
 		) + relativedelta(years=1)
 
 	@staticmethod
-	@sequenceable(target='date')
+	@sequenceable(
+		target='date',
+		kernel=kernels.last_day_of_last_year,
+		preimage=preimages.period(year_start, -1),
+	)
 	def last_day_of_last_year(date: DateT) -> DateT:
 		"""
 		Returns the last day of the last year of the given date.
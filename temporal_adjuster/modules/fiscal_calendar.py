@@ -0,0 +1,316 @@
+from typing import NamedTuple, Sequence, Union
+
+import numpy as np
+from dateutil.relativedelta import relativedelta
+
+from ..common.decorators import sequenceable
+from ..common.enums import ISOWeekday, Weekday, normalize_weekday
+from ..common.types import DateT
+from .first_and_last_day_operations import _TemporalAdjusterForFirstAndLastDays
+from .kernels import fiscal_kernels as kernels
+from .kernels.calendar import civil_from_days, days_from_civil
+from .weekday_operations import _TemporalAdjusterForWeekday
+
+# Ordinal of 1970-01-01, the day number 0 of the kernels.
+EPOCH_ORDINAL = 719163
+
+
+class _FiscalTables(NamedTuple):
+	first_year: int
+	last_year: int
+	year_starts: np.ndarray
+	period_starts: np.ndarray
+
+
+def _days_of(date: DateT) -> int:
+	return date.toordinal() - EPOCH_ORDINAL
+
+
+def _first_day_of_fiscal_year(days, self):
+	return kernels.boundary_start(days, self._tables_for(days).year_starts)
+
+
+def _last_day_of_fiscal_year(days, self):
+	return kernels.boundary_end(days, self._tables_for(days).year_starts)
+
+
+def _first_day_of_fiscal_period(days, self):
+	return kernels.boundary_start(days, self._tables_for(days).period_starts)
+
+
+def _last_day_of_fiscal_period(days, self):
+	return kernels.boundary_end(days, self._tables_for(days).period_starts)
+
+
+def _fiscal_year_preimage(days, self):
+	return _first_day_of_fiscal_year(days, self), _last_day_of_fiscal_year(days, self)
+
+
+def _fiscal_period_preimage(days, self):
+	return _first_day_of_fiscal_period(days, self), _last_day_of_fiscal_period(
+		days, self
+	)
+
+
+class FiscalCalendar:
+	"""
+	A 52/53-week fiscal calendar, such as the 4-4-5 retail calendar. Each fiscal year ends on the last given day of the week of the given month (or on the one nearest to the end of that month), and is divided into four quarters of 13 weeks, each split into periods following the given pattern of weeks. The extra week of 53-week years is added to the last period.
+
+	The boundaries of the fiscal years and periods are computed once, with the weekday adjusters, into sorted arrays, so that the adjusters of the calendar are binary searches, both for single dates and for arrays. The arrays are extended when a date falls outside of them.
+
+	Examples:
+
+	```
+	>>> from datetime import date
+
+	>>> from temporal_adjuster import FiscalCalendar
+	>>> from temporal_adjuster.common.enums import Weekday
+
+	>>> calendar = FiscalCalendar(year_end_month=1, year_end_weekday=Weekday.SATURDAY)
+
+	>>> calendar.last_day_of_fiscal_year(date(2024, 6, 13))
+	datetime.date(2025, 1, 25)
+
+	>>> calendar.first_day_of_fiscal_period(date(2024, 6, 13))
+	datetime.date(2024, 5, 26)
+
+	>>> calendar.fiscal_week_of(date(2024, 6, 13))
+	20
+	```
+	"""
+
+	def __init__(
+		self,
+		year_end_month: int = 1,
+		year_end_weekday: Union[Weekday, ISOWeekday, str, int] = Weekday.SATURDAY,
+		pattern: Sequence[int] = (4, 4, 5),
+		nearest: bool = False,
+	) -> None:
+		"""
+		Args:
+		    year_end_month (int): The month in which the fiscal years end.
+		    year_end_weekday (Union[Weekday, ISOWeekday, str, int]): The day of the week on which the fiscal years end.
+		    pattern (Sequence[int]): The number of weeks of each period of a quarter, which must add up to 13.
+		    nearest (bool): Whether the fiscal years end on the given day of the week nearest to the end of the month, instead of on the last one in the month.
+
+		Raises:
+		    ValueError: If the month is invalid or the pattern does not add up to 13 weeks.
+		"""
+		if not 1 <= year_end_month <= 12:
+			raise ValueError(
+				f'The value of year_end_month must be between 1 and 12, but is {year_end_month}.'
+			)
+
+		pattern = tuple(int(weeks) for weeks in pattern)
+
+		if not pattern or min(pattern) < 1 or sum(pattern) != 13:
+			raise ValueError(
+				f'The pattern must be positive numbers of weeks adding up to 13, but is {pattern}.'
+			)
+
+		self.year_end_month = year_end_month
+		self.year_end_weekday = normalize_weekday(year_end_weekday)
+		self.pattern = pattern
+		self.nearest = nearest
+
+		self.__period_offsets = 7 * np.concatenate(([0], np.cumsum(pattern * 4)[:-1]))
+		self.__tables = self.__build_tables(1900, 2100)
+
+	def __repr__(self) -> str:
+		return (
+			f'{type(self).__name__}(year_end_month={self.year_end_month}, '
+			f'year_end_weekday={self.year_end_weekday}, pattern={self.pattern}, '
+			f'nearest={self.nearest})'
+		)
+
+	@property
+	def periods_per_year(self) -> int:
+		"""
+		Returns the number of periods of a fiscal year.
+		"""
+		return 4 * len(self.pattern)
+
+	def __build_tables(self, first_year: int, last_year: int) -> _FiscalTables:
+		"""
+		Computes the boundaries of the fiscal years that end in the given range of years.
+		"""
+		month_starts = days_from_civil(
+			np.arange(first_year - 1, last_year + 1), self.year_end_month, 1
+		).view('datetime64[D]')
+
+		if self.nearest:
+			year_ends = _TemporalAdjusterForWeekday.last_or_same(
+				self.year_end_weekday,
+				_TemporalAdjusterForFirstAndLastDays.last_day_of_month(month_starts)
+				+ np.timedelta64(3, 'D'),
+			)
+
+		else:
+			year_ends = _TemporalAdjusterForWeekday.last_of_month(
+				self.year_end_weekday, month_starts
+			)
+
+		year_starts = year_ends.view(np.int64) + 1
+		period_starts = year_starts[:-1, np.newaxis] + self.__period_offsets
+
+		return _FiscalTables(
+			first_year,
+			last_year,
+			year_starts,
+			np.append(period_starts.ravel(), year_starts[-1]),
+		)
+
+	def _tables_for(self, days) -> _FiscalTables:
+		"""
+		Returns the boundary tables, extended if needed to cover the given day numbers.
+		"""
+		tables = self.__tables
+
+		if np.size(days) == 0:
+			return tables
+
+		first_day, last_day = np.min(days), np.max(days)
+
+		if tables.year_starts[0] <= first_day and last_day < tables.year_starts[-1]:
+			return tables
+
+		(first_year, last_year), _, _ = civil_from_days(np.array([first_day, last_day]))
+
+		self.__tables = tables = self.__build_tables(
+			min(tables.first_year, int(first_year) - 1),
+			max(tables.last_year, int(last_year) + 1),
+		)
+
+		return tables
+
+	def __adjust(self, date: DateT, kernel) -> DateT:
+		"""
+		Moves the given date to the day number returned by the given kernel, keeping its time.
+		"""
+		days = _days_of(date)
+
+		return date + relativedelta(days=int(kernel(days, self)) - days)
+
+	@sequenceable(
+		target='date',
+		kernel=_first_day_of_fiscal_year,
+		preimage=_fiscal_year_preimage,
+	)
+	def first_day_of_fiscal_year(self, date: DateT) -> DateT:
+		"""
+		Returns the first day of the fiscal year of the given date.
+
+		Args:
+		    date (DateT): The date to adjust.
+
+		Returns:
+		    DateT: The first day of the fiscal year of the given date.
+		"""
+		return self.__adjust(date, _first_day_of_fiscal_year)
+
+	@sequenceable(
+		target='date',
+		kernel=_last_day_of_fiscal_year,
+		preimage=_fiscal_year_preimage,
+	)
+	def last_day_of_fiscal_year(self, date: DateT) -> DateT:
+		"""
+		Returns the last day of the fiscal year of the given date.
+
+		Args:
+		    date (DateT): The date to adjust.
+
+		Returns:
+		    DateT: The last day of the fiscal year of the given date.
+		"""
+		return self.__adjust(date, _last_day_of_fiscal_year)
+
+	@sequenceable(
+		target='date',
+		kernel=_first_day_of_fiscal_period,
+		preimage=_fiscal_period_preimage,
+	)
+	def first_day_of_fiscal_period(self, date: DateT) -> DateT:
+		"""
+		Returns the first day of the fiscal period of the given date.
+
+		Args:
+		    date (DateT): The date to adjust.
+
+		Returns:
+		    DateT: The first day of the fiscal period of the given date.
+		"""
+		return self.__adjust(date, _first_day_of_fiscal_period)
+
+	@sequenceable(
+		target='date',
+		kernel=_last_day_of_fiscal_period,
+		preimage=_fiscal_period_preimage,
+	)
+	def last_day_of_fiscal_period(self, date: DateT) -> DateT:
+		"""
+		Returns the last day of the fiscal period of the given date.
+
+		Args:
+		    date (DateT): The date to adjust.
+
+		Returns:
+		    DateT: The last day of the fiscal period of the given date.
+		"""
+		return self.__adjust(date, _last_day_of_fiscal_period)
+
+	def fiscal_period_of(
+		self, date: Union[DateT, Sequence[DateT]]
+	) -> Union[int, np.ndarray]:
+		"""
+		Returns the number of the fiscal period of the given date in its fiscal year, from 1 to the number of periods per year. Sequences of dates are computed at once into an array of numbers.
+
+		Args:
+		    date (Union[DateT, Sequence[DateT]]): The date.
+
+		Returns:
+		    Union[int, np.ndarray]: The fiscal period of the given date.
+		"""
+		days = self.__days_of_any(date)
+		period = (
+			kernels.boundary_index(days, self._tables_for(days).period_starts)
+			% self.periods_per_year
+			+ 1
+		)
+
+		return period if np.ndim(date) else int(period)
+
+	def fiscal_week_of(
+		self, date: Union[DateT, Sequence[DateT]]
+	) -> Union[int, np.ndarray]:
+		"""
+		Returns the number of the fiscal week of the given date in its fiscal year, from 1 to 52 or 53. Sequences of dates are computed at once into an array of numbers.
+
+		Args:
+		    date (Union[DateT, Sequence[DateT]]): The date.
+
+		Returns:
+		    Union[int, np.ndarray]: The fiscal week of the given date.
+		"""
+		days = self.__days_of_any(date)
+		week = (days - _first_day_of_fiscal_year(days, self)) // 7 + 1
+
+		return week if np.ndim(date) else int(week)
+
+	@staticmethod
+	def __days_of_any(date: Union[DateT, Sequence[DateT]]):
+		"""
+		Returns the day number of the given date, or an array of the day numbers of the given dates.
+
+		Raises:
+		    ValueError: If the dates contain missing values.
+		"""
+		if not np.ndim(date):
+			return _days_of(date)
+
+		dates = np.asarray(date, dtype='datetime64[D]')
+
+		if np.isnat(dates).any():
+			raise ValueError('The dates must not contain missing values.')
+
+		return dates.view(np.int64)
@@ -0,0 +1,162 @@
+import datetime
+from typing import Sequence, Union
+
+import numpy as np
+from dateutil.relativedelta import relativedelta
+
+from ..common.decorators import sequenceable
+from ..common.types import DateT
+from .kernels import preimage_kernels as preimages
+from .kernels import iso_week_kernels as kernels
+from .kernels.calendar import iso_year_start
+
+
+class _TemporalAdjusterForISOWeeks:
+	@staticmethod
+	@sequenceable(
+		target='date',
+		kernel=kernels.first_day_of_iso_year,
+		preimage=preimages.period(iso_year_start),
+	)
+	def first_day_of_iso_year(date: DateT) -> DateT:
+		"""
+		Returns the first day of the ISO-8601 week-numbering year of the given date, that is, the Monday of its week 1. The ISO year of a date is the year of the Thursday of its week.
+
+		Args:
+		    date (DateT): The date to adjust.
+
+		Returns:
+		    DateT: The first day of the ISO year of the given date.
+		"""
+		_, week, weekday = date.isocalendar()
+
+		return date - relativedelta(weeks=week - 1, days=weekday - 1)
+
+	@staticmethod
+	@sequenceable(
+		target='date',
+		kernel=kernels.first_day_of_next_iso_year,
+		preimage=preimages.period(iso_year_start, 1),
+	)
+	def first_day_of_next_iso_year(date: DateT) -> DateT:
+		"""
+		Returns the first day of the next ISO-8601 week-numbering year of the given date.
+
+		Args:
+		    date (DateT): The date to adjust.
+
+		Returns:
+		    DateT: The first day of the next ISO year of the given date.
+		"""
+		# An ISO year has 52 or 53 weeks, so 53 weeks after its first day is always in the next ISO year.
+		return _TemporalAdjusterForISOWeeks.first_day_of_iso_year(
+			_TemporalAdjusterForISOWeeks.first_day_of_iso_year(date)
+			+ relativedelta(weeks=53)
+		)
+
+	@staticmethod
+	@sequenceable(
+		target='date',
+		kernel=kernels.first_day_of_last_iso_year,
+		preimage=preimages.period(iso_year_start, -1),
+	)
+	def first_day_of_last_iso_year(date: DateT) -> DateT:
+		"""
+		Returns the first day of the last ISO-8601 week-numbering year of the given date.
+
+		Args:
+		    date (DateT): The date to adjust.
+
+		Returns:
+		    DateT: The first day of the last ISO year of the given date.
+		"""
+		return _TemporalAdjusterForISOWeeks.first_day_of_iso_year(
+			_TemporalAdjusterForISOWeeks.first_day_of_iso_year(date)
+			+ relativedelta(weeks=-1)
+		)
+
+	@staticmethod
+	@sequenceable(
+		target='date',
+		kernel=kernels.last_day_of_iso_year,
+		preimage=preimages.period(iso_year_start),
+	)
+	def last_day_of_iso_year(date: DateT) -> DateT:
+		"""
+		Returns the last day of the ISO-8601 week-numbering year of the given date, that is, the Sunday of its last week.
+
+		Args:
+		    date (DateT): The date to adjust.
+
+		Returns:
+		    DateT: The last day of the ISO year of the given date.
+		"""
+		return _TemporalAdjusterForISOWeeks.first_day_of_next_iso_year(
+			date
+		) + relativedelta(days=-1)
+
+	@staticmethod
+	@sequenceable(
+		target='date',
+		kernel=kernels.last_day_of_next_iso_year,
+		preimage=preimages.period(iso_year_start, 1),
+	)
+	def last_day_of_next_iso_year(date: DateT) -> DateT:
+		"""
+		Returns the last day of the next ISO-8601 week-numbering year of the given date.
+
+		Args:
+		    date (DateT): The date to adjust.
+
+		Returns:
+		    DateT: The last day of the next ISO year of the given date.
+		"""
+		return _TemporalAdjusterForISOWeeks.last_day_of_iso_year(
+			_TemporalAdjusterForISOWeeks.first_day_of_next_iso_year(date)
+		)
+
+	@staticmethod
+	@sequenceable(
+		target='date',
+		kernel=kernels.last_day_of_last_iso_year,
+		preimage=preimages.period(iso_year_start, -1),
+	)
+	def last_day_of_last_iso_year(date: DateT) -> DateT:
+		"""
+		Returns the last day of the last ISO-8601 week-numbering year of the given date.
+
+		Args:
+		    date (DateT): The date to adjust.
+
+		Returns:
+		    DateT: The last day of the last ISO year of the given date.
+		"""
+		return _TemporalAdjusterForISOWeeks.first_day_of_iso_year(date) + relativedelta(
+			days=-1
+		)
+
+	@staticmethod
+	def iso_week_start(
+		year: Union[int, Sequence[int]], week: Union[int, Sequence[int]]
+	) -> Union[datetime.date, np.ndarray]:
+		"""
+		Returns the first day (the Monday) of the given week of the given ISO-8601 week-numbering year. Sequences of years and weeks are broadcast against each other and computed at once into an array of `np.datetime64[D]` values.
+
+		Args:
+		    year (Union[int, Sequence[int]]): The ISO year.
+		    week (Union[int, Sequence[int]]): The ISO week, from 1 to 52 or 53, depending on the year.
+
+		Raises:
+		    ValueError: If the ISO year does not have the given week.
+
+		Returns:
+		    Union[datetime.date, np.ndarray]: The first day of the given ISO week.
+		"""
+		if np.ndim(year) == 0 and np.ndim(week) == 0:
+			return datetime.date.fromisocalendar(int(year), int(week), 1)
+
+		year, week = np.broadcast_arrays(
+			np.asarray(year, dtype=np.int64), np.asarray(week, dtype=np.int64)
+		)
+
+		return kernels.iso_week_start(year, week).view('datetime64[D]')
@@ -0,0 +1,10 @@
+from . import (
+	bucket_kernels,
+	first_and_last_day_kernels,
+	fiscal_kernels,
+	iso_week_kernels,
+	preimage_kernels,
+	quarter_kernels,
+	time_of_day_kernels,
+	weekday_kernels,
+)
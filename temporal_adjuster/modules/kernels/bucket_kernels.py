@@ -0,0 +1,45 @@
+"""
+Vectorized kernels of the period buckets, working on day numbers (see `calendar`). Each period has an encoder, which returns the number of the period of the given day numbers, counted from the period of 1970-01-01, and a decoder, which returns the first day of the given period numbers.
+"""
+
+from .calendar import civil_from_days, days_from_civil, last_or_same_weekday
+
+EPOCH_YEAR = 1970
+
+
+def week_codes(days, week_start):
+	return (days - last_or_same_weekday(0, week_start)) // 7
+
+
+def week_starts(codes, week_start):
+	return last_or_same_weekday(0, week_start) + 7 * codes
+
+
+def month_codes(days, week_start):
+	year, month, _ = civil_from_days(days)
+
+	return (year - EPOCH_YEAR) * 12 + month - 1
+
+
+def month_starts(codes, week_start):
+	return days_from_civil(EPOCH_YEAR + codes // 12, codes % 12 + 1, 1)
+
+
+def quarter_codes(days, week_start):
+	year, month, _ = civil_from_days(days)
+
+	return (year - EPOCH_YEAR) * 4 + (month - 1) // 3
+
+
+def quarter_starts(codes, week_start):
+	return days_from_civil(EPOCH_YEAR + codes // 4, codes % 4 * 3 + 1, 1)
+
+
+def year_codes(days, week_start):
+	year, _, _ = civil_from_days(days)
+
+	return year - EPOCH_YEAR
+
+
+def year_starts(codes, week_start):
+	return days_from_civil(EPOCH_YEAR + codes, 1, 1)
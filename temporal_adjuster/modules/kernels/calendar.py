@@ -0,0 +1,121 @@
+"""
+Proleptic Gregorian calendar arithmetic on day numbers, counted from 1970-01-01 (the integer view of `np.datetime64[D]`). The functions only use integer arithmetic and `np.where`, so they work on both Python integers and `np.int64` arrays of any shape.
+"""
+
+import numpy as np
+
+# Number of days from 0000-03-01 to 1970-01-01.
+EPOCH_SHIFT = 719468
+DAYS_PER_ERA = 146097
+
+
+def weekday_of(days):
+	"""
+	Returns the Pythonic weekday of the given day numbers, from 0 (Monday) to 6 (Sunday). 1970-01-01 was a Thursday.
+	"""
+	return (days + 3) % 7
+
+
+def civil_from_days(days):
+	"""
+	Returns the year, month and day of the given day numbers.
+	"""
+	z = days + EPOCH_SHIFT
+	era = z // DAYS_PER_ERA
+	day_of_era = z - era * DAYS_PER_ERA
+	year_of_era = (
+		day_of_era
+		- day_of_era // 1460
+		+ day_of_era // 36524
+		- day_of_era // (DAYS_PER_ERA - 1)
+	) // 365
+	day_of_year = day_of_era - (
+		365 * year_of_era + year_of_era // 4 - year_of_era // 100
+	)
+	shifted_month = (5 * day_of_year + 2) // 153
+	day = day_of_year - (153 * shifted_month + 2) // 5 + 1
+	month = np.where(shifted_month < 10, shifted_month + 3, shifted_month - 9)
+	year = year_of_era + era * 400 + (month <= 2)
+
+	return year, month, day
+
+
+def days_from_civil(year, month, day):
+	"""
+	Returns the day numbers of the given year, month and day.
+	"""
+	year = year - (month <= 2)
+	era = year // 400
+	year_of_era = year - era * 400
+	day_of_year = (153 * ((month + 9) % 12) + 2) // 5 + day - 1
+	day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+
+	return era * DAYS_PER_ERA + day_of_era - EPOCH_SHIFT
+
+
+def week_start(days, weeks=0, first_weekday=0):
+	"""
+	Returns the first day of the week of the given day numbers, shifted by the given number of weeks. The weeks start on the given Pythonic weekday, Monday by default.
+	"""
+	return days - (weekday_of(days) - first_weekday) % 7 + 7 * weeks
+
+
+def month_start(days, months=0):
+	"""
+	Returns the first day of the month of the given day numbers, shifted by the given number of months.
+	"""
+	year, month, _ = civil_from_days(days)
+	month_index = year * 12 + month - 1 + months
+
+	return days_from_civil(month_index // 12, month_index % 12 + 1, 1)
+
+
+def quarter_start(days, quarters=0):
+	"""
+	Returns the first day of the quarter of the given day numbers, shifted by the given number of quarters.
+	"""
+	year, month, _ = civil_from_days(days)
+	month_index = year * 12 + (month - 1) // 3 * 3 + 3 * quarters
+
+	return days_from_civil(month_index // 12, month_index % 12 + 1, 1)
+
+
+def year_start(days, years=0):
+	"""
+	Returns the first day of the year of the given day numbers, shifted by the given number of years.
+	"""
+	year, _, _ = civil_from_days(days)
+
+	return days_from_civil(year + years, 1, 1)
+
+
+def iso_year_start_of_year(year):
+	"""
+	Returns the first day (the Monday of week 1) of the given ISO-8601 week-numbering years.
+	"""
+	fourth_of_january = days_from_civil(year, 1, 4)
+
+	return fourth_of_january - weekday_of(fourth_of_january)
+
+
+def iso_year_start(days, years=0):
+	"""
+	Returns the first day of the ISO-8601 week-numbering year of the given day numbers, shifted by the given number of years. The ISO year of a day is the year of the Thursday of its week.
+	"""
+	year, _, _ = civil_from_days(days - weekday_of(days) + 3)
+
+	return iso_year_start_of_year(year + years)
+
+
+def next_or_same_weekday(days, weekday):
+	"""
+	Returns the first day on or after the given day numbers that falls on the given weekday.
+	"""
+	return days + (weekday - weekday_of(days)) % 7
+
+
+def last_or_same_weekday(days, weekday):
+	"""
+	Returns the last day on or before the given day numbers that falls on the given weekday.
+	"""
+	return days - (weekday_of(days) - weekday) % 7
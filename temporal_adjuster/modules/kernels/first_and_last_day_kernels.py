@@ -0,0 +1,85 @@
+"""
+Vectorized kernels of the first and last day operations, working on day numbers (see `calendar`). Each kernel mirrors the scalar method with the same name.
+"""
+
+from .calendar import (
+	civil_from_days,
+	days_from_civil,
+	month_start,
+	week_start as calendar_week_start,
+	year_start,
+)
+
+
+def first_day_of_week(days, week_start):
+	return calendar_week_start(days, 0, week_start)
+
+
+def first_day_of_next_week(days, week_start):
+	return calendar_week_start(days, 1, week_start)
+
+
+def first_day_of_last_week(days, week_start):
+	return calendar_week_start(days, -1, week_start)
+
+
+def first_day_of_month(days):
+	return month_start(days)
+
+
+def first_day_of_next_month(days):
+	return month_start(days, 1)
+
+
+def first_day_of_last_month(days):
+	return month_start(days, -1)
+
+
+def first_day_of_year(days):
+	return year_start(days)
+
+
+def first_day_of_next_year(days):
+	return year_start(days, 1)
+
+
+def first_day_of_last_year(days):
+	return year_start(days, -1)
+
+
+def last_day_of_week(days, week_start):
+	return calendar_week_start(days, 1, week_start) - 1
+
+
+def last_day_of_next_week(days, week_start):
+	return calendar_week_start(days, 2, week_start) - 1
+
+
+def last_day_of_last_week(days, week_start):
+	return calendar_week_start(days, 0, week_start) - 1
+
+
+def last_day_of_month(days):
+	return month_start(days, 1) - 1
+
+
+def last_day_of_next_month(days):
+	return month_start(days, 2) - 1
+
+
+def last_day_of_last_month(days):
+	return month_start(days) - 1
+
+
+def last_day_of_year(days):
+	year, _, _ = civil_from_days(days)
+
+	return days_from_civil(year, 12, 31)
+
+
+def last_day_of_next_year(days):
+	return year_start(days, 2) - 1
+
+
+def last_day_of_last_year(days):
+	return year_start(days) - 1
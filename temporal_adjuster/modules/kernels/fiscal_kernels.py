@@ -0,0 +1,26 @@
+"""
+Vectorized lookups of the fiscal calendar operations, working on day numbers (see `calendar`). The boundaries are sorted arrays of the first days of consecutive fiscal years or periods, followed by the first day after the last one, so that every lookup is a binary search.
+"""
+
+import numpy as np
+
+
+def boundary_index(days, boundaries):
+	"""
+	Returns the index of the fiscal year or period of the given day numbers in the given boundaries.
+	"""
+	return np.searchsorted(boundaries, days, side='right') - 1
+
+
+def boundary_start(days, boundaries):
+	"""
+	Returns the first day of the fiscal year or period of the given day numbers.
+	"""
+	return boundaries[boundary_index(days, boundaries)]
+
+
+def boundary_end(days, boundaries):
+	"""
+	Returns the last day of the fiscal year or period of the given day numbers.
+	"""
+	return boundaries[boundary_index(days, boundaries) + 1] - 1
@@ -0,0 +1,45 @@
+"""
+Vectorized kernels of the ISO-8601 week operations, working on day numbers (see `calendar`). Each kernel mirrors the scalar method with the same name.
+"""
+
+import numpy as np
+
+from .calendar import iso_year_start, iso_year_start_of_year
+
+
+def first_day_of_iso_year(days):
+	return iso_year_start(days)
+
+
+def first_day_of_next_iso_year(days):
+	return iso_year_start(days, 1)
+
+
+def first_day_of_last_iso_year(days):
+	return iso_year_start(days, -1)
+
+
+def last_day_of_iso_year(days):
+	return iso_year_start(days, 1) - 1
+
+
+def last_day_of_next_iso_year(days):
+	return iso_year_start(days, 2) - 1
+
+
+def last_day_of_last_iso_year(days):
+	return iso_year_start(days) - 1
+
+
+def iso_week_start(year, week):
+	weeks_in_year = (
+		iso_year_start_of_year(year + 1) - iso_year_start_of_year(year)
+	) // 7
+	invalid = (week < 1) | (week > weeks_in_year)
+
+	if np.any(invalid):
+		raise ValueError(
+			f'Invalid week: {np.broadcast_to(week, invalid.shape)[invalid][0]}'
+		)
+
+	return iso_year_start_of_year(year) + 7 * (week - 1)
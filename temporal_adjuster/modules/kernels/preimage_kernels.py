@@ -0,0 +1,45 @@
+"""
+Preimages of the adjusters, working on day numbers (see `calendar`). The preimage of an adjuster takes the day numbers of target dates, followed by the other parameters of the adjuster as keyword arguments, and returns the first and last day numbers of the only interval of dates that may be adjusted to each target. Every built-in adjuster is monotonic and maps each such interval to a single date, so the intervals are exact once the adjuster is applied to their bounds (see `BoundAdjuster.preimage`).
+"""
+
+from .calendar import week_start as calendar_week_start
+
+
+def period(period_start, periods=0):
+	"""
+	Returns the preimage of an adjuster mapping every date of a period to a date of the period shifted by the given number of periods, such as `first_day_of_next_month`. The given function returns the first day of the period of day numbers, shifted by a number of periods, as `calendar.month_start` does.
+	"""
+
+	def preimage(days, **_):
+		return period_start(days, -periods), period_start(days, 1 - periods) - 1
+
+	return preimage
+
+
+def week(weeks=0):
+	"""
+	Returns the preimage of a week adjuster mapping every date of a week to a date of the week shifted by the given number of weeks, such as `first_day_of_next_week`, given the first day of the weeks as its `week_start` parameter.
+	"""
+
+	def preimage(days, week_start, **_):
+		return (
+			calendar_week_start(days, -weeks, week_start),
+			calendar_week_start(days, 1 - weeks, week_start) - 1,
+		)
+
+	return preimage
+
+
+def shift(minimum, maximum):
+	"""
+	Returns the preimage of an adjuster moving every date forwards by between the given numbers of days, such as `next`, which moves dates by 1 to 7 days. Negative numbers move dates backwards.
+	"""
+
+	def preimage(days, **_):
+		return days - maximum, days - minimum
+
+	return preimage
+
+
+def nth_from_date(days, weekday, n):
+	return days - 7 * (n - 1) - 6, days - 7 * (n - 1)
@@ -0,0 +1,50 @@
+"""
+Vectorized kernels of the quarter operations, working on day numbers (see `calendar`). Each kernel mirrors the scalar method with the same name.
+"""
+
+import numpy as np
+
+from ...common.enums import Weekday
+from ...common.exceptions import DateError
+from .calendar import next_or_same_weekday, quarter_start
+from .weekday_kernels import check_n, first_invalid
+
+
+def first_day_of_quarter(days):
+	return quarter_start(days)
+
+
+def first_day_of_next_quarter(days):
+	return quarter_start(days, 1)
+
+
+def first_day_of_last_quarter(days):
+	return quarter_start(days, -1)
+
+
+def last_day_of_quarter(days):
+	return quarter_start(days, 1) - 1
+
+
+def last_day_of_next_quarter(days):
+	return quarter_start(days, 2) - 1
+
+
+def last_day_of_last_quarter(days):
+	return quarter_start(days) - 1
+
+
+def nth_of_quarter(days, weekday, n):
+	check_n(n, 14)
+
+	output_days = next_or_same_weekday(quarter_start(days), weekday) + 7 * (n - 1)
+	invalid = output_days >= quarter_start(days, 1)
+
+	if np.any(invalid):
+		weekday, n = first_invalid(invalid, weekday, n)
+
+		raise DateError(
+			f'The quarter does not have a {n}th occurrence of {Weekday(weekday).name.lower()}.'
+		)
+
+	return output_days
@@ -0,0 +1,75 @@
+"""
+Vectorized kernels of the time of day operations, working on the values of `np.datetime64` arrays in ticks of their unit, given the number of ticks in a day. Each kernel mirrors the scalar method with the same name. Times that the unit cannot hold are truncated to it, as NumPy does when casting to a coarser unit.
+"""
+
+from datetime import time
+
+import numpy as np
+
+from .weekday_kernels import first_invalid
+
+MINUTES_PER_DAY = 24 * 60
+MICROSECONDS_PER_DAY = MINUTES_PER_DAY * 60 * 10**6
+
+
+def check_ticks_per_day(ticks_per_day):
+	if ticks_per_day < 2:
+		raise TypeError('The dates must have a time of the day to adjust it.')
+
+
+def check_minutes(minutes):
+	invalid = np.asarray(minutes) < 1
+
+	if np.any(invalid):
+		(minutes,) = first_invalid(invalid, minutes)
+
+		raise ValueError(f'The value of minutes must be at least 1, but is {minutes}.')
+
+
+def time_ticks(value: time, ticks_per_day):
+	"""
+	Returns the offset into the day of the given time, in ticks.
+	"""
+	microseconds = (
+		(value.hour * 60 + value.minute) * 60 + value.second
+	) * 10**6 + value.microsecond
+
+	return microseconds * ticks_per_day // MICROSECONDS_PER_DAY
+
+
+def start_of_day(ticks, ticks_per_day):
+	check_ticks_per_day(ticks_per_day)
+
+	return ticks - ticks % ticks_per_day
+
+
+def end_of_day(ticks, ticks_per_day):
+	return start_of_day(ticks, ticks_per_day) + ticks_per_day - 1
+
+
+def start_of_hour(ticks, ticks_per_day):
+	# Units of more than an hour, such as 2 hours, hold less than one tick per hour, so the hours are counted as periods of 60 minutes instead.
+	return truncate_to(ticks, ticks_per_day, 60)
+
+
+def truncate_to(ticks, ticks_per_day, minutes):
+	check_ticks_per_day(ticks_per_day)
+	check_minutes(minutes)
+
+	# The periods are counted from midnight, and may not be a whole number of ticks, as 15 minutes in hours.
+	offsets = ticks % ticks_per_day
+	periods = offsets * MINUTES_PER_DAY // (minutes * ticks_per_day)
+
+	return ticks - offsets + periods * minutes * ticks_per_day // MINUTES_PER_DAY
+
+
+def next_time(ticks, ticks_per_day, time):
+	candidates = start_of_day(ticks, ticks_per_day) + time_ticks(time, ticks_per_day)
+
+	return np.where(candidates <= ticks, candidates + ticks_per_day, candidates)
+
+
+def next_or_same_time(ticks, ticks_per_day, time):
+	candidates = start_of_day(ticks, ticks_per_day) + time_ticks(time, ticks_per_day)
+
+	return np.where(candidates < ticks, candidates + ticks_per_day, candidates)
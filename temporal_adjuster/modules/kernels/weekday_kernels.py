@@ -0,0 +1,134 @@
+"""
+Vectorized kernels of the weekday operations, working on day numbers (see `calendar`). Each kernel mirrors the scalar method with the same name, and takes the weekday already normalized to the Pythonic format. The weekday and n parameters may be scalars or arrays broadcast against the day numbers.
+"""
+
+import numpy as np
+
+from ...common.enums import Weekday
+from ...common.exceptions import DateError
+from .calendar import (
+	last_or_same_weekday,
+	month_start,
+	next_or_same_weekday,
+	weekday_of,
+	year_start,
+)
+
+
+def next(days, weekday):
+	return days + (weekday - weekday_of(days) - 1) % 7 + 1
+
+
+def next_or_same(days, weekday):
+	return next_or_same_weekday(days, weekday)
+
+
+def last(days, weekday):
+	return days - (weekday_of(days) - weekday - 1) % 7 - 1
+
+
+def last_or_same(days, weekday):
+	return last_or_same_weekday(days, weekday)
+
+
+def first_of_month(days, weekday):
+	return next_or_same_weekday(month_start(days), weekday)
+
+
+def first_of_next_month(days, weekday):
+	return next_or_same_weekday(month_start(days, 1), weekday)
+
+
+def first_of_last_month(days, weekday):
+	return next_or_same_weekday(month_start(days, -1), weekday)
+
+
+def last_of_month(days, weekday):
+	return last_or_same_weekday(month_start(days, 1) - 1, weekday)
+
+
+def last_of_next_month(days, weekday):
+	return last_or_same_weekday(month_start(days, 2) - 1, weekday)
+
+
+def last_of_last_month(days, weekday):
+	return last_or_same_weekday(month_start(days) - 1, weekday)
+
+
+def first_of_year(days, weekday):
+	return next_or_same_weekday(year_start(days), weekday)
+
+
+def first_of_next_year(days, weekday):
+	return next_or_same_weekday(year_start(days, 1), weekday)
+
+
+def first_of_last_year(days, weekday):
+	return next_or_same_weekday(year_start(days, -1), weekday)
+
+
+# The scalar year operations look for the weekday strictly before the 31st of December.
+def last_of_year(days, weekday):
+	return last(year_start(days, 1) - 1, weekday)
+
+
+def last_of_next_year(days, weekday):
+	return last(year_start(days, 2) - 1, weekday)
+
+
+def last_of_last_year(days, weekday):
+	return last(year_start(days) - 1, weekday)
+
+
+def nth_from_date(days, weekday, n):
+	return next_or_same_weekday(days, weekday) + 7 * (n - 1)
+
+
+def first_invalid(invalid, *values):
+	"""
+	Returns the values of the parameters at the first position flagged as invalid. Parameters may be scalars or arrays broadcast against the flags.
+	"""
+	index = np.unravel_index(np.argmax(invalid), np.shape(invalid))
+
+	return tuple(value if np.ndim(value) == 0 else value[index] for value in values)
+
+
+def check_n(n, maximum):
+	invalid = (np.asarray(n) < 1) | (np.asarray(n) > maximum)
+
+	if np.any(invalid):
+		(n,) = first_invalid(invalid, n)
+
+		raise ValueError(f'The value of n must be between 1 and {maximum}, but is {n}.')
+
+
+def nth_of_month(days, weekday, n):
+	check_n(n, 5)
+
+	output_days = next_or_same_weekday(month_start(days), weekday) + 7 * (n - 1)
+	invalid = output_days >= month_start(days, 1)
+
+	if np.any(invalid):
+		weekday, n = first_invalid(invalid, weekday, n)
+
+		raise DateError(
+			f'The month does not have a {n}th occurrence of {Weekday(weekday).name.lower()}.'
+		)
+
+	return output_days
+
+
+def nth_of_year(days, weekday, n):
+	check_n(n, 54)
+
+	output_days = next_or_same_weekday(year_start(days), weekday) + 7 * (n - 1)
+	invalid = output_days >= year_start(days, 1)
+
+	if np.any(invalid):
+		weekday, n = first_invalid(invalid, weekday, n)
+
+		raise DateError(
+			f'The year does not have a {n}th occurrence of {Weekday(weekday).name.lower()}.'
+		)
+
+	return output_days
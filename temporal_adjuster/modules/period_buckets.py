@@ -0,0 +1,143 @@
+from typing import Iterable, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from ..common.adapters import get_adapter
+from ..common.enums import ISOWeekday, Weekday, normalize_week_start
+from .kernels import bucket_kernels as kernels
+
+# The code of the missing dates, such as `NaT` and `None` values, which the decoders map back to `NaT`.
+MISSING_CODE = np.iinfo(np.int32).min
+
+_PERIODS = {
+	'week': (kernels.week_codes, kernels.week_starts),
+	'month': (kernels.month_codes, kernels.month_starts),
+	'quarter': (kernels.quarter_codes, kernels.quarter_starts),
+	'year': (kernels.year_codes, kernels.year_starts),
+}
+
+
+class PeriodDecoder(NamedTuple):
+	"""
+	Maps the period codes returned by `TemporalAdjuster.bucket` back to the periods they stand for.
+	"""
+
+	period: str
+	week_start: Weekday
+
+	def __call__(self, codes: Union[int, Iterable[int]]) -> np.ndarray:
+		"""
+		Returns the first day of the periods of the given codes, as `first_day_of_week` or `first_day_of_month` would.
+
+		Args:
+		    codes (Union[int, Iterable[int]]): The code, or codes, of the periods.
+
+		Returns:
+		    np.ndarray: The first days of the periods, as `np.datetime64[D]` values.
+		"""
+		return self.__decode(codes, 0)
+
+	def end(self, codes: Union[int, Iterable[int]]) -> np.ndarray:
+		"""
+		Returns the last day of the periods of the given codes.
+
+		Args:
+		    codes (Union[int, Iterable[int]]): The code, or codes, of the periods.
+
+		Returns:
+		    np.ndarray: The last days of the periods, as `np.datetime64[D]` values.
+		"""
+		return self.__decode(codes, 1) - np.timedelta64(1, 'D')
+
+	def __decode(self, codes: Union[int, Iterable[int]], shift: int) -> np.ndarray:
+		_, decode = _PERIODS[self.period]
+		codes = np.asarray(codes, dtype=np.int64)
+		missing = codes == MISSING_CODE
+
+		starts = np.asarray(decode(codes + shift, self.week_start)).view(
+			'datetime64[D]'
+		)
+
+		if missing.any():
+			starts = np.where(missing, np.datetime64('NaT'), starts)
+
+		return starts[()]
+
+
+class _TemporalAdjusterForBuckets:
+	@staticmethod
+	def bucket(
+		dates: Iterable,
+		period: str,
+		week_start: Optional[Union[Weekday, ISOWeekday, str, int]] = None,
+	) -> Tuple[np.ndarray, PeriodDecoder]:
+		"""
+		Returns the code of the period of each of the given dates, for grouping dates by week, month, quarter or year without building the first day of each period. The codes are the numbers of the periods counted from the one of 1970-01-01, so they are stable across calls, and are computed in a single vectorized pass, with the same boundaries as `first_day_of_week`, `first_day_of_month`, `first_day_of_quarter` and `first_day_of_year`.
+
+		Args:
+		    dates (Iterable): The dates, as any container supported by the batch calls. Times of the day are ignored.
+		    period (str): The period of the buckets: 'week', 'month', 'quarter' or 'year'.
+		    week_start (Optional[Union[Weekday, ISOWeekday, str, int]]): The first day of the weeks. Only used for weekly buckets. Defaults to the current week start (see `get_week_start`).
+
+		Raises:
+		    ValueError: If the period is unknown, or a date is too far from 1970 for its code to fit into 32 bits.
+
+		Returns:
+		    Tuple[np.ndarray, PeriodDecoder]: The `np.int32` codes of the periods of the dates, in the order of the dates, where missing dates have the code `MISSING_CODE`, and the decoder mapping the codes back to the periods.
+
+		Examples:
+
+		```
+		>>> from datetime import date
+
+		>>> from temporal_adjuster import TemporalAdjuster
+
+		>>> codes, decoder = TemporalAdjuster.bucket(
+		...     [date(2024, 1, 31), date(2024, 2, 1), date(2024, 2, 29)], 'month'
+		... )
+
+		>>> codes
+		array([648, 649, 649], dtype=int32)
+
+		>>> decoder(codes)
+		array(['2024-01-01', '2024-02-01', '2024-02-01'], dtype='datetime64[D]')
+
+		```
+		"""
+		if period not in _PERIODS:
+			raise ValueError(
+				f'Unknown period: {period}. The available periods are: {", ".join(_PERIODS)}.'
+			)
+
+		week_start = (
+			normalize_week_start(week_start) if period == 'week' else Weekday.MONDAY
+		)
+		encode, _ = _PERIODS[period]
+
+		values = get_adapter(dates).view(dates)
+
+		if values.dtype != np.dtype('datetime64[D]'):
+			values = values.astype('datetime64[D]')
+
+		days = values.view(np.int64)
+		missing = np.isnat(values)
+		has_missing = missing.any()
+
+		if has_missing:
+			days = np.where(missing, 0, days)
+
+		codes = encode(days, week_start)
+
+		if codes.size and (
+			codes.min() <= MISSING_CODE or codes.max() > np.iinfo(np.int32).max
+		):
+			raise ValueError(
+				f'The dates are too far from 1970 for their {period} codes to fit into 32 bits.'
+			)
+
+		codes = codes.astype(np.int32)
+
+		if has_missing:
+			codes[missing] = MISSING_CODE
+
+		return codes, PeriodDecoder(period, week_start)
@@ -0,0 +1,172 @@
+from typing import Union
+
+from dateutil.relativedelta import relativedelta
+
+from ..common.decorators import sequenceable
+from ..common.enums import ISOWeekday, Weekday, normalize_weekday
+from ..common.exceptions import DateError
+from ..common.types import DateT
+from .kernels import preimage_kernels as preimages
+from .kernels import quarter_kernels as kernels
+from .kernels.calendar import quarter_start
+
+
+class _TemporalAdjusterForQuarters:
+	@staticmethod
+	@sequenceable(
+		target='date',
+		kernel=kernels.first_day_of_quarter,
+		preimage=preimages.period(quarter_start),
+	)
+	def first_day_of_quarter(date: DateT) -> DateT:
+		"""
+		Returns the first day of the quarter of the given date. The quarters start on the 1st of January, April, July and October.
+
+		Args:
+		    date (DateT): The date to adjust.
+
+		Returns:
+		    DateT: The first day of the quarter of the given date.
+		"""
+		return date.replace(month=(date.month - 1) // 3 * 3 + 1, day=1)
+
+	@staticmethod
+	@sequenceable(
+		target='date',
+		kernel=kernels.first_day_of_next_quarter,
+		preimage=preimages.period(quarter_start, 1),
+	)
+	def first_day_of_next_quarter(date: DateT) -> DateT:
+		"""
+		Returns the first day of the next quarter of the given date.
+
+		Args:
+		    date (DateT): The date to adjust.
+
+		Returns:
+		    DateT: The first day of the next quarter of the given date.
+		"""
+		return _TemporalAdjusterForQuarters.first_day_of_quarter(date) + relativedelta(
+			months=3
+		)
+
+	@staticmethod
+	@sequenceable(
+		target='date',
+		kernel=kernels.first_day_of_last_quarter,
+		preimage=preimages.period(quarter_start, -1),
+	)
+	def first_day_of_last_quarter(date: DateT) -> DateT:
+		"""
+		Returns the first day of the last quarter of the given date.
+
+		Args:
+		    date (DateT): The date to adjust.
+
+		Returns:
+		    DateT: The first day of the last quarter of the given date.
+		"""
+		return _TemporalAdjusterForQuarters.first_day_of_quarter(date) + relativedelta(
+			months=-3
+		)
+
+	@staticmethod
+	@sequenceable(
+		target='date',
+		kernel=kernels.last_day_of_quarter,
+		preimage=preimages.period(quarter_start),
+	)
+	def last_day_of_quarter(date: DateT) -> DateT:
+		"""
+		Returns the last day of the quarter of the given date. The quarters end on the last day of March, June, September and December.
+
+		Args:
+		    date (DateT): The date to adjust.
+
+		Returns:
+		    DateT: The last day of the quarter of the given date.
+		"""
+		return _TemporalAdjusterForQuarters.first_day_of_quarter(date) + relativedelta(
+			months=3, days=-1
+		)
+
+	@staticmethod
+	@sequenceable(
+		target='date',
+		kernel=kernels.last_day_of_next_quarter,
+		preimage=preimages.period(quarter_start, 1),
+	)
+	def last_day_of_next_quarter(date: DateT) -> DateT:
+		"""
+		Returns the last day of the next quarter of the given date.
+
+		Args:
+		    date (DateT): The date to adjust.
+
+		Returns:
+		    DateT: The last day of the next quarter of the given date.
+		"""
+		return _TemporalAdjusterForQuarters.first_day_of_quarter(date) + relativedelta(
+			months=6, days=-1
+		)
+
+	@staticmethod
+	@sequenceable(
+		target='date',
+		kernel=kernels.last_day_of_last_quarter,
+		preimage=preimages.period(quarter_start, -1),
+	)
+	def last_day_of_last_quarter(date: DateT) -> DateT:
+		"""
+		Returns the last day of the last quarter of the given date.
+
+		Args:
+		    date (DateT): The date to adjust.
+
+		Returns:
+		    DateT: The last day of the last quarter of the given date.
+		"""
+		return _TemporalAdjusterForQuarters.first_day_of_quarter(date) + relativedelta(
+			days=-1
+		)
+
+	@staticmethod
+	@sequenceable(
+		target='date',
+		normalize={'weekday': normalize_weekday},
+		kernel=kernels.nth_of_quarter,
+		preimage=preimages.period(quarter_start),
+		broadcast=('weekday', 'n'),
+	)
+	def nth_of_quarter(
+		weekday: Union[Weekday, ISOWeekday], date: DateT, n: int
+	) -> DateT:
+		"""
+		Returns the nth date of the given day of the week in the quarter of the given date.
+
+		Args:
+		    weekday (Weekday): The day of the week.
+		    date (DateT): The reference date.
+		    n (int): The nth occurrence of the given day of the week.
+
+		Raises:
+		    ValueError: If n is less than 1 or greater than 14.
+		    DateError: If the quarter does not have a nth occurrence of the given day of the week.
+
+		Returns:
+		    DateT: The nth date of the given day of the week in the quarter of the given date.
+		"""
+		weekday = normalize_weekday(weekday)
+
+		if n < 1 or n > 14:
+			raise ValueError(f'The value of n must be between 1 and 14, but is {n}.')
+
+		start_date = _TemporalAdjusterForQuarters.first_day_of_quarter(date)
+		output_date = start_date + relativedelta(weekday=weekday.value, weeks=n - 1)
+
+		if output_date >= start_date + relativedelta(months=3):
+			raise DateError(
+				f'The quarter does not have a {n}th occurrence of {weekday.name.lower()}.'
+			)
+
+		return output_date
@@ -0,0 +1,166 @@
+from datetime import time as Time
+from datetime import timedelta
+from typing import Union
+
+from ..common.decorators import sequenceable
+from ..common.types import DateT
+from .kernels import time_of_day_kernels as kernels
+
+
+def normalize_time(time: Union[Time, str]) -> Time:
+	"""
+	Parses the given time of the day.
+
+	Args:
+	    time (Union[Time, str]): The time, as a `time` object or an ISO 8601 string, such as '17:30'.
+
+	Raises:
+	    TypeError: If the time is neither a `time` object nor a string.
+	    ValueError: If the string is not a valid time.
+
+	Returns:
+	    Time: The parsed time.
+	"""
+	if isinstance(time, Time):
+		return time
+
+	if isinstance(time, str):
+		return Time.fromisoformat(time)
+
+	raise TypeError(
+		f'The time must be a datetime.time or a string, but is {type(time).__name__}.'
+	)
+
+
+class _TemporalAdjusterForTimeOfDay:
+	@staticmethod
+	@sequenceable(target='date', kernel=kernels.start_of_day, time_of_day=True)
+	def start_of_day(date: DateT) -> DateT:
+		"""
+		Returns the start of the day of the given datetime, at midnight.
+
+		Args:
+		    date (DateT): The datetime to adjust.
+
+		Returns:
+		    DateT: The start of the day of the given datetime.
+		"""
+		return date.replace(hour=0, minute=0, second=0, microsecond=0)
+
+	@staticmethod
+	@sequenceable(target='date', kernel=kernels.end_of_day, time_of_day=True)
+	def end_of_day(date: DateT) -> DateT:
+		"""
+		Returns the end of the day of the given datetime, which is its last microsecond, or its last tick for `np.datetime64` values.
+
+		Args:
+		    date (DateT): The datetime to adjust.
+
+		Returns:
+		    DateT: The end of the day of the given datetime.
+		"""
+		return date.replace(hour=23, minute=59, second=59, microsecond=999999)
+
+	@staticmethod
+	@sequenceable(target='date', kernel=kernels.start_of_hour, time_of_day=True)
+	def start_of_hour(date: DateT) -> DateT:
+		"""
+		Returns the start of the hour of the given datetime.
+
+		Args:
+		    date (DateT): The datetime to adjust.
+
+		Returns:
+		    DateT: The start of the hour of the given datetime.
+		"""
+		return date.replace(minute=0, second=0, microsecond=0)
+
+	@staticmethod
+	@sequenceable(
+		target='date',
+		kernel=kernels.truncate_to,
+		broadcast=('minutes',),
+		time_of_day=True,
+	)
+	def truncate_to(date: DateT, minutes: int = 15) -> DateT:
+		"""
+		Returns the start of the period of the given number of minutes holding the given datetime, such as the quarter of an hour for 15 minutes. The periods are counted from midnight.
+
+		Args:
+		    date (DateT): The datetime to adjust.
+		    minutes (int): The length of the periods, in minutes.
+
+		Raises:
+		    ValueError: If minutes is less than 1.
+
+		Returns:
+		    DateT: The start of the period holding the given datetime.
+		"""
+		if minutes < 1:
+			raise ValueError(
+				f'The value of minutes must be at least 1, but is {minutes}.'
+			)
+
+		start = (date.hour * 60 + date.minute) // minutes * minutes
+
+		return date.replace(
+			hour=start // 60, minute=start % 60, second=0, microsecond=0
+		)
+
+	@staticmethod
+	@sequenceable(
+		target='date',
+		normalize={'time': normalize_time},
+		kernel=kernels.next_time,
+		time_of_day=True,
+	)
+	def next_time(time: Union[Time, str], date: DateT) -> DateT:
+		"""
+		Returns the next datetime at the given time of the day, which is on the day of the given datetime if the time is later, or on the next day otherwise.
+
+		Args:
+		    time (Union[Time, str]): The time of the day, as a `time` object or an ISO 8601 string, such as '17:30'.
+		    date (DateT): The reference datetime.
+
+		Returns:
+		    DateT: The next datetime at the given time of the day.
+		"""
+		time = normalize_time(time)
+
+		output_date = date.replace(
+			hour=time.hour,
+			minute=time.minute,
+			second=time.second,
+			microsecond=time.microsecond,
+		)
+
+		return output_date if output_date > date else output_date + timedelta(days=1)
+
+	@staticmethod
+	@sequenceable(
+		target='date',
+		normalize={'time': normalize_time},
+		kernel=kernels.next_or_same_time,
+		time_of_day=True,
+	)
+	def next_or_same_time(time: Union[Time, str], date: DateT) -> DateT:
+		"""
+		Returns the next datetime at the given time of the day, or the given datetime if it is at that time.
+
+		Args:
+		    time (Union[Time, str]): The time of the day, as a `time` object or an ISO 8601 string, such as '17:30'.
+		    date (DateT): The reference datetime.
+
+		Returns:
+		    DateT: The next or same datetime at the given time of the day.
+		"""
+		time = normalize_time(time)
+
+		output_date = date.replace(
+			hour=time.hour,
+			minute=time.minute,
+			second=time.second,
+			microsecond=time.microsecond,
+		)
+
+		return output_date if output_date >= date else output_date + timedelta(days=1)
@@ -3,9 +3,12 @@ from typing import Union
 from dateutil.relativedelta import relativedelta
 
 from ..common.decorators import sequenceable
-from ..common.enums import ISOWeekday, Weekday
+from ..common.enums import ISOWeekday, Weekday, normalize_weekday
 from ..common.exceptions import DateError
 from ..common.types import DateT
+from .kernels import preimage_kernels as preimages
+from .kernels import weekday_kernels as kernels
+from .kernels.calendar import month_start, year_start
 from .first_and_last_day_operations import _TemporalAdjusterForFirstAndLastDays
 
 
@@ -21,17 +24,16 @@ class _TemporalAdjusterForWeekday:
 		Returns:
 		    Weekday: The parsed weekday.
 		"""
-		if type(weekday) == str:
-			return Weekday[weekday.upper()]
-
-		elif type(weekday) == int:
-			return Weekday(weekday)
-
-		else:
-			return weekday if isinstance(weekday, Weekday) else Weekday[weekday.name]
+		return normalize_weekday(weekday)
 
 	@staticmethod
-	@sequenceable(target='date')
+	@sequenceable(
+		target='date',
+		normalize={'weekday': normalize_weekday},
+		kernel=kernels.next,
+		preimage=preimages.shift(1, 7),
+		broadcast=('weekday',),
+	)
 	def next(weekday: Union[Weekday, ISOWeekday], date: DateT) -> DateT:
 		"""
 		Returns the next date of the given day of the week.
@@ -52,7 +54,13 @@ class _TemporalAdjusterForWeekday:
 		)
 
 	@staticmethod
-	@sequenceable(target='date')
+	@sequenceable(
+		target='date',
+		normalize={'weekday': normalize_weekday},
+		kernel=kernels.next_or_same,
+		preimage=preimages.shift(0, 6),
+		broadcast=('weekday',),
+	)
 	def next_or_same(weekday: Union[Weekday, ISOWeekday], date: DateT) -> DateT:
 		"""
 		Returns the next date of the given day of the week. If the given date is the same day of the week, the given date is returned.
@@ -73,7 +81,13 @@ class _TemporalAdjusterForWeekday:
 		)
 
 	@staticmethod
-	@sequenceable(target='date')
+	@sequenceable(
+		target='date',
+		normalize={'weekday': normalize_weekday},
+		kernel=kernels.last,
+		preimage=preimages.shift(-7, -1),
+		broadcast=('weekday',),
+	)
 	def last(weekday: Union[Weekday, ISOWeekday], date: DateT) -> DateT:
 		"""
 		Returns the last date of the given day of the week.
@@ -95,7 +109,13 @@ class _TemporalAdjusterForWeekday:
 		)
 
 	@staticmethod
-	@sequenceable(target='date')
+	@sequenceable(
+		target='date',
+		normalize={'weekday': normalize_weekday},
+		kernel=kernels.last_or_same,
+		preimage=preimages.shift(-6, 0),
+		broadcast=('weekday',),
+	)
 	def last_or_same(weekday: Union[Weekday, ISOWeekday], date: DateT) -> DateT:
 		"""
 		Returns the last date of the given day of the week. If the given date is the same day of the week, the given date is returned.
@@ -116,7 +136,13 @@ class _TemporalAdjusterForWeekday:
 		)
 
 	@staticmethod
-	@sequenceable(target='date')
+	@sequenceable(
+		target='date',
+		normalize={'weekday': normalize_weekday},
+		kernel=kernels.first_of_month,
+		preimage=preimages.period(month_start),
+		broadcast=('weekday',),
+	)
 	def first_of_month(weekday: Union[Weekday, ISOWeekday], date: DateT) -> DateT:
 		"""
 		Returns the first date of the given day of the week in the month of the given date.
@@ -133,7 +159,13 @@ class _TemporalAdjusterForWeekday:
 		return date.replace(day=1) + relativedelta(weekday=weekday.value)
 
 	@staticmethod
-	@sequenceable(target='date')
+	@sequenceable(
+		target='date',
+		normalize={'weekday': normalize_weekday},
+		kernel=kernels.first_of_next_month,
+		preimage=preimages.period(month_start, 1),
+		broadcast=('weekday',),
+	)
 	def first_of_next_month(weekday: Union[Weekday, ISOWeekday], date: DateT) -> DateT:
 		"""
 		Returns the first date of the given day of the week in the month after the month of the given date.
@@ -152,7 +184,13 @@ class _TemporalAdjusterForWeekday:
 		)
 
 	@staticmethod
-	@sequenceable(target='date')
+	@sequenceable(
+		target='date',
+		normalize={'weekday': normalize_weekday},
+		kernel=kernels.first_of_last_month,
+		preimage=preimages.period(month_start, -1),
+		broadcast=('weekday',),
+	)
 	def first_of_last_month(weekday: Union[Weekday, ISOWeekday], date: DateT) -> DateT:
 		"""
 		Returns the first date of the given day of the week in the month before the month of the given date.
@@ -171,7 +209,13 @@ class _TemporalAdjusterForWeekday:
 		)
 
 	@staticmethod
-	@sequenceable(target='date')
+	@sequenceable(
+		target='date',
+		normalize={'weekday': normalize_weekday},
+		kernel=kernels.last_of_month,
+		preimage=preimages.period(month_start),
+		broadcast=('weekday',),
+	)
 	def last_of_month(weekday: Union[Weekday, ISOWeekday], date: DateT) -> DateT:
 		"""
 		Returns the last date of the given day of the week in the month of the given date.
@@ -190,7 +234,13 @@ class _TemporalAdjusterForWeekday:
 		)
 
 	@staticmethod
-	@sequenceable(target='date')
+	@sequenceable(
+		target='date',
+		normalize={'weekday': normalize_weekday},
+		kernel=kernels.last_of_next_month,
+		preimage=preimages.period(month_start, 1),
+		broadcast=('weekday',),
+	)
 	def last_of_next_month(weekday: Union[Weekday, ISOWeekday], date: DateT) -> DateT:
 		"""
 		Returns the last date of the given day of the week in the month after the month of the given date.
@@ -209,7 +259,13 @@ class _TemporalAdjusterForWeekday:
 		)
 
 	@staticmethod
-	@sequenceable(target='date')
+	@sequenceable(
+		target='date',
+		normalize={'weekday': normalize_weekday},
+		kernel=kernels.last_of_last_month,
+		preimage=preimages.period(month_start, -1),
+		broadcast=('weekday',),
+	)
 	def last_of_last_month(weekday: Union[Weekday, ISOWeekday], date: DateT) -> DateT:
 		"""
 		Returns the last date of the given day of the week in the month before the month of the given date.
@@ -228,7 +284,13 @@ class _TemporalAdjusterForWeekday:
 		)
 
 	@staticmethod
-	@sequenceable(target='date')
+	@sequenceable(
+		target='date',
+		normalize={'weekday': normalize_weekday},
+		kernel=kernels.first_of_year,
+		preimage=preimages.period(year_start),
+		broadcast=('weekday',),
+	)
 	def first_of_year(weekday: Union[Weekday, ISOWeekday], date: DateT) -> DateT:
 		"""
 		Returns the first date of the given day of the week in the year of the given date.
@@ -245,7 +307,13 @@ class _TemporalAdjusterForWeekday:
 		return date.replace(month=1, day=1) + relativedelta(weekday=weekday.value)
 
 	@staticmethod
-	@sequenceable(target='date')
+	@sequenceable(
+		target='date',
+		normalize={'weekday': normalize_weekday},
+		kernel=kernels.first_of_next_year,
+		preimage=preimages.period(year_start, 1),
+		broadcast=('weekday',),
+	)
 	def first_of_next_year(weekday: Union[Weekday, ISOWeekday], date: DateT) -> DateT:
 		"""
 		Returns the first date of the given day of the week in the year after the year of the given date.
@@ -264,7 +332,13 @@ class _TemporalAdjusterForWeekday:
 		)
 
 	@staticmethod
-	@sequenceable(target='date')
+	@sequenceable(
+		target='date',
+		normalize={'weekday': normalize_weekday},
+		kernel=kernels.first_of_last_year,
+		preimage=preimages.period(year_start, -1),
+		broadcast=('weekday',),
+	)
 	def first_of_last_year(weekday: Union[Weekday, ISOWeekday], date: DateT) -> DateT:
 		"""
 		Returns the first date of the given day of the week in the year before the year of the given date.
@@ -283,7 +357,13 @@ class _TemporalAdjusterForWeekday:
 		)
 
 	@staticmethod
-	@sequenceable(target='date')
+	@sequenceable(
+		target='date',
+		normalize={'weekday': normalize_weekday},
+		kernel=kernels.last_of_year,
+		preimage=preimages.period(year_start),
+		broadcast=('weekday',),
+	)
 	def last_of_year(weekday: Union[Weekday, ISOWeekday], date: DateT) -> DateT:
 		"""
 		Returns the last date of the given day of the week in the year of the given date.
@@ -300,7 +380,13 @@ class _TemporalAdjusterForWeekday:
 		return _TemporalAdjusterForWeekday.last(weekday, date.replace(month=12, day=31))
 
 	@staticmethod
-	@sequenceable(target='date')
+	@sequenceable(
+		target='date',
+		normalize={'weekday': normalize_weekday},
+		kernel=kernels.last_of_next_year,
+		preimage=preimages.period(year_start, 1),
+		broadcast=('weekday',),
+	)
 	def last_of_next_year(weekday: Union[Weekday, ISOWeekday], date: DateT) -> DateT:
 		"""
 		Returns the last date of the given day of the week in the year after the year of the given date.
@@ -319,7 +405,13 @@ class _TemporalAdjusterForWeekday:
 		)
 
 	@staticmethod
-	@sequenceable(target='date')
+	@sequenceable(
+		target='date',
+		normalize={'weekday': normalize_weekday},
+		kernel=kernels.last_of_last_year,
+		preimage=preimages.period(year_start, -1),
+		broadcast=('weekday',),
+	)
 	def last_of_last_year(weekday: Union[Weekday, ISOWeekday], date: DateT) -> DateT:
 		"""
 		Returns the last date of the given day of the week in the year before the year of the given date.
@@ -338,7 +430,13 @@ class _TemporalAdjusterForWeekday:
 		)
 
 	@staticmethod
-	@sequenceable(target='date')
+	@sequenceable(
+		target='date',
+		normalize={'weekday': normalize_weekday},
+		kernel=kernels.nth_from_date,
+		preimage=preimages.nth_from_date,
+		broadcast=('weekday', 'n'),
+	)
 	def nth_from_date(
 		weekday: Union[Weekday, ISOWeekday], date: DateT, n: int
 	) -> DateT:
@@ -362,7 +460,13 @@ class _TemporalAdjusterForWeekday:
 		return date + relativedelta(weekday=weekday.value, weeks=n - 1)
 
 	@staticmethod
-	@sequenceable(target='date')
+	@sequenceable(
+		target='date',
+		normalize={'weekday': normalize_weekday},
+		kernel=kernels.nth_of_month,
+		preimage=preimages.period(month_start),
+		broadcast=('weekday', 'n'),
+	)
 	def nth_of_month(weekday: Union[Weekday, ISOWeekday], date: DateT, n: int) -> DateT:
 		"""
 		Returns the nth date of the given day of the week in the month of the given date.
@@ -396,7 +500,13 @@ class _TemporalAdjusterForWeekday:
 		return output_date
 
 	@staticmethod
-	@sequenceable(target='date')
+	@sequenceable(
+		target='date',
+		normalize={'weekday': normalize_weekday},
+		kernel=kernels.nth_of_year,
+		preimage=preimages.period(year_start),
+		broadcast=('weekday', 'n'),
+	)
 	def nth_of_year(weekday: Union[Weekday, ISOWeekday], date: DateT, n: int) -> DateT:
 		"""
 		Returns the nth date of the given day of the week in the year of the given date.
@@ -0,0 +1,179 @@
+from collections import deque
+from datetime import date as Date
+from typing import Callable, Deque, Optional, Tuple, Union
+
+import numpy as np
+
+from .common.decorators import BoundAdjuster
+from .common.types import DateT
+
+# The number of periods, other than the current one, kept for the events that arrive late.
+DEFAULT_HISTORY = 4
+
+# A period of the stream: the first and last ordinals of the dates adjusted to the same date, and that date, as an ordinal and as a `date`.
+_Period = Tuple[int, int, int, Date]
+
+_NO_PERIOD: _Period = (1, 0, 0, Date.min)
+
+# The ordinal of 1970-01-01, the first day of the day numbers of `np.datetime64[D]`.
+_EPOCH_ORDINAL = Date(1970, 1, 1).toordinal()
+
+
+class StreamingAdjuster:
+	"""
+	A stateful adjuster for streams of single dates, such as the timestamps of events, which remembers the period of dates adjusted to the same date as the last event, such as the week of its Monday for `first_day_of_week`, or the month of its last Friday for `last_of_month`. Events of the current period are adjusted by comparing their day with the bounds of the period, and the adjuster is only called, and the period recomputed from its preimage (see `BoundAdjuster.preimage`), when an event crosses a boundary.
+
+	Events may arrive out of order: the periods of the last events are kept, so that late events are adjusted from their own period, and the results are the same as the ones of the adjuster whatever the order of the events. Adjusters without a preimage are cached per day.
+
+	Examples:
+
+	```
+	>>> from datetime import datetime
+
+	>>> from temporal_adjuster import StreamingAdjuster, TemporalAdjuster
+
+	>>> week_start = StreamingAdjuster(TemporalAdjuster.first_day_of_week)
+	>>> week_start(datetime(2024, 6, 13, 10, 30))
+	datetime.datetime(2024, 6, 10, 10, 30)
+
+	>>> week_start.period
+	(datetime.date(2024, 6, 10), datetime.date(2024, 6, 16))
+
+	```
+	"""
+
+	__slots__ = ('__adjuster', '__current', '__history')
+
+	def __init__(
+		self,
+		adjuster: Union[BoundAdjuster, Callable],
+		history: int = DEFAULT_HISTORY,
+	) -> None:
+		"""
+		Args:
+		    adjuster (Union[BoundAdjuster, Callable]): The bound adjuster, such as `TemporalAdjuster.last_of_month.bind(Weekday.FRIDAY)`, or an adjuster that only takes the date, such as `TemporalAdjuster.first_day_of_week`.
+		    history (int): The number of periods, other than the current one, kept for late events.
+
+		Raises:
+		    TypeError: If the adjuster takes other arguments than the date, or adjusts the time of the day.
+		    ValueError: If the history is negative.
+		"""
+		if history < 0:
+			raise ValueError(f'The history must not be negative, but is {history}.')
+
+		adjuster = adjuster if isinstance(adjuster, BoundAdjuster) else adjuster.bind()
+
+		# The periods are ranges of days, whose dates keep their time of the day.
+		if getattr(adjuster.adjuster, 'time_of_day', False):
+			raise TypeError(
+				f'{adjuster.adjuster.__name__} adjusts the time of the day, which cannot be streamed.'
+			)
+
+		self.__adjuster = adjuster
+		self.__current = _NO_PERIOD
+		self.__history: Deque[_Period] = deque(maxlen=history)
+
+	@property
+	def adjuster(self) -> BoundAdjuster:
+		"""
+		The bound adjuster applied to the events.
+		"""
+		return self.__adjuster
+
+	@property
+	def period(self) -> Optional[Tuple[Date, Date]]:
+		"""
+		The first and last dates of the current period, included, or None before the first event.
+		"""
+		first, last, _, _ = self.__current
+
+		if first > last:
+			return None
+
+		return Date.fromordinal(first), Date.fromordinal(last)
+
+	def __call__(self, date: DateT) -> DateT:
+		"""
+		Adjusts the given date.
+
+		Args:
+		    date (DateT): The date of the event, which may also be a `np.datetime64` value.
+
+		Returns:
+		    DateT: The adjusted date.
+		"""
+		is_datetime64 = isinstance(date, np.datetime64)
+
+		if is_datetime64:
+			if np.isnat(date):
+				return date
+
+			day = int(date.astype('datetime64[D]').astype(np.int64)) + _EPOCH_ORDINAL
+
+		else:
+			day = date.toordinal()
+
+		first, last, adjusted, adjusted_date = self.__current
+
+		if not first <= day <= last:
+			first, last, adjusted, adjusted_date = self.__find_period(day)
+
+		if type(date) is Date:
+			return adjusted_date
+
+		if is_datetime64:
+			return date + np.timedelta64(adjusted - day, 'D')
+
+		# Only the day is moved, so that times of the day are kept on the wall clock of their time zone, as with the adjuster.
+		moved = date.replace(
+			year=adjusted_date.year, month=adjusted_date.month, day=adjusted_date.day
+		)
+
+		# Timestamps moved into a gap of a daylight saving time transition get the wall time of the instant they hold, as with the adjuster.
+		if getattr(moved, 'tz', None) is not None:
+			return moved.tz_convert(moved.tz)
+
+		return moved
+
+	def __find_period(self, day: int) -> _Period:
+		"""
+		Makes the period of the given day the current one, from the history of the stream if it holds it, or from the adjuster otherwise.
+		"""
+		history = self.__history
+
+		for index, period in enumerate(history):
+			if period[0] <= day <= period[1]:
+				del history[index]
+				break
+
+		else:
+			period = self.__compute_period(day)
+
+		if self.__current[0] <= self.__current[1]:
+			history.appendleft(self.__current)
+
+		self.__current = period
+
+		return period
+
+	def __compute_period(self, day: int) -> _Period:
+		"""
+		Adjusts the given day, and returns the period of the dates adjusted to the same date. The adjusters streamed only move days, so the day of an event is adjusted as a `date`, whatever its type.
+		"""
+		adjusted_date = self.__adjuster(Date.fromordinal(day))
+		adjusted = adjusted_date.toordinal()
+
+		try:
+			intervals = self.__adjuster.preimage(adjusted_date)
+
+		except NotImplementedError:
+			return day, day, adjusted, adjusted_date
+
+		for first, last in intervals:
+			if first.toordinal() <= day <= last.toordinal():
+				return first.toordinal(), last.toordinal(), adjusted, adjusted_date
+
+		return day, day, adjusted, adjusted_date
+
+	def __repr__(self) -> str:
+		return f'StreamingAdjuster({self.__adjuster!r})'
@@ -0,0 +1,52 @@
+from datetime import date as Date
+from typing import Callable, Optional, Tuple, Union
+
+from .common.decorators import BoundAdjuster
+from .common.types import DateT
+
+DEFAULT_HISTORY: int
+
+class StreamingAdjuster:
+	"""
+	A stateful adjuster for streams of single dates, such as the timestamps of events, which remembers the period of dates adjusted to the same date as the last event, such as the week of its Monday for `first_day_of_week`, or the month of its last Friday for `last_of_month`. Events of the current period are adjusted by comparing their day with the bounds of the period, and the adjuster is only called, and the period recomputed from its preimage (see `BoundAdjuster.preimage`), when an event crosses a boundary.
+
+	Events may arrive out of order: the periods of the last events are kept, so that late events are adjusted from their own period, and the results are the same as the ones of the adjuster whatever the order of the events. Adjusters without a preimage are cached per day.
+	"""
+
+	def __init__(
+		self,
+		adjuster: Union[BoundAdjuster, Callable],
+		history: int = ...,
+	) -> None:
+		"""
+		Args:
+		    adjuster (Union[BoundAdjuster, Callable]): The bound adjuster, such as `TemporalAdjuster.last_of_month.bind(Weekday.FRIDAY)`, or an adjuster that only takes the date, such as `TemporalAdjuster.first_day_of_week`.
+		    history (int): The number of periods, other than the current one, kept for late events.
+
+		Raises:
+		    TypeError: If the adjuster takes other arguments than the date, or adjusts the time of the day.
+		    ValueError: If the history is negative.
+		"""
+
+	@property
+	def adjuster(self) -> BoundAdjuster:
+		"""
+		The bound adjuster applied to the events.
+		"""
+
+	@property
+	def period(self) -> Optional[Tuple[Date, Date]]:
+		"""
+		The first and last dates of the current period, included, or None before the first event.
+		"""
+
+	def __call__(self, date: DateT) -> DateT:
+		"""
+		Adjusts the given date.
+
+		Args:
+		    date (DateT): The date of the event, which may also be a `np.datetime64` value.
+
+		Returns:
+		    DateT: The adjusted date.
+		"""
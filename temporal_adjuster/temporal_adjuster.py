@@ -1,8 +1,26 @@
-from .modules import _TemporalAdjusterForFirstAndLastDays, _TemporalAdjusterForWeekday
+from typing import ContextManager, Optional
+
+from .common.parallel import DEFAULT_CHUNK_SIZE, threads
+from .common.profiling import BatchProfile, profile
+from .modules import (
+	_TemporalAdjusterForBuckets,
+	_TemporalAdjusterForDateDimension,
+	_TemporalAdjusterForFirstAndLastDays,
+	_TemporalAdjusterForISOWeeks,
+	_TemporalAdjusterForQuarters,
+	_TemporalAdjusterForTimeOfDay,
+	_TemporalAdjusterForWeekday,
+)
 
 
 class TemporalAdjuster(
-	_TemporalAdjusterForFirstAndLastDays, _TemporalAdjusterForWeekday
+	_TemporalAdjusterForFirstAndLastDays,
+	_TemporalAdjusterForWeekday,
+	_TemporalAdjusterForQuarters,
+	_TemporalAdjusterForISOWeeks,
+	_TemporalAdjusterForBuckets,
+	_TemporalAdjusterForDateDimension,
+	_TemporalAdjusterForTimeOfDay,
 ):
 	"""
 	This class provides tools that help pinpoint very specific moments in time, without having to manually count days, weeks, or months. In essence, a Temporal Adjuster is a function that encapsulates a specific date/time manipulation rule. It operates on a temporal object (representing a date, time, or datetime) to produce a new temporal object adjusted according to the rule. This class provides a set of predefined temporal adjusters that can be used to adjust a temporal object in various ways.
@@ -30,4 +48,44 @@ class TemporalAdjuster(
 	```
 	"""
 
-	pass
+	@staticmethod
+	def profile() -> ContextManager[BatchProfile]:
+		"""
+		Returns a context manager that splits the time of every batch call made inside it into phases: argument binding, weekday normalization, container conversion, the compute loop and the rebuilding of the output container.
+
+		Returns:
+		    ContextManager[BatchProfile]: A context manager that yields the profile being filled.
+
+		Examples:
+
+		```
+		>>> from datetime import date
+
+		>>> with TemporalAdjuster.profile() as p:
+		...     _ = TemporalAdjuster.first_day_of_next_week([date(2021, 1, 1)])
+
+		>>> p.calls
+		{'first_day_of_next_week': 1}
+
+		```
+		"""
+		return profile()
+
+	@staticmethod
+	def threads(
+		max_workers: Optional[int] = None,
+		chunk_size: int = DEFAULT_CHUNK_SIZE,
+		enabled: bool = True,
+	) -> ContextManager[None]:
+		"""
+		Returns a context manager that runs the vectorized kernels of the batch calls made inside it on a pool of threads. Arrays spanning at least two chunks are split into cache-sized chunks, which are adjusted in parallel, as NumPy releases the GIL while computing. Use `temporal_adjuster.common.parallel.set_threads` to enable it for the whole process.
+
+		Args:
+		    max_workers (Optional[int]): The number of threads. Defaults to the number of CPUs.
+		    chunk_size (int): The number of items adjusted by each task.
+		    enabled (bool): Whether to enable multi-threading.
+
+		Returns:
+		    ContextManager[None]: A context manager that enables multi-threading.
+		"""
+		return threads(max_workers, chunk_size, enabled)
@@ -1,6 +1,13 @@
 from .common.enums import ISOWeekday as ISOWeekday, Weekday as Weekday
+from .common.profiling import BatchProfile as BatchProfile
 from .common.types import DateT as DateT
-from typing import Sequence
+from .modules.period_buckets import PeriodDecoder as PeriodDecoder
+from typing import ContextManager, Dict, Iterable, Literal, Sequence, Tuple
+
+import datetime
+from datetime import time as Time
+
+import numpy as np
 
 class TemporalAdjuster:
 	"""
@@ -30,12 +37,52 @@ class TemporalAdjuster:
 	"""
 
 	@staticmethod
-	def first_day_of_week(date: DateT | Sequence[DateT]) -> DateT | Sequence[DateT]:
+	def profile() -> ContextManager[BatchProfile]:
+		"""
+		Returns a context manager that splits the time of every batch call made inside it into phases: argument binding, weekday normalization, container conversion, the compute loop and the rebuilding of the output container.
+
+		Returns:
+		    ContextManager[BatchProfile]: A context manager that yields the profile being filled.
+		"""
+
+	@staticmethod
+	def threads(
+		max_workers: int | None = None,
+		chunk_size: int = ...,
+		enabled: bool = True,
+	) -> ContextManager[None]:
 		"""
-		Returns the first day of the week of the given date. The week starts on Monday.
+		Returns a context manager that runs the vectorized kernels of the batch calls made inside it on a pool of threads. Arrays spanning at least two chunks are split into cache-sized chunks, which are adjusted in parallel, as NumPy releases the GIL while computing. Use `temporal_adjuster.common.parallel.set_threads` to enable it for the whole process.
+
+		Args:
+		    max_workers (int | None): The number of threads. Defaults to the number of CPUs.
+		    chunk_size (int): The number of items adjusted by each task.
+		    enabled (bool): Whether to enable multi-threading.
+
+		Returns:
+		    ContextManager[None]: A context manager that enables multi-threading.
+		"""
+
+	@staticmethod
+	def first_day_of_week(
+		date: DateT | Sequence[DateT],
+		week_start: Weekday | ISOWeekday | str | int | None = None,
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
+	) -> DateT | Sequence[DateT]:
+		"""
+		Returns the first day of the week of the given date. The week starts on Monday, unless another week start is given or set.
 
 		Args:
 		    date (DateT): The date to adjust.
+		    week_start (Weekday | ISOWeekday | str | int | None): The first day of the weeks. Defaults to the current week start (see `get_week_start`), which is Monday unless set otherwise.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
 
 		Returns:
 		    DateT: The first day of the week of the given date.
@@ -44,12 +91,23 @@ class TemporalAdjuster:
 	@staticmethod
 	def first_day_of_next_week(
 		date: DateT | Sequence[DateT],
+		week_start: Weekday | ISOWeekday | str | int | None = None,
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
 	) -> DateT | Sequence[DateT]:
 		"""
-		Returns the first day of the next week of the given date. The week starts on Monday.
+		Returns the first day of the next week of the given date. The week starts on Monday, unless another week start is given or set.
 
 		Args:
 		    date (DateT): The date to adjust.
+		    week_start (Weekday | ISOWeekday | str | int | None): The first day of the weeks. Defaults to the current week start (see `get_week_start`), which is Monday unless set otherwise.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
 
 		Returns:
 		    DateT: The first day of the next week of the given date.
@@ -58,24 +116,46 @@ class TemporalAdjuster:
 	@staticmethod
 	def first_day_of_last_week(
 		date: DateT | Sequence[DateT],
+		week_start: Weekday | ISOWeekday | str | int | None = None,
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
 	) -> DateT | Sequence[DateT]:
 		"""
-		Returns the first day of the last week of the given date. The week starts on Monday.
+		Returns the first day of the last week of the given date. The week starts on Monday, unless another week start is given or set.
 
 		Args:
 		    date (DateT): The date to adjust.
+		    week_start (Weekday | ISOWeekday | str | int | None): The first day of the weeks. Defaults to the current week start (see `get_week_start`), which is Monday unless set otherwise.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
 
 		Returns:
 		    DateT: The first day of the next week of the given date.
 		"""
 
 	@staticmethod
-	def first_day_of_month(date: DateT | Sequence[DateT]) -> DateT | Sequence[DateT]:
+	def first_day_of_month(
+		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
+	) -> DateT | Sequence[DateT]:
 		"""
 		Returns the first day of the month of the given date.
 
 		Args:
 		    date (DateT): The date to adjust.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
 
 		Returns:
 		    DateT: The first day of the month of the given date.
@@ -84,12 +164,21 @@ class TemporalAdjuster:
 	@staticmethod
 	def first_day_of_next_month(
 		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
 	) -> DateT | Sequence[DateT]:
 		"""
 		Returns the first day of the next month of the given date.
 
 		Args:
 		    date (DateT): The date to adjust.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
 
 		Returns:
 		    DateT: The first day of the next month of the given date.
@@ -98,24 +187,44 @@ class TemporalAdjuster:
 	@staticmethod
 	def first_day_of_last_month(
 		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
 	) -> DateT | Sequence[DateT]:
 		"""
 		Returns the first day of the last month of the given date.
 
 		Args:
 		    date (DateT): The date to adjust.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
 
 		Returns:
 		    DateT: The first day of the next month of the given date.
 		"""
 
 	@staticmethod
-	def first_day_of_year(date: DateT | Sequence[DateT]) -> DateT | Sequence[DateT]:
+	def first_day_of_year(
+		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
+	) -> DateT | Sequence[DateT]:
 		"""
 		Returns the first day of the year of the given date.
 
 		Args:
 		    date (DateT): The date to adjust.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
 
 		Returns:
 		    DateT: The first day of the year of the given date.
@@ -124,12 +233,21 @@ class TemporalAdjuster:
 	@staticmethod
 	def first_day_of_next_year(
 		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
 	) -> DateT | Sequence[DateT]:
 		"""
 		Returns the first day of the next year of the given date.
 
 		Args:
 		    date (DateT): The date to adjust.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
 
 		Returns:
 		    DateT: The first day of the next year of the given date.
@@ -138,60 +256,119 @@ class TemporalAdjuster:
 	@staticmethod
 	def first_day_of_last_year(
 		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
 	) -> DateT | Sequence[DateT]:
 		"""
 		Returns the first day of the last year of the given date.
 
 		Args:
 		    date (DateT): The date to adjust.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
 
 		Returns:
 		    DateT: The first day of the next year of the given date.
 		"""
 
 	@staticmethod
-	def last_day_of_week(date: DateT | Sequence[DateT]) -> DateT | Sequence[DateT]:
+	def last_day_of_week(
+		date: DateT | Sequence[DateT],
+		week_start: Weekday | ISOWeekday | str | int | None = None,
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
+	) -> DateT | Sequence[DateT]:
 		"""
-		Returns the last day of the week of the given date. The week ends on Sunday.
+		Returns the last day of the week of the given date. The week ends on Sunday, unless another week start is given or set.
 
 		Args:
 		    date (DateT): The date to adjust.
+		    week_start (Weekday | ISOWeekday | str | int | None): The first day of the weeks. Defaults to the current week start (see `get_week_start`), which is Monday unless set otherwise.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
 
 		Returns:
 		    DateT: The last day of the week of the given date.
 		"""
 
 	@staticmethod
-	def last_day_of_next_week(date: DateT | Sequence[DateT]) -> DateT | Sequence[DateT]:
+	def last_day_of_next_week(
+		date: DateT | Sequence[DateT],
+		week_start: Weekday | ISOWeekday | str | int | None = None,
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
+	) -> DateT | Sequence[DateT]:
 		"""
-		Returns the last day of the next week of the given date. The week ends on Sunday.
+		Returns the last day of the next week of the given date. The week ends on Sunday, unless another week start is given or set.
 
 		Args:
 		    date (DateT): The date to adjust.
+		    week_start (Weekday | ISOWeekday | str | int | None): The first day of the weeks. Defaults to the current week start (see `get_week_start`), which is Monday unless set otherwise.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
 
 		Returns:
 		    DateT: The last day of the next week of the given date.
 		"""
 
 	@staticmethod
-	def last_day_of_last_week(date: DateT | Sequence[DateT]) -> DateT | Sequence[DateT]:
+	def last_day_of_last_week(
+		date: DateT | Sequence[DateT],
+		week_start: Weekday | ISOWeekday | str | int | None = None,
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
+	) -> DateT | Sequence[DateT]:
 		"""
-		Returns the last day of the last week of the given date. The week ends on Sunday.
+		Returns the last day of the last week of the given date. The week ends on Sunday, unless another week start is given or set.
 
 		Args:
 		    date (DateT): The date to adjust.
+		    week_start (Weekday | ISOWeekday | str | int | None): The first day of the weeks. Defaults to the current week start (see `get_week_start`), which is Monday unless set otherwise.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
 
 		Returns:
 		    DateT: The last day of the last week of the given date.
 		"""
 
 	@staticmethod
-	def last_day_of_month(date: DateT | Sequence[DateT]) -> DateT | Sequence[DateT]:
+	def last_day_of_month(
+		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
+	) -> DateT | Sequence[DateT]:
 		"""
 		Returns the last day of the month of the given date.
 
 		Args:
 		    date (DateT): The date to adjust.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
 
 		Returns:
 		    DateT: The last day of the month of the given date.
@@ -200,12 +377,21 @@ class TemporalAdjuster:
 	@staticmethod
 	def last_day_of_next_month(
 		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
 	) -> DateT | Sequence[DateT]:
 		"""
 		Returns the last day of the next month of the given date.
 
 		Args:
 		    date (DateT): The date to adjust.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
 
 		Returns:
 		    DateT: The last day of the next month of the given date.
@@ -214,48 +400,90 @@ class TemporalAdjuster:
 	@staticmethod
 	def last_day_of_last_month(
 		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
 	) -> DateT | Sequence[DateT]:
 		"""
 		Returns the last day of the last month of the given date.
 
 		Args:
 		    date (DateT): The date to adjust.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
 
 		Returns:
 		    DateT: The last day of the last month of the given date.
 		"""
 
 	@staticmethod
-	def last_day_of_year(date: DateT | Sequence[DateT]) -> DateT | Sequence[DateT]:
+	def last_day_of_year(
+		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
+	) -> DateT | Sequence[DateT]:
 		"""
 		Returns the last day of the year of the given date.
 
 		Args:
 		    date (DateT): The date to adjust.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
 
 		Returns:
 		    DateT: The last day of the year of the given date.
 		"""
 
 	@staticmethod
-	def last_day_of_next_year(date: DateT | Sequence[DateT]) -> DateT | Sequence[DateT]:
+	def last_day_of_next_year(
+		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
+	) -> DateT | Sequence[DateT]:
 		"""
 		Returns the last day of the next year of the given date.
 
 		Args:
 		    date (DateT): The date to adjust.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
 
 		Returns:
 		    DateT: The last day of the next year of the given date.
 		"""
 
 	@staticmethod
-	def last_day_of_last_year(date: DateT | Sequence[DateT]) -> DateT | Sequence[DateT]:
+	def last_day_of_last_year(
+		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
+	) -> DateT | Sequence[DateT]:
 		"""
 		Returns the last day of the last year of the given date.
 
 		Args:
 		    date (DateT): The date to adjust.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
 
 		Returns:
 		    DateT: The last day of the last year of the given date.
@@ -263,14 +491,24 @@ class TemporalAdjuster:
 
 	@staticmethod
 	def next(
-		weekday: Weekday | ISOWeekday, date: DateT | Sequence[DateT]
+		weekday: Weekday | ISOWeekday | Sequence[Weekday | ISOWeekday | str | int],
+		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
 	) -> DateT | Sequence[DateT]:
 		"""
 		Returns the next date of the given day of the week.
 
 		Args:
-		    weekday (Weekday): The day of the week.
+		    weekday (Weekday): The day of the week. In batch calls, a sequence of days of the week may be given, one per date.
 		    date (DateT): The reference date.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
 
 		Returns:
 		    DateT: The next date of the given day of the week.
@@ -278,14 +516,24 @@ class TemporalAdjuster:
 
 	@staticmethod
 	def next_or_same(
-		weekday: Weekday | ISOWeekday, date: DateT | Sequence[DateT]
+		weekday: Weekday | ISOWeekday | Sequence[Weekday | ISOWeekday | str | int],
+		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
 	) -> DateT | Sequence[DateT]:
 		"""
 		Returns the next date of the given day of the week. If the given date is the same day of the week, the given date is returned.
 
 		Args:
-		    weekday (Weekday): The day of the week.
+		    weekday (Weekday): The day of the week. In batch calls, a sequence of days of the week may be given, one per date.
 		    date (DateT): The reference date.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
 
 		Returns:
 		    DateT: The next date of the given day of the week.
@@ -293,14 +541,24 @@ class TemporalAdjuster:
 
 	@staticmethod
 	def last(
-		weekday: Weekday | ISOWeekday, date: DateT | Sequence[DateT]
+		weekday: Weekday | ISOWeekday | Sequence[Weekday | ISOWeekday | str | int],
+		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
 	) -> DateT | Sequence[DateT]:
 		"""
 		Returns the last date of the given day of the week.
 
 		Args:
-		    weekday (Weekday): The day of the week.
+		    weekday (Weekday): The day of the week. In batch calls, a sequence of days of the week may be given, one per date.
 		    date (DateT): The reference date.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
 
 		Returns:
 		    DateT: The last date of the given day of the week.
@@ -308,14 +566,24 @@ class TemporalAdjuster:
 
 	@staticmethod
 	def last_or_same(
-		weekday: Weekday | ISOWeekday, date: DateT | Sequence[DateT]
+		weekday: Weekday | ISOWeekday | Sequence[Weekday | ISOWeekday | str | int],
+		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
 	) -> DateT | Sequence[DateT]:
 		"""
 		Returns the last date of the given day of the week. If the given date is the same day of the week, the given date is returned.
 
 		Args:
-		    weekday (Weekday): The day of the week.
+		    weekday (Weekday): The day of the week. In batch calls, a sequence of days of the week may be given, one per date.
 		    date (DateT): The reference date.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
 
 		Returns:
 		    DateT: The last date of the given day of the week.
@@ -323,14 +591,24 @@ class TemporalAdjuster:
 
 	@staticmethod
 	def first_of_month(
-		weekday: Weekday | ISOWeekday, date: DateT | Sequence[DateT]
+		weekday: Weekday | ISOWeekday | Sequence[Weekday | ISOWeekday | str | int],
+		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
 	) -> DateT | Sequence[DateT]:
 		"""
 		Returns the first date of the given day of the week in the month of the given date.
 
 		Args:
-		    weekday (Weekday): The day of the week.
+		    weekday (Weekday): The day of the week. In batch calls, a sequence of days of the week may be given, one per date.
 		    date (DateT): The reference date.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
 
 		Returns:
 		    DateT: The first date of the given day of the week in the month of the given date.
@@ -338,14 +616,24 @@ class TemporalAdjuster:
 
 	@staticmethod
 	def first_of_next_month(
-		weekday: Weekday | ISOWeekday, date: DateT | Sequence[DateT]
+		weekday: Weekday | ISOWeekday | Sequence[Weekday | ISOWeekday | str | int],
+		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
 	) -> DateT | Sequence[DateT]:
 		"""
 		Returns the first date of the given day of the week in the month after the month of the given date.
 
 		Args:
-		    weekday (Weekday): The day of the week.
+		    weekday (Weekday): The day of the week. In batch calls, a sequence of days of the week may be given, one per date.
 		    date (DateT): The reference date.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
 
 		Returns:
 		    DateT: The first date of the given day of the week in the month after the month of the given date.
@@ -353,14 +641,24 @@ class TemporalAdjuster:
 
 	@staticmethod
 	def first_of_last_month(
-		weekday: Weekday | ISOWeekday, date: DateT | Sequence[DateT]
+		weekday: Weekday | ISOWeekday | Sequence[Weekday | ISOWeekday | str | int],
+		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
 	) -> DateT | Sequence[DateT]:
 		"""
 		Returns the first date of the given day of the week in the month before the month of the given date.
 
 		Args:
-		    weekday (Weekday): The day of the week.
+		    weekday (Weekday): The day of the week. In batch calls, a sequence of days of the week may be given, one per date.
 		    date (DateT): The reference date.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
 
 		Returns:
 		    DateT: The first date of the given day of the week in the month before the month of the given date.
@@ -368,14 +666,24 @@ class TemporalAdjuster:
 
 	@staticmethod
 	def last_of_month(
-		weekday: Weekday | ISOWeekday, date: DateT | Sequence[DateT]
+		weekday: Weekday | ISOWeekday | Sequence[Weekday | ISOWeekday | str | int],
+		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
 	) -> DateT | Sequence[DateT]:
 		"""
 		Returns the last date of the given day of the week in the month of the given date.
 
 		Args:
-		    weekday (Weekday): The day of the week.
+		    weekday (Weekday): The day of the week. In batch calls, a sequence of days of the week may be given, one per date.
 		    date (DateT): The reference date.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
 
 		Returns:
 		    DateT: The last date of the given day of the week in the month of the given date.
@@ -383,14 +691,24 @@ class TemporalAdjuster:
 
 	@staticmethod
 	def last_of_next_month(
-		weekday: Weekday | ISOWeekday, date: DateT | Sequence[DateT]
+		weekday: Weekday | ISOWeekday | Sequence[Weekday | ISOWeekday | str | int],
+		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
 	) -> DateT | Sequence[DateT]:
 		"""
 		Returns the last date of the given day of the week in the month after the month of the given date.
 
 		Args:
-		    weekday (Weekday): The day of the week.
+		    weekday (Weekday): The day of the week. In batch calls, a sequence of days of the week may be given, one per date.
 		    date (DateT): The reference date.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
 
 		Returns:
 		    DateT: The last date of the given day of the week in the month after the month of the given date.
@@ -398,14 +716,24 @@ class TemporalAdjuster:
 
 	@staticmethod
 	def last_of_last_month(
-		weekday: Weekday | ISOWeekday, date: DateT | Sequence[DateT]
+		weekday: Weekday | ISOWeekday | Sequence[Weekday | ISOWeekday | str | int],
+		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
 	) -> DateT | Sequence[DateT]:
 		"""
 		Returns the last date of the given day of the week in the month before the month of the given date.
 
 		Args:
-		    weekday (Weekday): The day of the week.
+		    weekday (Weekday): The day of the week. In batch calls, a sequence of days of the week may be given, one per date.
 		    date (DateT): The reference date.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
 
 		Returns:
 		    DateT: The last date of the given day of the week in the month before the month of the given date.
@@ -413,14 +741,24 @@ class TemporalAdjuster:
 
 	@staticmethod
 	def first_of_year(
-		weekday: Weekday | ISOWeekday, date: DateT | Sequence[DateT]
+		weekday: Weekday | ISOWeekday | Sequence[Weekday | ISOWeekday | str | int],
+		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
 	) -> DateT | Sequence[DateT]:
 		"""
 		Returns the first date of the given day of the week in the year of the given date.
 
 		Args:
-		    weekday (Weekday): The day of the week.
+		    weekday (Weekday): The day of the week. In batch calls, a sequence of days of the week may be given, one per date.
 		    date (DateT): The reference date.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
 
 		Returns:
 		    DateT: The first date of the given day of the week in the year of the given date.
@@ -428,14 +766,24 @@ class TemporalAdjuster:
 
 	@staticmethod
 	def first_of_next_year(
-		weekday: Weekday | ISOWeekday, date: DateT | Sequence[DateT]
+		weekday: Weekday | ISOWeekday | Sequence[Weekday | ISOWeekday | str | int],
+		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
 	) -> DateT | Sequence[DateT]:
 		"""
 		Returns the first date of the given day of the week in the year after the year of the given date.
 
 		Args:
-		    weekday (Weekday): The day of the week.
+		    weekday (Weekday): The day of the week. In batch calls, a sequence of days of the week may be given, one per date.
 		    date (DateT): The reference date.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
 
 		Returns:
 		    DateT: The first date of the given day of the week in the year after the year of the given date.
@@ -443,14 +791,24 @@ class TemporalAdjuster:
 
 	@staticmethod
 	def first_of_last_year(
-		weekday: Weekday | ISOWeekday, date: DateT | Sequence[DateT]
+		weekday: Weekday | ISOWeekday | Sequence[Weekday | ISOWeekday | str | int],
+		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
 	) -> DateT | Sequence[DateT]:
 		"""
 		Returns the first date of the given day of the week in the year before the year of the given date.
 
 		Args:
-		    weekday (Weekday): The day of the week.
+		    weekday (Weekday): The day of the week. In batch calls, a sequence of days of the week may be given, one per date.
 		    date (DateT): The reference date.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
 
 		Returns:
 		    DateT: The first date of the given day of the week in the year before the year of the given date.
@@ -458,14 +816,24 @@ class TemporalAdjuster:
 
 	@staticmethod
 	def last_of_year(
-		weekday: Weekday | ISOWeekday, date: DateT | Sequence[DateT]
+		weekday: Weekday | ISOWeekday | Sequence[Weekday | ISOWeekday | str | int],
+		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
 	) -> DateT | Sequence[DateT]:
 		"""
 		Returns the last date of the given day of the week in the year of the given date.
 
 		Args:
-		    weekday (Weekday): The day of the week.
+		    weekday (Weekday): The day of the week. In batch calls, a sequence of days of the week may be given, one per date.
 		    date (DateT): The reference date.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
 
 		Returns:
 		    DateT: The last date of the given day of the week in the year of the given date.
@@ -473,14 +841,24 @@ class TemporalAdjuster:
 
 	@staticmethod
 	def last_of_next_year(
-		weekday: Weekday | ISOWeekday, date: DateT | Sequence[DateT]
+		weekday: Weekday | ISOWeekday | Sequence[Weekday | ISOWeekday | str | int],
+		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
 	) -> DateT | Sequence[DateT]:
 		"""
 		Returns the last date of the given day of the week in the year after the year of the given date.
 
 		Args:
-		    weekday (Weekday): The day of the week.
+		    weekday (Weekday): The day of the week. In batch calls, a sequence of days of the week may be given, one per date.
 		    date (DateT): The reference date.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
 
 		Returns:
 		    DateT: The last date of the given day of the week in the year after the year of the given date.
@@ -488,14 +866,24 @@ class TemporalAdjuster:
 
 	@staticmethod
 	def last_of_last_year(
-		weekday: Weekday | ISOWeekday, date: DateT | Sequence[DateT]
+		weekday: Weekday | ISOWeekday | Sequence[Weekday | ISOWeekday | str | int],
+		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
 	) -> DateT | Sequence[DateT]:
 		"""
 		Returns the last date of the given day of the week in the year before the year of the given date.
 
 		Args:
-		    weekday (Weekday): The day of the week.
+		    weekday (Weekday): The day of the week. In batch calls, a sequence of days of the week may be given, one per date.
 		    date (DateT): The reference date.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
 
 		Returns:
 		    DateT: The last date of the given day of the week in the year before the year of the given date.
@@ -503,15 +891,26 @@ class TemporalAdjuster:
 
 	@staticmethod
 	def nth_from_date(
-		weekday: Weekday | ISOWeekday, date: DateT | Sequence[DateT], n: int
+		weekday: Weekday | ISOWeekday | Sequence[Weekday | ISOWeekday | str | int],
+		date: DateT | Sequence[DateT],
+		n: int | Sequence[int],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
 	) -> DateT | Sequence[DateT]:
 		"""
 		Returns the nth date of the given day of the week from the given date.
 
 		Args:
-		    weekday (Weekday): The day of the week.
+		    weekday (Weekday): The day of the week. In batch calls, a sequence of days of the week may be given, one per date.
 		    date (DateT): The reference date.
-		    n (int): The nth occurrence of the given day of the week.
+		    n (int): The nth occurrence of the given day of the week. In batch calls, a sequence of occurrences may be given, one per date.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
 
 		Raises:
 		    ValueError: If n is less than 1 or greater than 5.
@@ -523,15 +922,26 @@ class TemporalAdjuster:
 
 	@staticmethod
 	def nth_of_month(
-		weekday: Weekday | ISOWeekday, date: DateT | Sequence[DateT], n: int
+		weekday: Weekday | ISOWeekday | Sequence[Weekday | ISOWeekday | str | int],
+		date: DateT | Sequence[DateT],
+		n: int | Sequence[int],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
 	) -> DateT | Sequence[DateT]:
 		"""
 		Returns the nth date of the given day of the week in the month of the given date.
 
 		Args:
-		    weekday (Weekday): The day of the week.
+		    weekday (Weekday): The day of the week. In batch calls, a sequence of days of the week may be given, one per date.
 		    date (DateT): The reference date.
-		    n (int): The nth occurrence of the given day of the week.
+		    n (int): The nth occurrence of the given day of the week. In batch calls, a sequence of occurrences may be given, one per date.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
 
 		Raises:
 		    ValueError: If n is less than 1 or greater than 5.
@@ -543,15 +953,26 @@ class TemporalAdjuster:
 
 	@staticmethod
 	def nth_of_year(
-		weekday: Weekday | ISOWeekday, date: DateT | Sequence[DateT], n: int
+		weekday: Weekday | ISOWeekday | Sequence[Weekday | ISOWeekday | str | int],
+		date: DateT | Sequence[DateT],
+		n: int | Sequence[int],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
 	) -> DateT | Sequence[DateT]:
 		"""
 		Returns the nth date of the given day of the week in the year of the given date.
 
 		Args:
-		    weekday (Weekday): The day of the week.
+		    weekday (Weekday): The day of the week. In batch calls, a sequence of days of the week may be given, one per date.
 		    date (DateT): The reference date.
-		    n (int): The nth occurrence of the given day of the week.
+		    n (int): The nth occurrence of the given day of the week. In batch calls, a sequence of occurrences may be given, one per date.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
 
 		Raises:
 		    ValueError: If n is less than 1 or greater than 5.
@@ -560,3 +981,510 @@ class TemporalAdjuster:
 		Returns:
 		    DateT: The nth date of the given day of the week in the year of the given date.
 		"""
+
+	@staticmethod
+	def first_day_of_quarter(
+		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
+	) -> DateT | Sequence[DateT]:
+		"""
+		Returns the first day of the quarter of the given date. The quarters start on the 1st of January, April, July and October.
+
+		Args:
+		    date (DateT): The date to adjust.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
+
+		Returns:
+		    DateT: The first day of the quarter of the given date.
+		"""
+
+	@staticmethod
+	def first_day_of_next_quarter(
+		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
+	) -> DateT | Sequence[DateT]:
+		"""
+		Returns the first day of the next quarter of the given date.
+
+		Args:
+		    date (DateT): The date to adjust.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
+
+		Returns:
+		    DateT: The first day of the next quarter of the given date.
+		"""
+
+	@staticmethod
+	def first_day_of_last_quarter(
+		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
+	) -> DateT | Sequence[DateT]:
+		"""
+		Returns the first day of the last quarter of the given date.
+
+		Args:
+		    date (DateT): The date to adjust.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
+
+		Returns:
+		    DateT: The first day of the last quarter of the given date.
+		"""
+
+	@staticmethod
+	def last_day_of_quarter(
+		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
+	) -> DateT | Sequence[DateT]:
+		"""
+		Returns the last day of the quarter of the given date. The quarters end on the last day of March, June, September and December.
+
+		Args:
+		    date (DateT): The date to adjust.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
+
+		Returns:
+		    DateT: The last day of the quarter of the given date.
+		"""
+
+	@staticmethod
+	def last_day_of_next_quarter(
+		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
+	) -> DateT | Sequence[DateT]:
+		"""
+		Returns the last day of the next quarter of the given date.
+
+		Args:
+		    date (DateT): The date to adjust.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
+
+		Returns:
+		    DateT: The last day of the next quarter of the given date.
+		"""
+
+	@staticmethod
+	def last_day_of_last_quarter(
+		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
+	) -> DateT | Sequence[DateT]:
+		"""
+		Returns the last day of the last quarter of the given date.
+
+		Args:
+		    date (DateT): The date to adjust.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
+
+		Returns:
+		    DateT: The last day of the last quarter of the given date.
+		"""
+
+	@staticmethod
+	def first_day_of_iso_year(
+		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
+	) -> DateT | Sequence[DateT]:
+		"""
+		Returns the first day of the ISO-8601 week-numbering year of the given date, that is, the Monday of its week 1. The ISO year of a date is the year of the Thursday of its week.
+
+		Args:
+		    date (DateT): The date to adjust.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
+
+		Returns:
+		    DateT: The first day of the ISO year of the given date.
+		"""
+
+	@staticmethod
+	def first_day_of_next_iso_year(
+		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
+	) -> DateT | Sequence[DateT]:
+		"""
+		Returns the first day of the next ISO-8601 week-numbering year of the given date.
+
+		Args:
+		    date (DateT): The date to adjust.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
+
+		Returns:
+		    DateT: The first day of the next ISO year of the given date.
+		"""
+
+	@staticmethod
+	def first_day_of_last_iso_year(
+		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
+	) -> DateT | Sequence[DateT]:
+		"""
+		Returns the first day of the last ISO-8601 week-numbering year of the given date.
+
+		Args:
+		    date (DateT): The date to adjust.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
+
+		Returns:
+		    DateT: The first day of the last ISO year of the given date.
+		"""
+
+	@staticmethod
+	def last_day_of_iso_year(
+		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
+	) -> DateT | Sequence[DateT]:
+		"""
+		Returns the last day of the ISO-8601 week-numbering year of the given date, that is, the Sunday of its last week.
+
+		Args:
+		    date (DateT): The date to adjust.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
+
+		Returns:
+		    DateT: The last day of the ISO year of the given date.
+		"""
+
+	@staticmethod
+	def last_day_of_next_iso_year(
+		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
+	) -> DateT | Sequence[DateT]:
+		"""
+		Returns the last day of the next ISO-8601 week-numbering year of the given date.
+
+		Args:
+		    date (DateT): The date to adjust.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
+
+		Returns:
+		    DateT: The last day of the next ISO year of the given date.
+		"""
+
+	@staticmethod
+	def last_day_of_last_iso_year(
+		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
+	) -> DateT | Sequence[DateT]:
+		"""
+		Returns the last day of the last ISO-8601 week-numbering year of the given date.
+
+		Args:
+		    date (DateT): The date to adjust.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
+
+		Returns:
+		    DateT: The last day of the last ISO year of the given date.
+		"""
+
+	@staticmethod
+	def nth_of_quarter(
+		weekday: Weekday | ISOWeekday | Sequence[Weekday | ISOWeekday | str | int],
+		date: DateT | Sequence[DateT],
+		n: int | Sequence[int],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+		output: Literal['ordinal', 'epoch_days', 'datetime64'] | None = None,
+		input: Literal['ordinal', 'epoch_days'] | None = None,
+	) -> DateT | Sequence[DateT]:
+		"""
+		Returns the nth date of the given day of the week in the quarter of the given date.
+
+		Args:
+		    weekday (Weekday): The day of the week. In batch calls, a sequence of days of the week may be given, one per date.
+		    date (DateT): The reference date.
+		    n (int): The nth occurrence of the given day of the week. In batch calls, a sequence of occurrences may be given, one per date.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+		    output (Literal['ordinal', 'epoch_days', 'datetime64'] | None): The type of the array of adjusted days returned by a batch call, instead of a container of dates.
+		    input (Literal['ordinal', 'epoch_days'] | None): The mode of the dates of a batch call given as integers, such as an `array.array` or a `memoryview`, which are returned in the same mode unless an output is given.
+
+		Raises:
+		    ValueError: If n is less than 1 or greater than 14.
+		    DateError: If the quarter does not have a nth occurrence of the given day of the week.
+
+		Returns:
+		    DateT: The nth date of the given day of the week in the quarter of the given date.
+		"""
+
+	@staticmethod
+	def iso_week_start(
+		year: int | Sequence[int], week: int | Sequence[int]
+	) -> datetime.date | np.ndarray:
+		"""
+		Returns the first day (the Monday) of the given week of the given ISO-8601 week-numbering year. Sequences of years and weeks are broadcast against each other and computed at once into an array of `np.datetime64[D]` values.
+
+		Args:
+		    year (Union[int, Sequence[int]]): The ISO year.
+		    week (Union[int, Sequence[int]]): The ISO week, from 1 to 52 or 53, depending on the year.
+
+		Raises:
+		    ValueError: If the ISO year does not have the given week.
+
+		Returns:
+		    Union[datetime.date, np.ndarray]: The first day of the given ISO week.
+		"""
+
+	@staticmethod
+	def start_of_day(
+		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+	) -> DateT | Sequence[DateT]:
+		"""
+		Returns the start of the day of the given datetime, at midnight.
+
+		Args:
+		    date (DateT): The datetime to adjust.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+
+		Returns:
+		    DateT: The start of the day of the given datetime.
+		"""
+
+	@staticmethod
+	def end_of_day(
+		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+	) -> DateT | Sequence[DateT]:
+		"""
+		Returns the end of the day of the given datetime, which is its last microsecond, or its last tick for `np.datetime64` values.
+
+		Args:
+		    date (DateT): The datetime to adjust.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+
+		Returns:
+		    DateT: The end of the day of the given datetime.
+		"""
+
+	@staticmethod
+	def start_of_hour(
+		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+	) -> DateT | Sequence[DateT]:
+		"""
+		Returns the start of the hour of the given datetime.
+
+		Args:
+		    date (DateT): The datetime to adjust.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+
+		Returns:
+		    DateT: The start of the hour of the given datetime.
+		"""
+
+	@staticmethod
+	def truncate_to(
+		date: DateT | Sequence[DateT],
+		minutes: int | Sequence[int] = 15,
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+	) -> DateT | Sequence[DateT]:
+		"""
+		Returns the start of the period of the given number of minutes holding the given datetime, such as the quarter of an hour for 15 minutes. The periods are counted from midnight.
+
+		Args:
+		    date (DateT): The datetime to adjust.
+		    minutes (int): The length of the periods, in minutes. In batch calls, a sequence of lengths may be given, one per datetime.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+
+		Raises:
+		    ValueError: If minutes is less than 1.
+
+		Returns:
+		    DateT: The start of the period holding the given datetime.
+		"""
+
+	@staticmethod
+	def next_time(
+		time: Time | str,
+		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+	) -> DateT | Sequence[DateT]:
+		"""
+		Returns the next datetime at the given time of the day, which is on the day of the given datetime if the time is later, or on the next day otherwise.
+
+		Args:
+		    time (Time | str): The time of the day, as a `time` object or an ISO 8601 string, such as '17:30'.
+		    date (DateT): The reference datetime.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+
+		Returns:
+		    DateT: The next datetime at the given time of the day.
+		"""
+
+	@staticmethod
+	def next_or_same_time(
+		time: Time | str,
+		date: DateT | Sequence[DateT],
+		*,
+		out: np.ndarray | None = None,
+		backend: str | None = None,
+	) -> DateT | Sequence[DateT]:
+		"""
+		Returns the next datetime at the given time of the day, or the given datetime if it is at that time.
+
+		Args:
+		    time (Time | str): The time of the day, as a `time` object or an ISO 8601 string, such as '17:30'.
+		    date (DateT): The reference datetime.
+		    out (np.ndarray | None): An array of the same shape as the input to write the results of a batch call into.
+		    backend (str | None): The name of the compute backend of a batch call, instead of the default one.
+
+		Returns:
+		    DateT: The next or same datetime at the given time of the day.
+		"""
+
+	@staticmethod
+	def bucket(
+		dates: Iterable,
+		period: str,
+		week_start: Weekday | ISOWeekday | str | int | None = None,
+	) -> Tuple[np.ndarray, PeriodDecoder]:
+		"""
+		Returns the code of the period of each of the given dates, for grouping dates by week, month, quarter or year without building the first day of each period. The codes are the numbers of the periods counted from the one of 1970-01-01, so they are stable across calls, and are computed in a single vectorized pass, with the same boundaries as `first_day_of_week`, `first_day_of_month`, `first_day_of_quarter` and `first_day_of_year`.
+
+		Args:
+		    dates (Iterable): The dates, as any container supported by the batch calls. Times of the day are ignored.
+		    period (str): The period of the buckets: 'week', 'month', 'quarter' or 'year'.
+		    week_start (Optional[Union[Weekday, ISOWeekday, str, int]]): The first day of the weeks. Only used for weekly buckets. Defaults to the current week start (see `get_week_start`).
+
+		Raises:
+		    ValueError: If the period is unknown, or a date is too far from 1970 for its code to fit into 32 bits.
+
+		Returns:
+		    Tuple[np.ndarray, PeriodDecoder]: The `np.int32` codes of the periods of the dates, in the order of the dates, where missing dates have the code `MISSING_CODE`, and the decoder mapping the codes back to the periods.
+		"""
+
+	@staticmethod
+	def date_dimension(
+		start: datetime.date | np.datetime64,
+		end: datetime.date | np.datetime64,
+		week_start: Weekday | ISOWeekday | str | int | None = None,
+	) -> Dict[str, np.ndarray]:
+		"""
+		Returns a date dimension table, with one row per day of the given range, and the results of the first and last day adjusters as columns, such as `first_day_of_month` or `last_day_of_next_quarter`, as well as the ones of the `first_of_*` and `last_of_*` adjusters for each weekday, such as `first_of_month_friday`. Each column is computed at once by the vectorized kernel of its adjuster, so that a table spanning a century is built in a fraction of a second. The table is returned as a dictionary of columns, which can be turned into a data frame with `pd.DataFrame(table)`.
+
+		Args:
+		    start: The first day of the range, as a `date`, `datetime` or `np.datetime64` value. Times of the day are ignored.
+		    end: The last day of the range, included.
+		    week_start (Optional[Union[Weekday, ISOWeekday, str, int]]): The first day of the weeks of the week columns. Defaults to the current week start (see `get_week_start`).
+
+		Raises:
+		    ValueError: If the range ends before it starts.
+
+		Returns:
+		    Dict[str, np.ndarray]: The columns of the table, as `np.datetime64[D]` arrays, by name, starting with the `date` column holding the days of the range.
+
+		Examples:
+
+		```
+		>>> from datetime import date
+
+		>>> from temporal_adjuster import TemporalAdjuster
+
+		>>> table = TemporalAdjuster.date_dimension(date(2024, 6, 13), date(2024, 6, 14))
+
+		>>> table['last_day_of_month']
+		array(['2024-06-30', '2024-06-30'], dtype='datetime64[D]')
+
+		>>> table['first_of_next_month_monday']
+		array(['2024-07-01', '2024-07-01'], dtype='datetime64[D]')
+
+		```
+		"""
@@ -0,0 +1,143 @@
+import pickle
+from datetime import date, datetime, time
+from unittest import TestCase
+
+import numpy as np
+
+from temporal_adjuster import AdjusterPipeline, TemporalAdjuster
+from temporal_adjuster.adjuster_pipeline import compile_spec
+from temporal_adjuster.common.enums import Weekday, week_starting_on
+from temporal_adjuster.common.parallel import SharedMemoryExecutor
+
+
+class TestAdjusterPipeline(TestCase):
+	dates = np.arange('2023-11-20', '2024-03-10', dtype='datetime64[D]')
+
+	def test_steps_are_applied_in_order(self):
+		pipeline = AdjusterPipeline(
+			'first_day_of_next_month|next_or_same:FRI|nth_of_month:MON:2'
+		)
+		expected = TemporalAdjuster.nth_of_month(
+			Weekday.MONDAY,
+			TemporalAdjuster.next_or_same(
+				Weekday.FRIDAY, TemporalAdjuster.first_day_of_next_month(self.dates)
+			),
+			2,
+		)
+
+		np.testing.assert_array_equal(pipeline(self.dates), expected)
+		self.assertEqual(
+			pipeline(date(2024, 6, 13)),
+			TemporalAdjuster.nth_of_month(Weekday.MONDAY, date(2024, 7, 5), 2),
+		)
+
+	def test_weekday_formats(self):
+		tests = [
+			'next:FRI',
+			'next:fri',
+			'next:FRIDAY',
+			'next:friday',
+			'next:4',
+			' next : Fri ',
+		]
+
+		for spec in tests:
+			with self.subTest(spec=spec):
+				self.assertEqual(AdjusterPipeline(spec), AdjusterPipeline('next:FRI'))
+
+	def test_time_arguments(self):
+		tests = [
+			('next_time:17:30', time(17, 30)),
+			('next_time:17:30:15', time(17, 30, 15)),
+			('next_time:17:30:15.5', time(17, 30, 15, 500000)),
+			('next_time:1730', time(17, 30)),
+		]
+
+		for spec, expected in tests:
+			with self.subTest(spec=spec):
+				self.assertEqual(
+					AdjusterPipeline(spec).steps,
+					(TemporalAdjuster.next_time.bind(expected),),
+				)
+
+		self.assertEqual(
+			AdjusterPipeline('start_of_day|next_or_same_time:09:30|truncate_to:60')(
+				datetime(2024, 6, 13, 18)
+			),
+			datetime(2024, 6, 13, 9),
+		)
+
+	def test_out_and_backend(self):
+		pipeline = AdjusterPipeline('last_day_of_month|last_or_same:FRI')
+		out = np.empty_like(self.dates)
+
+		self.assertIs(pipeline(self.dates, out=out, backend='python'), out)
+		np.testing.assert_array_equal(out, pipeline(self.dates))
+
+	def test_plans_are_cached(self):
+		spec = 'first_day_of_quarter|next:TUE'
+
+		self.assertIs(AdjusterPipeline(spec).steps, AdjusterPipeline(spec).steps)
+		self.assertIs(compile_spec(spec), AdjusterPipeline(spec).steps)
+
+	def test_pickled_as_spec(self):
+		pipeline = AdjusterPipeline('first_day_of_next_month|next_or_same:FRI')
+		payload = pickle.dumps(pipeline)
+
+		self.assertNotIn(b'first_day_of_next_month.', payload)
+		self.assertLess(len(payload), 200)
+		self.assertEqual(pickle.loads(payload), pipeline)
+
+	def test_pickled_with_week_start(self):
+		with week_starting_on(Weekday.SUNDAY):
+			pipeline = AdjusterPipeline('first_day_of_week')
+
+		unpickled = pickle.loads(pickle.dumps(pipeline))
+
+		self.assertEqual(unpickled, pipeline)
+		self.assertEqual(unpickled.week_start, Weekday.SUNDAY)
+		self.assertEqual(unpickled(date(2024, 6, 13)), date(2024, 6, 9))
+		self.assertEqual(
+			AdjusterPipeline('first_day_of_week', week_start='sunday'), pipeline
+		)
+		self.assertNotEqual(AdjusterPipeline('first_day_of_week'), pipeline)
+
+	def test_shared_memory_executor(self):
+		pipeline = AdjusterPipeline('first_day_of_next_month|next_or_same:FRI')
+
+		with SharedMemoryExecutor(max_workers=2, min_chunk_size=50) as executor:
+			np.testing.assert_array_equal(
+				executor.run(pipeline, self.dates), pipeline(self.dates)
+			)
+
+	def test_repr_and_hash(self):
+		pipeline = AdjusterPipeline('next:FRI')
+
+		self.assertEqual(
+			repr(pipeline), "AdjusterPipeline('next:FRI', week_start=Weekday.MONDAY)"
+		)
+		self.assertEqual(len({pipeline, AdjusterPipeline('next:friday')}), 1)
+
+	def test_invalid_specs(self):
+		tests = [
+			'',
+			'first_day_of_next_month|',
+			'first_day_of_fortnight',
+			'bucket',
+			'__class__',
+			'next',
+			'next:FRI:2',
+			'first_day_of_month:2',
+			'next:FUNDAY',
+			'next:7',
+			'nth_of_month:MON:second',
+			'next_time:5',
+			'next_time:25:00',
+			'next_time:17:30:15:10',
+			'truncate_to:quarter',
+		]
+
+		for spec in tests:
+			with self.subTest(spec=spec):
+				with self.assertRaises(ValueError):
+					AdjusterPipeline(spec)
@@ -0,0 +1,191 @@
+from datetime import date
+from importlib.util import find_spec
+from unittest import TestCase, skipUnless
+
+import numpy as np
+
+from temporal_adjuster import FiscalCalendar, TemporalAdjuster
+from temporal_adjuster.common.backends import (
+	ComputeBackend,
+	get_backend,
+	register_backend,
+	set_backend,
+)
+from temporal_adjuster.common.enums import Weekday
+from temporal_adjuster.common.exceptions import DateError
+
+from tests.test_vectorized import FIRST_AND_LAST_DAY_METHODS, WEEKDAY_METHODS
+
+
+class _CountingBackend(ComputeBackend):
+	name = 'counting'
+
+	def __init__(self):
+		self.calls = 0
+
+	def prepare(self, kernel):
+		def run(days, **parameters):
+			self.calls += 1
+
+			return kernel(days, **parameters)
+
+		return run
+
+
+class _MissingBackend(ComputeBackend):
+	name = 'missing'
+
+	def is_available(self):
+		return False
+
+
+class TestBackends(TestCase):
+	test_input = np.concatenate(
+		(
+			np.arange('1899-12-20', '1900-03-10', dtype='datetime64[D]'),
+			np.arange('2023-12-20', '2024-03-10', dtype='datetime64[D]'),
+			np.array(['NaT'], dtype='datetime64[D]'),
+		)
+	)
+
+	def assertBackendsEqual(self, backends, method, *args, **kwargs):
+		expected_output = method(*args, **kwargs)
+
+		for backend in backends:
+			output = method(*args, **kwargs, backend=backend)
+
+			self.assertEqual(output.dtype, expected_output.dtype)
+			np.testing.assert_array_equal(output, expected_output)
+
+	def test_python_backend_success(self):
+		test_input_weekday = np.arange(self.test_input.size) % 7
+
+		for method in FIRST_AND_LAST_DAY_METHODS:
+			with self.subTest(f'Testing method {method} with the python backend'):
+				self.assertBackendsEqual(
+					('python',), getattr(TemporalAdjuster, method), self.test_input
+				)
+
+		for method in WEEKDAY_METHODS:
+			with self.subTest(f'Testing method {method} with the python backend'):
+				self.assertBackendsEqual(
+					('python',),
+					getattr(TemporalAdjuster, method),
+					test_input_weekday,
+					self.test_input,
+				)
+
+		self.assertBackendsEqual(
+			('python',),
+			TemporalAdjuster.nth_of_month,
+			Weekday.MONDAY,
+			self.test_input,
+			2,
+		)
+		self.assertBackendsEqual(
+			('python',), FiscalCalendar().first_day_of_fiscal_period, self.test_input
+		)
+
+	def test_nanoseconds_success(self):
+		test_input = self.test_input.astype('datetime64[ns]') + np.timedelta64(
+			123_456_789, 'ns'
+		)
+		backends = ('numpy', 'python')
+
+		for method in FIRST_AND_LAST_DAY_METHODS:
+			with self.subTest(method=method):
+				self.assertBackendsEqual(
+					backends, getattr(TemporalAdjuster, method), test_input
+				)
+
+		for method in WEEKDAY_METHODS:
+			with self.subTest(method=method):
+				self.assertBackendsEqual(
+					backends,
+					getattr(TemporalAdjuster, method),
+					Weekday.FRIDAY,
+					test_input,
+				)
+
+		self.assertBackendsEqual(backends, TemporalAdjuster.end_of_day, test_input)
+		self.assertBackendsEqual(backends, TemporalAdjuster.truncate_to, test_input, 15)
+		self.assertEqual(
+			TemporalAdjuster.next(Weekday.MONDAY, test_input[:1], backend='python')[0],
+			np.datetime64('1899-12-25T00:00:00.123456789'),
+		)
+		self.assertEqual(
+			TemporalAdjuster.end_of_day(test_input[:1], backend='python')[0],
+			np.datetime64('1899-12-20T23:59:59.999999999'),
+		)
+
+	@skipUnless(find_spec('numba'), 'Numba is not installed')
+	def test_numba_backend_success(self):
+		tests = [
+			(TemporalAdjuster.first_day_of_next_month, (self.test_input,)),
+			(TemporalAdjuster.last_day_of_iso_year, (self.test_input,)),
+			(TemporalAdjuster.next_or_same, (Weekday.FRIDAY, self.test_input)),
+			(
+				TemporalAdjuster.last_of_month,
+				(np.arange(self.test_input.size) % 7, self.test_input),
+			),
+			# Kernels that raise errors are not compiled, and run as NumPy kernels.
+			(TemporalAdjuster.nth_of_year, (Weekday.MONDAY, self.test_input, 3)),
+			(FiscalCalendar().last_day_of_fiscal_year, (self.test_input,)),
+		]
+
+		for index, test in enumerate(tests):
+			with self.subTest(f'Testing the numba backend (subtest {index})'):
+				method, args = test
+
+				self.assertBackendsEqual(('numba',), method, *args)
+
+		with self.assertRaises(DateError):
+			TemporalAdjuster.nth_of_month(
+				Weekday.MONDAY, self.test_input, 5, backend='numba'
+			)
+
+	def test_set_backend_success(self):
+		backend = _CountingBackend()
+		register_backend(backend)
+
+		try:
+			set_backend('counting')
+
+			self.assertIs(get_backend(), backend)
+			np.testing.assert_array_equal(
+				TemporalAdjuster.first_day_of_year(self.test_input),
+				TemporalAdjuster.first_day_of_year(self.test_input, backend='python'),
+			)
+			self.assertEqual(backend.calls, 1)
+
+			TemporalAdjuster.first_day_of_year(self.test_input, backend='numpy')
+			self.assertEqual(
+				TemporalAdjuster.first_day_of_year(date(2024, 6, 13)),
+				date(2024, 1, 1),
+			)
+			self.assertEqual(backend.calls, 1)
+
+		finally:
+			set_backend('numpy')
+
+	def test_backends_failure(self):
+		register_backend(_MissingBackend())
+
+		tests = [
+			(lambda: set_backend('unknown'), ValueError),
+			(lambda: set_backend('missing'), ImportError),
+			(
+				lambda: TemporalAdjuster.first_day_of_year(
+					self.test_input, backend='unknown'
+				),
+				ValueError,
+			),
+			(lambda: register_backend('numpy'), TypeError),
+		]
+
+		for index, test in enumerate(tests):
+			with self.subTest(f'Testing backend failures (subtest {index})'):
+				function, exception = test
+
+				with self.assertRaises(exception):
+					function()
@@ -0,0 +1,177 @@
+import pickle
+from datetime import date
+from unittest import TestCase
+
+import numpy as np
+from pandas import Series
+from pandas.testing import assert_series_equal
+
+from temporal_adjuster import FiscalCalendar, TemporalAdjuster
+from temporal_adjuster.common.decorators import BoundAdjuster
+from temporal_adjuster.common.enums import ISOWeekday, Weekday
+from temporal_adjuster.common.parallel import SharedMemoryExecutor
+from temporal_adjuster.common.profiling import profile
+
+from tests.test_vectorized import FIRST_AND_LAST_DAY_METHODS, WEEKDAY_METHODS
+
+
+class TestBoundAdjusters(TestCase):
+	dates = np.arange('2023-11-20', '2024-03-10', dtype='datetime64[D]')
+
+	def test_bind_matches_direct_calls(self):
+		for name in WEEKDAY_METHODS:
+			with self.subTest(method=name):
+				method = getattr(TemporalAdjuster, name)
+				adjuster = method.bind(Weekday.WEDNESDAY)
+
+				self.assertEqual(
+					adjuster(date(2024, 2, 29)),
+					method(Weekday.WEDNESDAY, date(2024, 2, 29)),
+				)
+				np.testing.assert_array_equal(
+					adjuster(self.dates), method(Weekday.WEDNESDAY, self.dates)
+				)
+
+		for name in FIRST_AND_LAST_DAY_METHODS:
+			with self.subTest(method=name):
+				method = getattr(TemporalAdjuster, name)
+				adjuster = method.bind()
+
+				self.assertEqual(adjuster(date(2024, 2, 29)), method(date(2024, 2, 29)))
+				np.testing.assert_array_equal(adjuster(self.dates), method(self.dates))
+
+	def test_bind_keyword_arguments_after_date(self):
+		adjuster = TemporalAdjuster.nth_of_month.bind(Weekday.MONDAY, n=2)
+
+		self.assertEqual(adjuster(date(2024, 6, 20)), date(2024, 6, 10))
+		np.testing.assert_array_equal(
+			adjuster(self.dates),
+			TemporalAdjuster.nth_of_month(Weekday.MONDAY, self.dates, n=2),
+		)
+
+	def test_bind_method_of_instance(self):
+		calendar = FiscalCalendar()
+		adjuster = FiscalCalendar.first_day_of_fiscal_year.bind(calendar)
+
+		self.assertEqual(
+			adjuster(date(2024, 6, 1)),
+			calendar.first_day_of_fiscal_year(date(2024, 6, 1)),
+		)
+
+	def test_bind_method_from_instance(self):
+		calendar = FiscalCalendar()
+		method = calendar.last_day_of_fiscal_period
+		adjuster = method.bind()
+
+		self.assertEqual(
+			adjuster, FiscalCalendar.last_day_of_fiscal_period.bind(calendar)
+		)
+		self.assertEqual(adjuster(date(2024, 6, 1)), method(date(2024, 6, 1)))
+		np.testing.assert_array_equal(adjuster(self.dates), method(self.dates))
+		self.assertEqual(
+			adjuster.preimage(date(2024, 6, 22)),
+			[(date(2024, 5, 26), date(2024, 6, 22))],
+		)
+		self.assertEqual(
+			pickle.loads(pickle.dumps(method)).bind()(date(2024, 6, 1)),
+			adjuster(date(2024, 6, 1)),
+		)
+
+		with self.assertRaises(TypeError):
+			method.bind(calendar)
+
+	def test_batch_containers(self):
+		adjuster = TemporalAdjuster.next.bind(Weekday.SATURDAY)
+
+		self.assertListEqual(
+			adjuster([date(2024, 6, 13), date(2024, 6, 15)]),
+			[date(2024, 6, 15), date(2024, 6, 22)],
+		)
+		assert_series_equal(
+			adjuster(Series([date(2024, 6, 13), date(2024, 6, 15)], name='dates')),
+			Series([date(2024, 6, 15), date(2024, 6, 22)], name='dates'),
+		)
+
+	def test_out_and_backend(self):
+		adjuster = TemporalAdjuster.last_of_month.bind(Weekday.FRIDAY)
+		out = np.empty_like(self.dates)
+
+		self.assertIs(adjuster(self.dates, out=out, backend='python'), out)
+		np.testing.assert_array_equal(
+			out, TemporalAdjuster.last_of_month(Weekday.FRIDAY, self.dates)
+		)
+
+		with self.assertRaises(TypeError):
+			adjuster(date(2024, 6, 13), out=out)
+
+	def test_arguments_are_normalized_once(self):
+		tests = [Weekday.FRIDAY, ISOWeekday.FRIDAY, 'friday', 4]
+
+		for weekday in tests:
+			with self.subTest(weekday=weekday):
+				adjuster = TemporalAdjuster.next.bind(weekday)
+
+				self.assertIs(adjuster.parameters['weekday'], Weekday.FRIDAY)
+
+	def test_hash_and_equality(self):
+		rules = {
+			TemporalAdjuster.next.bind(Weekday.FRIDAY),
+			TemporalAdjuster.next.bind('friday'),
+			TemporalAdjuster.next.bind(weekday=ISOWeekday.FRIDAY),
+			TemporalAdjuster.next_or_same.bind(Weekday.FRIDAY),
+			TemporalAdjuster.nth_of_month.bind(Weekday.FRIDAY, n=1),
+			TemporalAdjuster.nth_of_month.bind(Weekday.FRIDAY, n=2),
+		}
+
+		self.assertEqual(len(rules), 4)
+		self.assertNotEqual(TemporalAdjuster.next.bind(Weekday.FRIDAY), 'next')
+
+	def test_repr(self):
+		self.assertEqual(
+			repr(TemporalAdjuster.nth_of_month.bind(Weekday.MONDAY, n=2)),
+			'nth_of_month.bind(weekday=<Weekday.MONDAY: 0>, n=2)',
+		)
+
+	def test_pickle(self):
+		adjuster = TemporalAdjuster.nth_of_month.bind(Weekday.MONDAY, n=2)
+		restored = pickle.loads(pickle.dumps(adjuster))
+
+		self.assertIsInstance(restored, BoundAdjuster)
+		self.assertEqual(restored, adjuster)
+		self.assertEqual(restored(date(2024, 6, 20)), date(2024, 6, 10))
+
+	def test_shared_memory_executor(self):
+		adjuster = TemporalAdjuster.last_of_month.bind(Weekday.FRIDAY)
+
+		with SharedMemoryExecutor(max_workers=2, min_chunk_size=50) as executor:
+			np.testing.assert_array_equal(
+				executor.run(adjuster, self.dates), adjuster(self.dates)
+			)
+
+	def test_profile(self):
+		with profile() as batch_profile:
+			TemporalAdjuster.next.bind(Weekday.FRIDAY)(self.dates)
+
+		self.assertEqual(batch_profile.calls['next'], 1)
+
+	def test_invalid_arguments(self):
+		tests = [
+			(lambda: TemporalAdjuster.next.bind(), TypeError),
+			(
+				lambda: TemporalAdjuster.next.bind(Weekday.FRIDAY, date(2024, 6, 13)),
+				TypeError,
+			),
+			(lambda: TemporalAdjuster.next.bind(date=date(2024, 6, 13)), TypeError),
+			(
+				lambda: TemporalAdjuster.next.bind([Weekday.FRIDAY, Weekday.MONDAY]),
+				TypeError,
+			),
+			(lambda: TemporalAdjuster.next.bind(colour='red'), TypeError),
+			(lambda: TemporalAdjuster.next.bind('funday'), KeyError),
+			(lambda: TemporalAdjuster.next.bind(7), ValueError),
+		]
+
+		for bind, error in tests:
+			with self.subTest(error=error):
+				with self.assertRaises(error):
+					bind()
@@ -0,0 +1,121 @@
+from datetime import date
+from unittest import TestCase
+
+import numpy as np
+from pandas import Series
+from pandas.testing import assert_series_equal
+
+from temporal_adjuster.common.enums import ISOWeekday, Weekday
+from temporal_adjuster.common.exceptions import DateError
+from temporal_adjuster.temporal_adjuster import TemporalAdjuster
+
+
+class TestBroadcast(TestCase):
+	test_input = [date(2024, 6, 13), date(2024, 6, 13), date(2024, 2, 1)]
+	test_input_weekday = [Weekday.MONDAY, ISOWeekday.FRIDAY, 'sunday']
+	test_input_n = [1, 2, 4]
+	test_expected_output = [date(2024, 6, 3), date(2024, 6, 14), date(2024, 2, 25)]
+
+	def test_nth_of_month_success(self):
+		tests = [
+			(self.test_input, self.test_expected_output, self.assertListEqual),
+			(
+				np.array(self.test_input, dtype='datetime64[D]'),
+				np.array(self.test_expected_output, dtype='datetime64[D]'),
+				np.testing.assert_array_equal,
+			),
+			(
+				Series(self.test_input, index=['a', 'b', 'c']),
+				Series(self.test_expected_output, index=['a', 'b', 'c']),
+				assert_series_equal,
+			),
+		]
+
+		for index, test in enumerate(tests):
+			with self.subTest(
+				f'Testing method nth_of_month (subtest {index}) with inputs: {test}'
+			):
+				test_input_date, test_expected_output, assertion_method = test
+
+				assertion_method(
+					TemporalAdjuster.nth_of_month(
+						self.test_input_weekday, test_input_date, self.test_input_n
+					),
+					test_expected_output,
+				)
+
+	def test_broadcast_matches_scalar_calls_success(self):
+		test_input = np.arange('2023-12-20', '2024-03-10', dtype='datetime64[D]')
+		test_input_weekday = np.arange(test_input.size) % 7
+		test_input_n = np.arange(test_input.size) % 3 + 1
+
+		tests = [
+			('next', (test_input_weekday, test_input)),
+			('last_or_same', (test_input_weekday, test_input)),
+			('first_of_next_month', (test_input_weekday, test_input)),
+			('last_of_year', (test_input_weekday, test_input)),
+			('nth_from_date', (test_input_weekday, test_input, test_input_n)),
+			('nth_of_month', (test_input_weekday, test_input, test_input_n)),
+			('nth_of_year', (test_input_weekday, test_input, test_input_n)),
+		]
+
+		for index, test in enumerate(tests):
+			with self.subTest(
+				f'Testing method {test[0]} (subtest {index}) with broadcast inputs'
+			):
+				method, args = test
+
+				expected_output = [
+					getattr(TemporalAdjuster, method)(
+						*(
+							int(arg[i]) if j != 1 else arg[i].item()
+							for j, arg in enumerate(args)
+						)
+					)
+					for i in range(test_input.size)
+				]
+
+				self.assertListEqual(
+					getattr(TemporalAdjuster, method)(*args).tolist(), expected_output
+				)
+				self.assertListEqual(
+					getattr(TemporalAdjuster, method)(*(arg.tolist() for arg in args)),
+					expected_output,
+				)
+
+	def test_scalar_parameters_are_broadcast_success(self):
+		test_input = np.array(['2024-06-13', '2024-12-31'], dtype='datetime64[D]')
+
+		np.testing.assert_array_equal(
+			TemporalAdjuster.nth_of_month(
+				[Weekday.MONDAY, Weekday.FRIDAY], test_input, 1
+			),
+			np.array(['2024-06-03', '2024-12-06'], dtype='datetime64[D]'),
+		)
+		np.testing.assert_array_equal(
+			TemporalAdjuster.nth_of_month(Weekday.MONDAY, test_input, [1, 2]),
+			np.array(['2024-06-03', '2024-12-09'], dtype='datetime64[D]'),
+		)
+
+	def test_broadcast_failure(self):
+		tests = [
+			([Weekday.MONDAY, Weekday.FRIDAY, 'sunday'], [1, 2, 5], DateError),
+			([Weekday.MONDAY, Weekday.FRIDAY, 'sunday'], [1, 2, 6], ValueError),
+			([0, 9, 1], 1, ValueError),
+			([0, 1], 1, ValueError),
+		]
+
+		for index, test in enumerate(tests):
+			for test_input in (
+				self.test_input,
+				np.array(self.test_input, dtype='datetime64[D]'),
+			):
+				with self.subTest(
+					f'Testing method nth_of_month failures (subtest {index}) with inputs: {test}'
+				):
+					test_input_weekday, test_input_n, exception = test
+
+					with self.assertRaises(exception):
+						TemporalAdjuster.nth_of_month(
+							test_input_weekday, test_input, test_input_n
+						)
@@ -0,0 +1,274 @@
+from collections import OrderedDict, defaultdict, deque
+from datetime import date, datetime
+from types import MappingProxyType
+from unittest import TestCase
+
+import numpy as np
+import pyarrow as pa
+from pandas import DatetimeIndex, Index, Series, to_datetime
+from pandas.testing import assert_index_equal, assert_series_equal
+
+from temporal_adjuster.common.adapters import (
+	ContainerAdapter,
+	get_adapter,
+	register_adapter,
+)
+from temporal_adjuster.common.enums import Weekday
+from temporal_adjuster.temporal_adjuster import TemporalAdjuster
+
+
+class _Schedule:
+	def __init__(self, dates, label):
+		self.dates = list(dates)
+		self.label = label
+
+	def __iter__(self):
+		return iter(self.dates)
+
+
+class _ScheduleAdapter(ContainerAdapter):
+	def to_buffer(self, container):
+		return np.array(container.dates, dtype=object)
+
+	def from_buffer(self, buffer, container):
+		return _Schedule(buffer, container.label)
+
+
+class TestContainerAdapters(TestCase):
+	def test_metadata_is_kept_success(self):
+		tests = [
+			(
+				Series(
+					to_datetime(['2024-06-13', '2024-12-31']),
+					index=['a', 'b'],
+					name='x',
+				),
+				Series(
+					to_datetime(['2024-06-17', '2025-01-06']),
+					index=['a', 'b'],
+					name='x',
+				),
+				assert_series_equal,
+			),
+			(
+				Series(
+					to_datetime(['2024-06-13', '2024-12-31']).tz_localize('UTC'),
+					name='utc',
+				),
+				Series(
+					to_datetime(['2024-06-17', '2025-01-06']).tz_localize('UTC'),
+					name='utc',
+				),
+				assert_series_equal,
+			),
+			(
+				DatetimeIndex(to_datetime(['2024-06-13', '2024-12-31']), name='i'),
+				DatetimeIndex(to_datetime(['2024-06-17', '2025-01-06']), name='i'),
+				assert_index_equal,
+			),
+			(
+				Index([date(2024, 6, 13), date(2024, 12, 31)], name='i'),
+				Index([date(2024, 6, 17), date(2025, 1, 6)], name='i'),
+				assert_index_equal,
+			),
+			(
+				np.array(['2024-06-13', '2024-12-31'], dtype='datetime64[D]'),
+				np.array(['2024-06-17', '2025-01-06'], dtype='datetime64[D]'),
+				np.testing.assert_array_equal,
+			),
+			(
+				np.array([date(2024, 6, 13), date(2024, 12, 31)], dtype=object),
+				np.array([date(2024, 6, 17), date(2025, 1, 6)], dtype=object),
+				np.testing.assert_array_equal,
+			),
+			(
+				pa.array([date(2024, 6, 13), date(2024, 12, 31)]),
+				pa.array([date(2024, 6, 17), date(2025, 1, 6)]),
+				lambda output, expected: self.assertTrue(output.equals(expected)),
+			),
+			(
+				pa.chunked_array([[datetime(2024, 6, 13)], [datetime(2024, 12, 31)]]),
+				pa.chunked_array([[datetime(2024, 6, 17), datetime(2025, 1, 6)]]),
+				lambda output, expected: self.assertTrue(output.equals(expected)),
+			),
+			(
+				frozenset([date(2024, 6, 13), date(2024, 12, 31)]),
+				frozenset([date(2024, 6, 17), date(2025, 1, 6)]),
+				self.assertEqual,
+			),
+			(
+				deque([date(2024, 6, 13), date(2024, 12, 31)]),
+				deque([date(2024, 6, 17), date(2025, 1, 6)]),
+				self.assertEqual,
+			),
+		]
+
+		for index, test in enumerate(tests):
+			with self.subTest(
+				f'Testing method first_day_of_next_week (subtest {index}) with inputs: {test}'
+			):
+				test_input, test_expected_output, assertion_method = test
+
+				output = TemporalAdjuster.first_day_of_next_week(test_input)
+
+				self.assertIs(type(output), type(test_expected_output))
+				assertion_method(output, test_expected_output)
+
+	def test_input_is_not_modified_success(self):
+		test_input = np.array(['2024-06-13', '2024-12-31'], dtype='datetime64[D]')
+		test_input_copy = test_input.copy()
+
+		output = TemporalAdjuster.next(Weekday.MONDAY, test_input)
+
+		np.testing.assert_array_equal(test_input, test_input_copy)
+		self.assertFalse(np.shares_memory(test_input, output))
+
+	def test_nanosecond_datetime64_keeps_dtype_success(self):
+		output = TemporalAdjuster.first_day_of_month(
+			np.array(['2024-06-13T10:30', '2024-12-31'], dtype='datetime64[ns]')
+		)
+
+		self.assertEqual(output.dtype, np.dtype('datetime64[ns]'))
+		np.testing.assert_array_equal(
+			output,
+			np.array(['2024-06-01T10:30', '2024-12-01'], dtype='datetime64[ns]'),
+		)
+
+	def test_register_user_adapter_success(self):
+		register_adapter(_Schedule, _ScheduleAdapter())
+
+		output = TemporalAdjuster.first_day_of_month(
+			_Schedule([date(2024, 6, 13), date(2024, 12, 31)], 'payroll')
+		)
+
+		self.assertIsInstance(get_adapter(output), _ScheduleAdapter)
+		self.assertEqual(output.label, 'payroll')
+		self.assertListEqual(output.dates, [date(2024, 6, 1), date(2024, 12, 1)])
+
+	def test_multidimensional_array_keeps_shape_success(self):
+		test_input = np.array(
+			[
+				['2024-06-13', '2024-12-31', 'NaT'],
+				['2024-02-29', '2025-01-01', '2024-06-16'],
+			],
+			dtype='datetime64[D]',
+		)
+		test_expected_output = np.array(
+			[
+				['2024-06-14', '2025-01-03', 'NaT'],
+				['2024-03-01', '2025-01-03', '2024-06-21'],
+			],
+			dtype='datetime64[D]',
+		)
+
+		tests = [
+			(test_input, test_expected_output, {}),
+			(test_input, test_expected_output, {'backend': 'python'}),
+			(
+				test_input[:, :2].astype(object),
+				test_expected_output[:, :2].astype(object),
+				{'backend': 'python'},
+			),
+			(test_input.reshape(3, 1, 2), test_expected_output.reshape(3, 1, 2), {}),
+			(
+				test_input.reshape(3, 1, 2),
+				test_expected_output.reshape(3, 1, 2),
+				{'backend': 'python'},
+			),
+			(test_input.T, test_expected_output.T, {'backend': 'python'}),
+		]
+
+		for index, test in enumerate(tests):
+			with self.subTest(
+				f'Testing method next (subtest {index}) with inputs: {test}'
+			):
+				test_dates, test_expected, test_kwargs = test
+
+				output = TemporalAdjuster.next(
+					Weekday.FRIDAY, test_dates, **test_kwargs
+				)
+
+				self.assertEqual(output.shape, test_dates.shape)
+				self.assertEqual(output.dtype, test_dates.dtype)
+				np.testing.assert_array_equal(output, test_expected)
+
+	def test_multidimensional_array_out_and_broadcast_success(self):
+		test_input = np.array(
+			[['2024-06-13', '2024-12-31'], ['2024-02-29', '2025-01-01']],
+			dtype='datetime64[D]',
+		)
+		test_weekdays = np.array([Weekday.MONDAY, Weekday.FRIDAY], dtype=object)
+
+		for backend in ('python', 'numpy'):
+			with self.subTest(f'Testing broadcast and out with backend {backend}'):
+				out = np.empty((2, 4), dtype='datetime64[D]')[:, ::2]
+
+				output = TemporalAdjuster.next(
+					test_weekdays, test_input, out=out, backend=backend
+				)
+
+				self.assertIs(output, out)
+				np.testing.assert_array_equal(
+					out,
+					np.array(
+						[['2024-06-17', '2025-01-03'], ['2024-03-04', '2025-01-03']],
+						dtype='datetime64[D]',
+					),
+				)
+
+	def test_mapping_keeps_keys_success(self):
+		factory = list
+
+		tests = [
+			(
+				{'a': date(2024, 6, 13), 'b': date(2024, 12, 31)},
+				{'a': date(2024, 6, 1), 'b': date(2024, 12, 1)},
+			),
+			(
+				OrderedDict([('b', date(2024, 12, 31)), ('a', date(2024, 6, 13))]),
+				OrderedDict([('b', date(2024, 12, 1)), ('a', date(2024, 6, 1))]),
+			),
+			(
+				defaultdict(factory, {1: datetime(2024, 6, 13, 10, 30)}),
+				defaultdict(factory, {1: datetime(2024, 6, 1, 10, 30)}),
+			),
+			(
+				MappingProxyType({'a': date(2024, 6, 13)}),
+				{'a': date(2024, 6, 1)},
+			),
+			(
+				{
+					'a': np.datetime64('2024-06-13'),
+					'b': np.datetime64('NaT'),
+					'c': np.datetime64('2024-12-31'),
+				},
+				{
+					'a': np.datetime64('2024-06-01'),
+					'b': np.datetime64('NaT'),
+					'c': np.datetime64('2024-12-01'),
+				},
+			),
+			({}, {}),
+		]
+
+		for index, test in enumerate(tests):
+			with self.subTest(
+				f'Testing method first_day_of_month (subtest {index}) with inputs: {test}'
+			):
+				test_input, test_expected_output = test
+
+				output = TemporalAdjuster.first_day_of_month(test_input)
+
+				self.assertIs(type(output), type(test_expected_output))
+				self.assertListEqual(list(output), list(test_expected_output))
+				np.testing.assert_array_equal(
+					np.array(list(output.values())),
+					np.array(list(test_expected_output.values())),
+				)
+
+				if isinstance(test_input, defaultdict):
+					self.assertIs(output.default_factory, factory)
+
+	def test_register_invalid_adapter_failure(self):
+		with self.assertRaises(TypeError):
+			register_adapter(_Schedule, object())
@@ -0,0 +1,74 @@
+from datetime import date, datetime
+from unittest import TestCase
+
+import numpy as np
+from pandas import DataFrame
+
+from temporal_adjuster import TemporalAdjuster
+from temporal_adjuster.common.enums import Weekday
+
+
+class TestDateDimension(TestCase):
+	def test_columns_match_adjusters(self):
+		tests = [
+			(date(2023, 12, 20), date(2024, 3, 10)),
+			(date(1899, 12, 25), date(1900, 3, 5)),
+			(np.datetime64('2020-12-28'), np.datetime64('2021-01-10')),
+		]
+
+		for index, test in enumerate(tests):
+			with self.subTest(
+				f'Testing method date_dimension (subtest {index}) with inputs: {test}'
+			):
+				start, end = test
+
+				table = TemporalAdjuster.date_dimension(start, end)
+				dates = table.pop('date')
+
+				np.testing.assert_array_equal(
+					dates,
+					np.arange(
+						np.datetime64(start, 'D'),
+						np.datetime64(end, 'D') + 1,
+						dtype='datetime64[D]',
+					),
+				)
+
+				for name, column in table.items():
+					method, _, weekday = name.rpartition('_')
+
+					if weekday.upper() in Weekday.__members__:
+						expected = getattr(TemporalAdjuster, method)(
+							Weekday[weekday.upper()], dates, backend='python'
+						)
+
+					else:
+						expected = getattr(TemporalAdjuster, name)(
+							dates, backend='python'
+						)
+
+					self.assertEqual(column.dtype, np.dtype('datetime64[D]'), name)
+					np.testing.assert_array_equal(column, expected, err_msg=name)
+
+	def test_has_every_adjuster(self):
+		table = TemporalAdjuster.date_dimension(date(2024, 1, 1), date(2024, 1, 1))
+
+		self.assertEqual(len(table), 1 + 30 + 12 * 7)
+		self.assertEqual(list(table)[0], 'date')
+		self.assertIn('last_day_of_next_iso_year', table)
+		self.assertIn('first_of_last_year_sunday', table)
+
+	def test_datetime_range_ignores_time(self):
+		table = TemporalAdjuster.date_dimension(
+			datetime(2024, 6, 13, 23, 59), datetime(2024, 6, 14, 0, 1)
+		)
+
+		self.assertEqual(len(DataFrame(table)), 2)
+		np.testing.assert_array_equal(
+			table['first_of_month_friday'],
+			np.array(['2024-06-07', '2024-06-07'], dtype='datetime64[D]'),
+		)
+
+	def test_reversed_range_failure(self):
+		with self.assertRaises(ValueError):
+			TemporalAdjuster.date_dimension(date(2024, 6, 14), date(2024, 6, 13))
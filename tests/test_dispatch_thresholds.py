@@ -0,0 +1,154 @@
+import json
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+
+from temporal_adjuster import TemporalAdjuster
+from temporal_adjuster.common.backends import (
+	DEFAULT_THRESHOLD,
+	calibrate,
+	get_threshold,
+	host_thresholds_path,
+	load_thresholds,
+	register_backend,
+	reset_thresholds,
+	save_thresholds,
+	set_backend,
+	set_thresholds,
+)
+
+from tests.test_backends import _CountingBackend
+
+
+class TestDispatchThresholds(TestCase):
+	def tearDown(self):
+		reset_thresholds()
+
+	def test_dispatch_success(self):
+		backend = _CountingBackend()
+		register_backend(backend)
+		set_thresholds({'first_day_of_next_month': 3})
+
+		tests = [(2, 0), (3, 1), (4, 1)]
+
+		try:
+			set_backend('counting')
+
+			for index, test in enumerate(tests):
+				with self.subTest(
+					f'Testing dispatch (subtest {index}) with inputs: {test}'
+				):
+					size, expected_calls = test
+					backend.calls = 0
+					test_input = np.datetime64('2024-01-10') + np.arange(size)
+
+					np.testing.assert_array_equal(
+						TemporalAdjuster.first_day_of_next_month(test_input),
+						np.full(size, np.datetime64('2024-02-01')),
+					)
+					self.assertEqual(backend.calls, expected_calls)
+
+			backend.calls = 0
+			TemporalAdjuster.first_day_of_next_month(
+				np.array(['2024-01-30'], dtype='datetime64[D]'), backend='counting'
+			)
+			self.assertEqual(backend.calls, 1)
+
+		finally:
+			set_backend('numpy')
+
+	def test_thresholds_success(self):
+		self.assertEqual(get_threshold('nth_of_month'), 16)
+		self.assertEqual(get_threshold('unknown'), DEFAULT_THRESHOLD)
+
+		set_thresholds({'nth_of_month': 5})
+		self.assertEqual(get_threshold('nth_of_month'), 5)
+
+		reset_thresholds()
+		self.assertEqual(get_threshold('nth_of_month'), 16)
+
+	def test_calibrate_success(self):
+		thresholds = calibrate(
+			[TemporalAdjuster.next, TemporalAdjuster.nth_of_month], max_size=4
+		)
+
+		self.assertListEqual(sorted(thresholds), ['next', 'nth_of_month'])
+
+		for method, threshold in thresholds.items():
+			self.assertIn(threshold, (1, 2, 4, 8))
+			self.assertEqual(get_threshold(method), threshold)
+
+	def test_save_and_load_success(self):
+		with TemporaryDirectory() as directory:
+			path = Path(directory) / 'thresholds.json'
+
+			set_thresholds({'next': 7})
+			self.assertEqual(save_thresholds(path), path)
+			self.assertEqual(json.loads(path.read_text())['thresholds']['next'], 7)
+
+			reset_thresholds()
+			self.assertEqual(load_thresholds(path)['next'], 7)
+			self.assertEqual(get_threshold('next'), 7)
+
+			with patch.dict(os.environ, {'TEMPORAL_ADJUSTER_THRESHOLDS': str(path)}):
+				self.assertEqual(host_thresholds_path(), path)
+
+	def test_load_malformed_thresholds(self):
+		with TemporaryDirectory() as directory:
+			path = Path(directory) / 'thresholds.json'
+			path.write_text(
+				json.dumps(
+					{
+						'thresholds': {
+							'next': 7,
+							'first_day_of_month': 'fast',
+							'last_day_of_year': 4.5,
+							'nth_of_month': -3,
+							'last_of_month': True,
+						}
+					}
+				)
+			)
+
+			with self.assertWarns(UserWarning) as context:
+				thresholds = load_thresholds(path)
+
+			self.assertEqual(len(context.warnings), 4)
+			self.assertEqual(thresholds['next'], 7)
+			self.assertEqual(get_threshold('next'), 7)
+			self.assertEqual(get_threshold('first_day_of_month'), 16)
+			self.assertEqual(get_threshold('last_day_of_year'), 16)
+			self.assertEqual(get_threshold('nth_of_month'), 16)
+			self.assertEqual(get_threshold('last_of_month'), DEFAULT_THRESHOLD)
+
+			# Batch calls keep working with the built-in thresholds.
+			dates = np.arange('2024-01-01', '2024-01-04', dtype='datetime64[D]')
+			np.testing.assert_array_equal(
+				TemporalAdjuster.first_day_of_month(dates),
+				np.full(3, np.datetime64('2024-01-01')),
+			)
+
+	def test_thresholds_failure(self):
+		with TemporaryDirectory() as directory:
+			path = Path(directory) / 'thresholds.json'
+			path.write_text('[]')
+
+			tests = [
+				(lambda: set_thresholds({'next': -1}), ValueError),
+				(lambda: set_thresholds({'next': '8'}), ValueError),
+				(lambda: set_thresholds({'next': 8.0}), ValueError),
+				(lambda: set_thresholds({'next': None}), ValueError),
+				(lambda: load_thresholds(Path(directory) / 'missing.json'), OSError),
+				(lambda: load_thresholds(path), ValueError),
+			]
+
+			for index, test in enumerate(tests):
+				with self.subTest(f'Testing threshold failures (subtest {index})'):
+					function, exception = test
+
+					with self.assertRaises(exception):
+						function()
@@ -0,0 +1,190 @@
+from datetime import date, datetime
+from unittest import TestCase
+
+import numpy as np
+from pandas import Series
+from pandas.testing import assert_series_equal
+
+from temporal_adjuster import FiscalCalendar
+from temporal_adjuster.common.enums import ISOWeekday, Weekday
+
+
+class TestFiscalCalendar(TestCase):
+	calendar = FiscalCalendar(year_end_month=1, year_end_weekday=Weekday.SATURDAY)
+
+	def test_fiscal_year_success(self):
+		tests = [
+			('first_day_of_fiscal_year', date(2024, 6, 13), date(2024, 1, 28)),
+			('first_day_of_fiscal_year', date(2024, 1, 27), date(2023, 1, 29)),
+			('first_day_of_fiscal_year', date(2024, 1, 28), date(2024, 1, 28)),
+			(
+				'first_day_of_fiscal_year',
+				datetime(2025, 1, 31, 9),
+				datetime(2025, 1, 26, 9),
+			),
+			('last_day_of_fiscal_year', date(2024, 6, 13), date(2025, 1, 25)),
+			('last_day_of_fiscal_year', date(2023, 1, 29), date(2024, 1, 27)),
+			('last_day_of_fiscal_year', date(2025, 1, 25), date(2025, 1, 25)),
+			(
+				'last_day_of_fiscal_year',
+				datetime(1850, 3, 1, 9),
+				datetime(1851, 1, 25, 9),
+			),
+		]
+
+		for index, test in enumerate(tests):
+			with self.subTest(
+				f'Testing method {test[0]} (subtest {index}) with inputs: {test}'
+			):
+				method, test_input, test_expected_output = test
+
+				self.assertEqual(
+					getattr(self.calendar, method)(test_input), test_expected_output
+				)
+
+	def test_fiscal_period_success(self):
+		tests = [
+			('first_day_of_fiscal_period', date(2024, 2, 24), date(2024, 1, 28)),
+			('first_day_of_fiscal_period', date(2024, 2, 25), date(2024, 2, 25)),
+			('first_day_of_fiscal_period', date(2024, 4, 27), date(2024, 3, 24)),
+			('first_day_of_fiscal_period', date(2024, 6, 13), date(2024, 5, 26)),
+			('last_day_of_fiscal_period', date(2024, 6, 13), date(2024, 6, 22)),
+			('last_day_of_fiscal_period', date(2024, 3, 24), date(2024, 4, 27)),
+			# 2020 is a 53-week fiscal year, and its last period has 6 weeks.
+			('first_day_of_fiscal_period', date(2021, 1, 30), date(2020, 12, 20)),
+			('last_day_of_fiscal_period', date(2020, 12, 20), date(2021, 1, 30)),
+		]
+
+		for index, test in enumerate(tests):
+			with self.subTest(
+				f'Testing method {test[0]} (subtest {index}) with inputs: {test}'
+			):
+				method, test_input, test_expected_output = test
+
+				self.assertEqual(
+					getattr(self.calendar, method)(test_input), test_expected_output
+				)
+
+	def test_fiscal_week_and_period_of_success(self):
+		tests = [
+			(date(2024, 1, 28), 1, 1),
+			(date(2024, 6, 13), 20, 5),
+			(date(2025, 1, 25), 52, 12),
+			(date(2021, 1, 30), 53, 12),
+		]
+
+		for index, test in enumerate(tests):
+			with self.subTest(
+				f'Testing methods fiscal_week_of and fiscal_period_of (subtest {index}) with inputs: {test}'
+			):
+				test_input, test_expected_week, test_expected_period = test
+
+				self.assertEqual(
+					self.calendar.fiscal_week_of(test_input), test_expected_week
+				)
+				self.assertEqual(
+					self.calendar.fiscal_period_of(test_input), test_expected_period
+				)
+
+		np.testing.assert_array_equal(
+			self.calendar.fiscal_week_of([test[0] for test in tests]),
+			[test[1] for test in tests],
+		)
+		np.testing.assert_array_equal(
+			self.calendar.fiscal_period_of([test[0] for test in tests]),
+			[test[2] for test in tests],
+		)
+
+	def test_arrays_match_scalar_calls_success(self):
+		test_input = np.arange('1880-01-01', '2180-01-01', 13, dtype='datetime64[D]')
+
+		for method in (
+			'first_day_of_fiscal_year',
+			'last_day_of_fiscal_year',
+			'first_day_of_fiscal_period',
+			'last_day_of_fiscal_period',
+		):
+			with self.subTest(f'Testing vectorized method {method}'):
+				output = getattr(FiscalCalendar(), method)(test_input)
+
+				self.assertEqual(output.dtype, np.dtype('datetime64[D]'))
+				self.assertListEqual(
+					output.tolist(),
+					[
+						getattr(FiscalCalendar(), method)(test_input)
+						for test_input in test_input.tolist()
+					],
+				)
+
+	def test_containers_success(self):
+		test_input = [date(2024, 6, 13), date(2024, 1, 27)]
+		test_expected_output = [date(2025, 1, 25), date(2024, 1, 27)]
+
+		self.assertListEqual(
+			self.calendar.last_day_of_fiscal_year(test_input), test_expected_output
+		)
+		assert_series_equal(
+			self.calendar.last_day_of_fiscal_year(
+				Series(np.array(test_input, dtype='datetime64[ns]'), name='day')
+			),
+			Series(np.array(test_expected_output, dtype='datetime64[ns]'), name='day'),
+		)
+		np.testing.assert_array_equal(
+			self.calendar.first_day_of_fiscal_year(
+				np.array(['2024-06-13', 'NaT'], dtype='datetime64[D]')
+			),
+			np.array(['2024-01-28', 'NaT'], dtype='datetime64[D]'),
+		)
+
+	def test_configurations_success(self):
+		tests = [
+			(
+				FiscalCalendar(1, 'saturday', nearest=True),
+				'last_day_of_fiscal_year',
+				date(2023, 6, 13),
+				date(2024, 2, 3),
+			),
+			(
+				FiscalCalendar(12, ISOWeekday.SUNDAY),
+				'last_day_of_fiscal_year',
+				date(2024, 6, 13),
+				date(2024, 12, 29),
+			),
+			(
+				FiscalCalendar(pattern=(5, 4, 4)),
+				'first_day_of_fiscal_period',
+				date(2024, 3, 2),
+				date(2024, 1, 28),
+			),
+			(
+				FiscalCalendar(pattern=(5, 4, 4)),
+				'first_day_of_fiscal_period',
+				date(2024, 3, 3),
+				date(2024, 3, 3),
+			),
+		]
+
+		for index, test in enumerate(tests):
+			with self.subTest(
+				f'Testing fiscal calendar configurations (subtest {index}) with inputs: {test}'
+			):
+				calendar, method, test_input, test_expected_output = test
+
+				self.assertEqual(
+					getattr(calendar, method)(test_input), test_expected_output
+				)
+
+	def test_configurations_failure(self):
+		tests = [
+			{'year_end_month': 13},
+			{'pattern': (4, 4, 4)},
+			{'pattern': (0, 13)},
+			{'year_end_weekday': 'someday'},
+		]
+
+		for index, test in enumerate(tests):
+			with self.subTest(
+				f'Testing fiscal calendar configuration failures (subtest {index}) with inputs: {test}'
+			):
+				with self.assertRaises((ValueError, KeyError)):
+					FiscalCalendar(**test)
@@ -0,0 +1,189 @@
+import array
+from datetime import date
+from unittest import TestCase
+
+import numpy as np
+
+from temporal_adjuster.common.backends import calibration_arguments
+from temporal_adjuster.common.decorators.sequence_processor import (
+	_days_from_integers,
+)
+from temporal_adjuster.common.enums import Weekday
+from temporal_adjuster.temporal_adjuster import TemporalAdjuster
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+INPUTS = {
+	'ordinal': lambda days: days.view(np.int64) + EPOCH_ORDINAL,
+	'epoch_days': lambda days: days.view(np.int64),
+}
+CONTAINERS = {
+	'array.array[i]': lambda integers: array.array('i', integers.tolist()),
+	'array.array[q]': lambda integers: array.array('q', integers.tolist()),
+	'memoryview': lambda integers: memoryview(integers.astype(np.int32).tobytes()).cast(
+		'i'
+	),
+	'ndarray[int64]': lambda integers: integers,
+}
+
+
+class TestInputModes(TestCase):
+	methods = [
+		getattr(TemporalAdjuster, name)
+		for name in dir(TemporalAdjuster)
+		if getattr(getattr(TemporalAdjuster, name), 'kernel', None) is not None
+		and not getattr(TemporalAdjuster, name).time_of_day
+	]
+	days = np.arange('1999-12-20', '2001-01-20', 3, dtype='datetime64[D]')
+
+	def test_same_as_dates_success(self):
+		for method in self.methods:
+			arguments = calibration_arguments(method, self.days)
+			days = arguments.pop(method.target)
+			expected = method(**{method.target: days}, **arguments, backend='python')
+
+			for input, convert in INPUTS.items():
+				for container, to_container in CONTAINERS.items():
+					with self.subTest(
+						method=method.__name__, input=input, container=container
+					):
+						test_input = to_container(convert(days))
+
+						result = method(
+							**{method.target: test_input}, **arguments, input=input
+						)
+
+						self.assertIsInstance(result, np.ndarray)
+						self.assertEqual(result.dtype, np.asarray(test_input).dtype)
+						np.testing.assert_array_equal(result, convert(expected))
+
+	def test_output_success(self):
+		test_input = array.array(
+			'i', [date(2024, 6, 13).toordinal(), date(2024, 7, 1).toordinal()]
+		)
+
+		tests = [
+			(
+				'datetime64',
+				np.array(['2024-06-28', '2024-07-26'], dtype='datetime64[D]'),
+			),
+			('epoch_days', np.array([19902, 19930], dtype=np.int64)),
+			(
+				'ordinal',
+				np.array(
+					[date(2024, 6, 28).toordinal(), date(2024, 7, 26).toordinal()],
+					dtype=np.int32,
+				),
+			),
+		]
+
+		for index, test in enumerate(tests):
+			with self.subTest(
+				f'Testing output {test[0]} (subtest {index}) with inputs: {test}'
+			):
+				test_output, test_expected_output = test
+
+				result = TemporalAdjuster.last_of_month(
+					Weekday.FRIDAY, test_input, input='ordinal', output=test_output
+				)
+
+				self.assertEqual(result.dtype, test_expected_output.dtype)
+				np.testing.assert_array_equal(result, test_expected_output)
+
+	def test_zero_copy_success(self):
+		test_input = array.array('q', [19887, 19904, np.iinfo(np.int64).min])
+
+		self.assertTrue(
+			np.shares_memory(
+				_days_from_integers(np.asarray(test_input), 'epoch_days'),
+				np.asarray(test_input),
+			)
+		)
+		np.testing.assert_array_equal(
+			TemporalAdjuster.first_day_of_month(test_input, input='epoch_days'),
+			[19875, 19875, np.iinfo(np.int64).min],
+		)
+		self.assertListEqual(
+			test_input.tolist(), [19887, 19904, np.iinfo(np.int64).min]
+		)
+
+	def test_bound_adjuster_success(self):
+		adjuster = TemporalAdjuster.next.bind(Weekday.FRIDAY)
+
+		np.testing.assert_array_equal(
+			adjuster(
+				array.array('l', [date(2024, 6, 13).toordinal()]), input='ordinal'
+			),
+			[date(2024, 6, 14).toordinal()],
+		)
+		np.testing.assert_array_equal(
+			adjuster(
+				memoryview(np.array([19887], dtype=np.int32)),
+				input='epoch_days',
+				output='datetime64',
+			),
+			np.array(['2024-06-14'], dtype='datetime64[D]'),
+		)
+
+	def test_failure(self):
+		test_input = array.array('i', [19887, 19905])
+
+		tests = [
+			('first_day_of_month', (test_input,), {'input': 'dates'}, ValueError),
+			(
+				'first_day_of_month',
+				(b'\x00\x00\x00\x00',),
+				{'input': 'epoch_days'},
+				TypeError,
+			),
+			(
+				'first_day_of_month',
+				(memoryview(array.array('q', [19887, 0]).tobytes()),),
+				{'input': 'epoch_days'},
+				TypeError,
+			),
+			(
+				'first_day_of_month',
+				(array.array('b', [1, 2]),),
+				{'input': 'ordinal'},
+				TypeError,
+			),
+			(
+				'first_day_of_month',
+				(np.array([1.5, 2.5]),),
+				{'input': 'epoch_days'},
+				TypeError,
+			),
+			(
+				'first_day_of_month',
+				(test_input,),
+				{'input': 'epoch_days', 'out': np.empty(2, dtype='datetime64[D]')},
+				TypeError,
+			),
+			(
+				'first_day_of_month',
+				(date(2024, 6, 13),),
+				{'input': 'ordinal'},
+				TypeError,
+			),
+			('start_of_day', (test_input,), {'input': 'epoch_days'}, TypeError),
+			(
+				'last_day_of_month',
+				(array.array('i', [2**31 - 10]),),
+				{'input': 'epoch_days'},
+				OverflowError,
+			),
+		]
+
+		for index, test in enumerate(tests):
+			with self.subTest(
+				f'Testing method {test[0]} (subtest {index}) with inputs: {test}'
+			):
+				method, test_args, test_kwargs, test_exception = test
+
+				with self.assertRaises(test_exception):
+					getattr(TemporalAdjuster, method)(*test_args, **test_kwargs)
+
+		with self.assertRaises(TypeError):
+			TemporalAdjuster.first_day_of_month.bind()(
+				date(2024, 6, 13), input='ordinal'
+			)
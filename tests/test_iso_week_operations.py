@@ -0,0 +1,78 @@
+from datetime import date, datetime
+from unittest import TestCase
+
+import numpy as np
+
+from temporal_adjuster.temporal_adjuster import TemporalAdjuster
+
+
+class TestTemporalAdjusterForISOWeeks(TestCase):
+	def test_first_and_last_day_of_iso_year_success(self):
+		tests = [
+			('first_day_of_iso_year', date(2024, 6, 13), date(2024, 1, 1)),
+			('first_day_of_iso_year', date(2021, 1, 3), date(2019, 12, 30)),
+			('first_day_of_iso_year', date(2020, 12, 31), date(2019, 12, 30)),
+			(
+				'first_day_of_iso_year',
+				datetime(2024, 12, 30, 8),
+				datetime(2024, 12, 30, 8),
+			),
+			('first_day_of_next_iso_year', date(2020, 6, 13), date(2021, 1, 4)),
+			('first_day_of_next_iso_year', date(2024, 12, 30), date(2025, 12, 29)),
+			('first_day_of_last_iso_year', date(2021, 6, 13), date(2019, 12, 30)),
+			('first_day_of_last_iso_year', date(2021, 1, 3), date(2018, 12, 31)),
+			('last_day_of_iso_year', date(2020, 6, 13), date(2021, 1, 3)),
+			('last_day_of_iso_year', date(2024, 12, 29), date(2024, 12, 29)),
+			('last_day_of_next_iso_year', date(2020, 6, 13), date(2022, 1, 2)),
+			('last_day_of_last_iso_year', date(2021, 6, 13), date(2021, 1, 3)),
+			('last_day_of_last_iso_year', datetime(2024, 1, 1), datetime(2023, 12, 31)),
+		]
+
+		for index, test in enumerate(tests):
+			with self.subTest(
+				f'Testing method {test[0]} (subtest {index}) with inputs: {test}'
+			):
+				method, test_input, test_expected_output = test
+
+				self.assertEqual(
+					getattr(TemporalAdjuster, method)(test_input), test_expected_output
+				)
+
+	def test_iso_week_start_success(self):
+		tests = [
+			(2020, 1, date(2019, 12, 30)),
+			(2020, 53, date(2020, 12, 28)),
+			(2024, 24, date(2024, 6, 10)),
+		]
+
+		for index, test in enumerate(tests):
+			with self.subTest(
+				f'Testing method iso_week_start (subtest {index}) with inputs: {test}'
+			):
+				test_input_year, test_input_week, test_expected_output = test
+
+				self.assertEqual(
+					TemporalAdjuster.iso_week_start(test_input_year, test_input_week),
+					test_expected_output,
+				)
+
+		np.testing.assert_array_equal(
+			TemporalAdjuster.iso_week_start([2020, 2020, 2024], [1, 53, 24]),
+			np.array(['2019-12-30', '2020-12-28', '2024-06-10'], dtype='datetime64[D]'),
+		)
+		np.testing.assert_array_equal(
+			TemporalAdjuster.iso_week_start(2024, np.array([1, 2])),
+			np.array(['2024-01-01', '2024-01-08'], dtype='datetime64[D]'),
+		)
+
+	def test_iso_week_start_failure(self):
+		tests = [(2021, 53), (2021, 0), ([2020, 2021], [53, 53])]
+
+		for index, test in enumerate(tests):
+			with self.subTest(
+				f'Testing method iso_week_start (subtest {index}) with inputs: {test}'
+			):
+				test_input_year, test_input_week = test
+
+				with self.assertRaises(ValueError):
+					TemporalAdjuster.iso_week_start(test_input_year, test_input_week)
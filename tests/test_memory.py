@@ -0,0 +1,107 @@
+import os
+import tracemalloc
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from temporal_adjuster.common.backends import calibration_arguments
+from temporal_adjuster.temporal_adjuster import TemporalAdjuster
+
+# The sizes of the array inputs, such as '1000000' or '1000000,10000000' for the full benchmark, which default to a small size for the test suite. The Python containers are adjusted one by one, which tracemalloc slows down a lot, so they are measured on smaller inputs and on a few methods, since their memory does not depend on the method.
+SIZES_VARIABLE = 'TEMPORAL_ADJUSTER_MEMORY_SIZES'
+SIZES = [
+	int(size) for size in os.environ.get(SIZES_VARIABLE, '100000').split(',') if size
+]
+OBJECT_SIZE_DIVISOR = 100
+OBJECT_METHODS = ('first_day_of_month', 'last_of_month', 'end_of_day')
+
+# The budgets of each container, as the peak memory in bytes and the number of memory blocks kept by the output, per element. They are measured as the growth between the input of the given size and one of twice that size, so that the memory that does not depend on the size, such as the chunks of the kernels, is left out, and small sizes give the same results. The peak includes the output, of 8 bytes per element for arrays, and of a date or datetime object and its reference for Python containers.
+CONTAINERS = {
+	'ndarray': (lambda dates: dates, 16, 0.01),
+	'ndarray[ns]': (lambda dates: dates.astype('datetime64[ns]'), 40, 0.01),
+	'Series': (lambda dates: pd.Series(dates.astype('datetime64[ns]')), 40, 0.01),
+	'Arrow': (pa.array, 16, 0.01),
+	'list': (lambda dates: dates.tolist(), 80, 1.1),
+	'tuple': (lambda dates: tuple(dates.tolist()), 80, 1.1),
+	'dict': (lambda dates: dict(enumerate(dates.tolist())), 128, 1.1),
+}
+OBJECT_CONTAINERS = ('list', 'tuple', 'dict')
+
+
+def _measure(function):
+	"""
+	Returns the peak memory and the number of memory blocks kept by the output of the given function, above the memory used before the call.
+	"""
+	tracemalloc.start()
+
+	try:
+		before = tracemalloc.take_snapshot()
+		baseline = tracemalloc.get_traced_memory()[0]
+
+		output = function()
+
+		peak = tracemalloc.get_traced_memory()[1] - baseline
+		blocks = sum(
+			statistic.count_diff
+			for statistic in tracemalloc.take_snapshot().compare_to(before, 'filename')
+		)
+
+	finally:
+		tracemalloc.stop()
+
+	del output
+
+	return peak, blocks
+
+
+def _dates(count: int) -> np.ndarray:
+	"""
+	Returns the given number of dates, in no particular order, over a century.
+	"""
+	return np.datetime64('1970-01-01') + (np.arange(count) * 7919 % 40_000).astype(
+		'timedelta64[D]'
+	)
+
+
+class TestMemory(TestCase):
+	methods = [
+		getattr(TemporalAdjuster, name)
+		for name in dir(TemporalAdjuster)
+		if getattr(getattr(TemporalAdjuster, name), 'kernel', None) is not None
+	]
+
+	def test_peak_memory_per_element(self):
+		for size in SIZES:
+			for container, (convert, max_peak, max_blocks) in CONTAINERS.items():
+				count = (
+					size // OBJECT_SIZE_DIVISOR
+					if container in OBJECT_CONTAINERS
+					else size
+				)
+
+				for method in self.methods:
+					if (
+						container in OBJECT_CONTAINERS
+						and method.__name__ not in OBJECT_METHODS
+					):
+						continue
+
+					with self.subTest(
+						size=count, container=container, method=method.__name__
+					):
+						measures = []
+
+						for dates in (_dates(count), _dates(2 * count)):
+							arguments = calibration_arguments(method, dates)
+							arguments[method.target] = convert(arguments[method.target])
+
+							measures.append(_measure(lambda: method(**arguments)))
+
+						(peak, blocks), (double_peak, double_blocks) = measures
+
+						self.assertLessEqual((double_peak - peak) / count, max_peak)
+						self.assertLessEqual(
+							(double_blocks - blocks) / count, max_blocks
+						)
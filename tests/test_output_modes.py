@@ -0,0 +1,162 @@
+from datetime import date, datetime, timedelta
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from temporal_adjuster.common.backends import calibration_arguments
+from temporal_adjuster.common.decorators import sequenceable
+from temporal_adjuster.common.enums import Weekday
+from temporal_adjuster.temporal_adjuster import TemporalAdjuster
+
+OUTPUTS = {
+	'ordinal': lambda days: days.view(np.int64) + date(1970, 1, 1).toordinal(),
+	'epoch_days': lambda days: days.view(np.int64),
+	'datetime64': lambda days: days,
+}
+DTYPES = {
+	'ordinal': np.dtype(np.int32),
+	'epoch_days': np.dtype(np.int64),
+	'datetime64': np.dtype('datetime64[D]'),
+}
+CONTAINERS = {
+	'ndarray': lambda days: days,
+	'ndarray[ns]': lambda days: days.astype('datetime64[ns]') + np.timedelta64(17, 'h'),
+	'list': lambda days: days.tolist(),
+	'tuple': lambda days: tuple(days.tolist()),
+	'datetimes': lambda days: [
+		datetime.combine(day, datetime.min.time()) + timedelta(hours=23)
+		for day in days.tolist()
+	],
+	'Series': lambda days: pd.Series(days.astype('datetime64[ns]')),
+	'dict': lambda days: dict(enumerate(days.tolist())),
+}
+
+
+@sequenceable(target='date')
+def _next_day(date):
+	return date + timedelta(days=1)
+
+
+class TestOutputModes(TestCase):
+	methods = [
+		getattr(TemporalAdjuster, name)
+		for name in dir(TemporalAdjuster)
+		if getattr(getattr(TemporalAdjuster, name), 'kernel', None) is not None
+		and not getattr(TemporalAdjuster, name).time_of_day
+	]
+	days = np.arange('1999-12-20', '2001-01-20', 3, dtype='datetime64[D]')
+
+	def test_same_as_dates_success(self):
+		for method in self.methods:
+			arguments = calibration_arguments(method, self.days)
+			days = arguments.pop(method.target)
+			expected = method(**{method.target: days}, **arguments, backend='python')
+
+			for container, convert in CONTAINERS.items():
+				for output, expected_output in OUTPUTS.items():
+					with self.subTest(
+						method=method.__name__, container=container, output=output
+					):
+						result = method(
+							**{method.target: convert(days)}, **arguments, output=output
+						)
+
+						self.assertIsInstance(result, np.ndarray)
+						self.assertEqual(result.dtype, DTYPES[output])
+						np.testing.assert_array_equal(result, expected_output(expected))
+
+	def test_missing_success(self):
+		test_input = np.array(['2024-06-13', 'NaT'], dtype='datetime64[D]')
+
+		np.testing.assert_array_equal(
+			TemporalAdjuster.first_day_of_month(test_input, output='datetime64'),
+			np.array(['2024-06-01', 'NaT'], dtype='datetime64[D]'),
+		)
+		np.testing.assert_array_equal(
+			TemporalAdjuster.first_day_of_month(
+				[date(2024, 6, 13), None], output='epoch_days'
+			),
+			[19875, np.iinfo(np.int64).min],
+		)
+
+	def test_small_and_multidimensional_success(self):
+		test_input = np.array(
+			[['2024-06-13', '2024-06-14'], ['2024-07-01', '2024-12-31']],
+			dtype='datetime64[D]',
+		)
+
+		result = TemporalAdjuster.next(Weekday.FRIDAY, test_input, output='ordinal')
+
+		self.assertEqual(result.shape, (2, 2))
+		self.assertListEqual(
+			result.tolist(),
+			[
+				[date(2024, 6, 14).toordinal(), date(2024, 6, 21).toordinal()],
+				[date(2024, 7, 5).toordinal(), date(2025, 1, 3).toordinal()],
+			],
+		)
+
+	def test_bound_adjuster_success(self):
+		adjuster = TemporalAdjuster.last_of_month.bind(Weekday.FRIDAY)
+
+		np.testing.assert_array_equal(
+			adjuster([date(2024, 6, 13), date(2024, 7, 1)], output='datetime64'),
+			np.array(['2024-06-28', '2024-07-26'], dtype='datetime64[D]'),
+		)
+
+	def test_function_without_kernel_success(self):
+		test_input = np.array(['2024-06-13', '2024-06-30'], dtype='datetime64[D]')
+
+		np.testing.assert_array_equal(
+			_next_day(test_input, output='epoch_days'), [19888, 19905]
+		)
+		np.testing.assert_array_equal(
+			test_input, np.array(['2024-06-13', '2024-06-30'], dtype='datetime64[D]')
+		)
+
+	def test_failure(self):
+		test_input = np.array(['2024-06-13', '2024-06-14'], dtype='datetime64[D]')
+
+		tests = [
+			('first_day_of_month', (test_input,), {'output': 'dates'}, ValueError),
+			(
+				'first_day_of_month',
+				(test_input,),
+				{'output': 'ordinal', 'out': np.empty_like(test_input)},
+				TypeError,
+			),
+			(
+				'first_day_of_month',
+				(date(2024, 6, 13),),
+				{'output': 'ordinal'},
+				TypeError,
+			),
+			(
+				'start_of_day',
+				(test_input.astype('datetime64[s]'),),
+				{'output': 'datetime64'},
+				TypeError,
+			),
+			(
+				'first_day_of_month',
+				(np.array(['2024-06-13', 'NaT'], dtype='datetime64[D]'),),
+				{'output': 'ordinal'},
+				ValueError,
+			),
+			(
+				'last_day_of_month',
+				(np.array(['5881000-01-13'], dtype='datetime64[D]'),),
+				{'output': 'ordinal'},
+				OverflowError,
+			),
+		]
+
+		for index, test in enumerate(tests):
+			with self.subTest(
+				f'Testing method {test[0]} (subtest {index}) with inputs: {test}'
+			):
+				method, test_args, test_kwargs, test_exception = test
+
+				with self.assertRaises(test_exception):
+					getattr(TemporalAdjuster, method)(*test_args, **test_kwargs)
@@ -0,0 +1,187 @@
+from unittest import TestCase
+
+import numpy as np
+
+from temporal_adjuster import FiscalCalendar, TemporalAdjuster
+from temporal_adjuster.common.enums import ISOWeekday, Weekday
+from temporal_adjuster.common.exceptions import DateError
+from temporal_adjuster.common.parallel import SharedMemoryExecutor, set_threads
+
+
+class TestSharedMemoryExecutor(TestCase):
+	test_input = np.arange('1990-01-01', '2010-01-01', dtype='datetime64[D]')
+
+	@classmethod
+	def setUpClass(cls):
+		cls.executor = SharedMemoryExecutor(max_workers=3, min_chunk_size=1000)
+
+	@classmethod
+	def tearDownClass(cls):
+		cls.executor.shutdown()
+
+	def test_run_success(self):
+		test_input_weekday = np.arange(self.test_input.size) % 7
+		test_input_nat = self.test_input.copy()
+		test_input_nat[::5] = np.datetime64('NaT')
+
+		tests = [
+			(TemporalAdjuster.first_day_of_next_month, (self.test_input,), {}),
+			(TemporalAdjuster.first_day_of_next_month, (test_input_nat,), {}),
+			(TemporalAdjuster.next, (Weekday.FRIDAY, self.test_input), {}),
+			(TemporalAdjuster.next, (test_input_weekday, self.test_input), {}),
+			(
+				TemporalAdjuster.next,
+				(
+					([ISOWeekday.MONDAY, 'sunday'] * self.test_input.size)[
+						: self.test_input.size
+					],
+				),
+				{'date': self.test_input},
+			),
+			(
+				TemporalAdjuster.nth_of_month,
+				(test_input_weekday, self.test_input),
+				{'n': 2},
+			),
+			(FiscalCalendar().last_day_of_fiscal_period, (self.test_input,), {}),
+			(
+				TemporalAdjuster.last_day_of_month,
+				(self.test_input.astype('datetime64[s]'),),
+				{},
+			),
+		]
+
+		for index, test in enumerate(tests):
+			with self.subTest(f'Testing parallel call (subtest {index})'):
+				method, args, kwargs = test
+
+				output = self.executor.run(method, *args, **kwargs)
+				expected_output = method(*args, **kwargs)
+
+				self.assertEqual(output.dtype, expected_output.dtype)
+				np.testing.assert_array_equal(output, expected_output)
+
+	def test_run_with_out_success(self):
+		out = np.empty_like(self.test_input)
+
+		output = self.executor.run(
+			TemporalAdjuster.last_of_month, Weekday.FRIDAY, self.test_input, out=out
+		)
+
+		self.assertIs(output, out)
+		np.testing.assert_array_equal(
+			out, TemporalAdjuster.last_of_month(Weekday.FRIDAY, self.test_input)
+		)
+
+	def test_run_in_process_success(self):
+		with SharedMemoryExecutor(min_chunk_size=10**9) as executor:
+			np.testing.assert_array_equal(
+				executor.run(TemporalAdjuster.first_day_of_year, self.test_input[:3]),
+				np.array(['1990-01-01'] * 3, dtype='datetime64[D]'),
+			)
+
+	def test_run_failure(self):
+		tests = [
+			(
+				TemporalAdjuster.nth_of_month,
+				(Weekday.MONDAY, self.test_input, 5),
+				DateError,
+			),
+			(
+				TemporalAdjuster.next,
+				(Weekday.MONDAY, self.test_input.tolist()),
+				TypeError,
+			),
+			(TemporalAdjuster.iso_week_start, (2024, self.test_input), TypeError),
+			(
+				TemporalAdjuster.next,
+				(np.arange(7) % 7, self.test_input),
+				ValueError,
+			),
+			(
+				TemporalAdjuster.next,
+				([Weekday.MONDAY, Weekday.FRIDAY], self.test_input),
+				ValueError,
+			),
+		]
+
+		for index, test in enumerate(tests):
+			with self.subTest(f'Testing parallel call failures (subtest {index})'):
+				method, args, exception = test
+
+				with self.assertRaises(exception):
+					self.executor.run(method, *args)
+
+
+class TestThreads(TestCase):
+	test_input = np.arange('1990-01-01', '2010-01-01', dtype='datetime64[D]')
+
+	def test_threads_success(self):
+		test_input_weekday = np.arange(self.test_input.size) % 7
+		test_input_nat = self.test_input.copy()
+		test_input_nat[::5] = np.datetime64('NaT')
+
+		tests = [
+			(TemporalAdjuster.first_day_of_next_month, (self.test_input,)),
+			(TemporalAdjuster.first_day_of_next_month, (test_input_nat,)),
+			(TemporalAdjuster.next, (Weekday.FRIDAY, self.test_input)),
+			(TemporalAdjuster.nth_of_month, (test_input_weekday, self.test_input, 2)),
+			(
+				TemporalAdjuster.last_of_year,
+				(Weekday.MONDAY, self.test_input.reshape(5, -1)),
+			),
+			(FiscalCalendar().last_day_of_fiscal_period, (self.test_input,)),
+		]
+
+		for index, test in enumerate(tests):
+			with self.subTest(f'Testing multi-threaded call (subtest {index})'):
+				method, args = test
+
+				expected_output = method(*args)
+
+				with TemporalAdjuster.threads(max_workers=3, chunk_size=1000):
+					output = method(*args)
+
+				self.assertEqual(output.shape, expected_output.shape)
+				np.testing.assert_array_equal(output, expected_output)
+
+	def test_set_threads_success(self):
+		expected_output = TemporalAdjuster.last_day_of_quarter(self.test_input)
+
+		try:
+			set_threads(max_workers=2, chunk_size=1000)
+
+			np.testing.assert_array_equal(
+				TemporalAdjuster.last_day_of_quarter(self.test_input), expected_output
+			)
+
+			with TemporalAdjuster.threads(enabled=False):
+				np.testing.assert_array_equal(
+					TemporalAdjuster.last_day_of_quarter(self.test_input),
+					expected_output,
+				)
+
+		finally:
+			set_threads(enabled=False)
+
+	def test_threads_failure(self):
+		test_input_weekday = np.arange(self.test_input.size) % 7
+		# The first invalid item is in the fourth chunk.
+		test_input_n = np.where(np.arange(self.test_input.size) < 3500, 1, 5)
+
+		with self.assertRaises(DateError) as expected_error:
+			TemporalAdjuster.nth_of_month(
+				test_input_weekday, self.test_input, test_input_n
+			)
+
+		with TemporalAdjuster.threads(max_workers=3, chunk_size=1000):
+			with self.assertRaises(DateError) as error:
+				TemporalAdjuster.nth_of_month(
+					test_input_weekday, self.test_input, test_input_n
+				)
+
+			self.assertEqual(str(error.exception), str(expected_error.exception))
+
+			with self.assertRaises(ValueError):
+				with TemporalAdjuster.threads(chunk_size=0):
+					pass
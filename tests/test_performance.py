@@ -3,6 +3,7 @@ from random import randint
 from timeit import timeit
 from unittest import TestCase
 
+from pandas import Timestamp
 from psutil import cpu_count, cpu_freq
 
 from temporal_adjuster.common.enums import Weekday
@@ -42,3 +43,17 @@ class TestPerformance(TestCase):
 		)
 
 		self.assertLess(execution_time, self.max_execution_time)
+
+	# Single pd.Timestamp values
+	def test_timestamp_last_of_month_success(self):
+		test_input = [Timestamp(date) for date in self.test_input]
+
+		execution_time = timeit(
+			lambda: [
+				TemporalAdjuster.last_of_month(Weekday.FRIDAY, date)
+				for date in test_input
+			],
+			number=self.test_n,
+		)
+
+		self.assertLess(execution_time, self.max_execution_time)
@@ -0,0 +1,119 @@
+import pickle
+from datetime import date, datetime
+from unittest import TestCase
+
+import numpy as np
+from pandas import Series
+
+from temporal_adjuster import PeriodDecoder, TemporalAdjuster
+from temporal_adjuster.common.enums import ISOWeekday, Weekday
+from temporal_adjuster.modules import MISSING_CODE
+
+
+class TestPeriodBuckets(TestCase):
+	dates = np.arange('1960-01-01', '2040-01-01', dtype='datetime64[D]')
+
+	def test_boundaries_match_adjusters(self):
+		for period in ('week', 'month', 'quarter', 'year'):
+			with self.subTest(period=period):
+				codes, decoder = TemporalAdjuster.bucket(self.dates, period)
+
+				self.assertEqual(codes.dtype, np.int32)
+				np.testing.assert_array_equal(
+					decoder(codes),
+					getattr(TemporalAdjuster, f'first_day_of_{period}')(self.dates),
+				)
+				np.testing.assert_array_equal(
+					decoder.end(codes),
+					getattr(TemporalAdjuster, f'last_day_of_{period}')(self.dates),
+				)
+
+	def test_codes_are_consecutive(self):
+		for period in ('week', 'month', 'quarter', 'year'):
+			with self.subTest(period=period):
+				codes, _ = TemporalAdjuster.bucket(self.dates, period)
+
+				self.assertTrue(np.isin(np.diff(codes), [0, 1]).all())
+
+	def test_codes(self):
+		tests = [
+			('week', Weekday.MONDAY, date(1970, 1, 1), 0),
+			('week', Weekday.MONDAY, date(1970, 1, 5), 1),
+			('week', Weekday.MONDAY, date(1969, 12, 28), -1),
+			('week', Weekday.THURSDAY, date(1970, 1, 8), 1),
+			('month', Weekday.MONDAY, date(2024, 2, 29), 649),
+			('quarter', Weekday.MONDAY, date(2024, 2, 29), 216),
+			('year', Weekday.MONDAY, date(1969, 12, 31), -1),
+		]
+
+		for period, week_start, day, expected in tests:
+			with self.subTest(period=period, week_start=week_start, day=day):
+				codes, _ = TemporalAdjuster.bucket([day], period, week_start)
+
+				self.assertEqual(codes[0], expected)
+
+	def test_week_start(self):
+		tests = [Weekday.SUNDAY, ISOWeekday.SUNDAY, 'sunday', 6]
+
+		for week_start in tests:
+			with self.subTest(week_start=week_start):
+				codes, decoder = TemporalAdjuster.bucket(
+					self.dates, 'week', week_start=week_start
+				)
+
+				self.assertEqual(decoder.week_start, Weekday.SUNDAY)
+				np.testing.assert_array_equal(
+					decoder(codes),
+					TemporalAdjuster.last_or_same(Weekday.SUNDAY, self.dates),
+				)
+
+	def test_containers(self):
+		expected = np.array([648, 649, 649], dtype=np.int32)
+		tests = [
+			[date(2024, 1, 31), date(2024, 2, 1), date(2024, 2, 29)],
+			(
+				datetime(2024, 1, 31, 23),
+				datetime(2024, 2, 1),
+				datetime(2024, 2, 29, 12),
+			),
+			Series(
+				np.array(
+					['2024-01-31T23', '2024-02-01', '2024-02-29T12'], 'datetime64[ns]'
+				)
+			),
+		]
+
+		for dates in tests:
+			with self.subTest(dates=dates):
+				codes, _ = TemporalAdjuster.bucket(dates, 'month')
+
+				np.testing.assert_array_equal(codes, expected)
+
+	def test_missing_dates(self):
+		codes, decoder = TemporalAdjuster.bucket(
+			np.array(['2024-06-13', 'NaT'], dtype='datetime64[D]'), 'month'
+		)
+
+		np.testing.assert_array_equal(codes, [653, MISSING_CODE])
+		np.testing.assert_array_equal(
+			decoder(codes), np.array(['2024-06-01', 'NaT'], dtype='datetime64[D]')
+		)
+
+	def test_decoder(self):
+		_, decoder = TemporalAdjuster.bucket([date(2024, 6, 13)], 'quarter')
+
+		self.assertEqual(decoder, PeriodDecoder('quarter', Weekday.MONDAY))
+		self.assertEqual(decoder(217), np.datetime64('2024-04-01'))
+		self.assertEqual(decoder.end(217), np.datetime64('2024-06-30'))
+		self.assertEqual(pickle.loads(pickle.dumps(decoder)), decoder)
+
+	def test_invalid_arguments(self):
+		tests = [
+			([date(2024, 6, 13)], 'fortnight'),
+			(np.array([-(2**40)], dtype='datetime64[D]'), 'week'),
+		]
+
+		for dates, period in tests:
+			with self.subTest(period=period):
+				with self.assertRaises(ValueError):
+					TemporalAdjuster.bucket(dates, period)
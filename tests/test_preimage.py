@@ -0,0 +1,119 @@
+from datetime import date
+from unittest import TestCase
+
+import numpy as np
+
+from temporal_adjuster import FiscalCalendar, TemporalAdjuster
+from temporal_adjuster.common.enums import Weekday
+from temporal_adjuster.common.exceptions import DateError
+
+from tests.test_vectorized import FIRST_AND_LAST_DAY_METHODS, WEEKDAY_METHODS
+
+
+def _brute_force_preimage(adjuster, dates, first, last):
+	"""
+	Returns the intervals of the given dates whose adjusted dates are between the given bounds, adjusting every date.
+	"""
+	try:
+		adjusted = adjuster(dates)
+
+	except DateError:
+		adjusted = np.full(dates.shape, np.datetime64('NaT'), dtype=dates.dtype)
+
+		for index, day in enumerate(dates.tolist()):
+			try:
+				adjusted[index] = adjuster(day)
+
+			except DateError:
+				pass
+
+	selected = (adjusted >= first) & (adjusted <= last)
+	edges = np.flatnonzero(np.diff(np.concatenate([[0], selected, [0]])))
+
+	return [(dates[start], dates[stop - 1]) for start, stop in edges.reshape(-1, 2)]
+
+
+class TestPreimage(TestCase):
+	# Inputs around the targets, wide enough for the preimages of the yearly adjusters.
+	dates = np.arange('2021-06-01', '2027-06-01', dtype='datetime64[D]')
+	targets = [
+		(np.datetime64('2024-02-29'), np.datetime64('2024-02-29')),
+		(np.datetime64('2024-05-27'), np.datetime64('2024-06-09')),
+		(np.datetime64('2023-12-25'), np.datetime64('2024-01-07')),
+		(np.datetime64('2024-03-01'), np.datetime64('2024-11-30')),
+	]
+
+	def assert_preimages(self, adjuster):
+		for first, last in self.targets:
+			with self.subTest(adjuster=adjuster, first=first, last=last):
+				self.assertListEqual(
+					adjuster.preimage(first, last),
+					_brute_force_preimage(adjuster, self.dates, first, last),
+				)
+
+	def test_first_and_last_day_methods(self):
+		for name in FIRST_AND_LAST_DAY_METHODS:
+			self.assert_preimages(getattr(TemporalAdjuster, name).bind())
+
+	def test_weekday_methods(self):
+		for name in WEEKDAY_METHODS:
+			for weekday in (Weekday.MONDAY, Weekday.FRIDAY, Weekday.SUNDAY):
+				self.assert_preimages(getattr(TemporalAdjuster, name).bind(weekday))
+
+	def test_nth_methods(self):
+		tests = [
+			('nth_of_month', [1, 4, 5]),
+			('nth_of_quarter', [1, 13, 14]),
+			('nth_of_year', [1, 53]),
+			('nth_from_date', [1, 3]),
+		]
+
+		for name, occurrences in tests:
+			for n in occurrences:
+				self.assert_preimages(
+					getattr(TemporalAdjuster, name).bind(Weekday.FRIDAY, n=n)
+				)
+
+	def test_fiscal_calendar_methods(self):
+		calendar = FiscalCalendar()
+
+		for name in (
+			'first_day_of_fiscal_year',
+			'last_day_of_fiscal_year',
+			'first_day_of_fiscal_period',
+			'last_day_of_fiscal_period',
+		):
+			self.assert_preimages(getattr(FiscalCalendar, name).bind(calendar))
+
+	def test_single_target(self):
+		adjuster = TemporalAdjuster.last_of_month.bind(Weekday.FRIDAY)
+		tests = [
+			(date(2024, 5, 31), [(date(2024, 5, 1), date(2024, 5, 31))]),
+			(date(2024, 5, 30), []),
+			(
+				np.datetime64('2024-06-28'),
+				[(np.datetime64('2024-06-01'), np.datetime64('2024-06-30'))],
+			),
+		]
+
+		for target, expected in tests:
+			with self.subTest(target=target):
+				self.assertListEqual(adjuster.preimage(target), expected)
+
+	def test_months_without_occurrence(self):
+		adjuster = TemporalAdjuster.nth_of_month.bind(Weekday.FRIDAY, n=5)
+
+		self.assertListEqual(
+			adjuster.preimage(date(2024, 1, 1), date(2024, 12, 31)),
+			[
+				(date(2024, 3, 1), date(2024, 3, 31)),
+				(date(2024, 5, 1), date(2024, 5, 31)),
+				(date(2024, 8, 1), date(2024, 8, 31)),
+				(date(2024, 11, 1), date(2024, 11, 30)),
+			],
+		)
+
+	def test_empty_range(self):
+		adjuster = TemporalAdjuster.first_day_of_month.bind()
+
+		self.assertListEqual(adjuster.preimage(date(2024, 6, 2), date(2024, 6, 1)), [])
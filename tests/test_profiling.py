@@ -0,0 +1,67 @@
+from datetime import date
+from unittest import TestCase
+
+from temporal_adjuster.common.enums import Weekday
+from temporal_adjuster.common.profiling import PHASES
+from temporal_adjuster.temporal_adjuster import TemporalAdjuster
+
+
+class TestProfiling(TestCase):
+	test_input = [date(2024, 6, 13), date(2024, 12, 31)]
+
+	def test_profile_records_batch_phases_success(self):
+		with TemporalAdjuster.profile() as profile:
+			TemporalAdjuster.next(Weekday.MONDAY, self.test_input)
+			TemporalAdjuster.next('MONDAY', tuple(self.test_input))
+			TemporalAdjuster.first_day_of_next_week(self.test_input)
+
+		self.assertDictEqual(profile.calls, {'next': 2, 'first_day_of_next_week': 1})
+
+		for method, timings in profile.timings.items():
+			with self.subTest(f'Testing phases of method {method}'):
+				self.assertTupleEqual(tuple(timings), PHASES)
+				self.assertTrue(all(seconds >= 0 for seconds in timings.values()))
+
+		self.assertAlmostEqual(
+			sum(profile.totals.values()),
+			sum(sum(timings.values()) for timings in profile.timings.values()),
+		)
+
+	def test_profile_ignores_scalar_calls_success(self):
+		with TemporalAdjuster.profile() as profile:
+			TemporalAdjuster.next(Weekday.MONDAY, date(2024, 6, 13))
+			TemporalAdjuster.first_day_of_next_week(date(2024, 6, 13))
+
+		self.assertDictEqual(profile.calls, {})
+		self.assertDictEqual(profile.totals, dict.fromkeys(PHASES, 0.0))
+
+	def test_profile_is_inactive_outside_context_success(self):
+		with TemporalAdjuster.profile() as profile:
+			pass
+
+		TemporalAdjuster.next(Weekday.MONDAY, self.test_input)
+
+		self.assertDictEqual(profile.calls, {})
+
+	def test_nested_profiles_success(self):
+		with TemporalAdjuster.profile() as outer:
+			TemporalAdjuster.first_day_of_month(self.test_input)
+
+			with TemporalAdjuster.profile() as inner:
+				TemporalAdjuster.last_day_of_month(self.test_input)
+
+			TemporalAdjuster.first_day_of_month(self.test_input)
+
+		self.assertDictEqual(outer.calls, {'first_day_of_month': 2})
+		self.assertDictEqual(inner.calls, {'last_day_of_month': 1})
+
+	def test_report_success(self):
+		with TemporalAdjuster.profile() as profile:
+			TemporalAdjuster.first_day_of_month(self.test_input)
+
+		report = profile.report().splitlines()
+
+		self.assertTrue(all(phase in report[0] for phase in PHASES))
+		self.assertTrue(report[2].startswith('first_day_of_month'))
+		self.assertTrue(report[-1].startswith('total'))
+		self.assertIn('first_day_of_month', repr(profile))
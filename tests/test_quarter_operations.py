@@ -0,0 +1,84 @@
+from datetime import date, datetime
+from unittest import TestCase
+
+from temporal_adjuster.common.enums import ISOWeekday, Weekday
+from temporal_adjuster.common.exceptions import DateError
+from temporal_adjuster.temporal_adjuster import TemporalAdjuster
+
+
+class TestTemporalAdjusterForQuarters(TestCase):
+	def test_first_and_last_day_of_quarter_success(self):
+		tests = [
+			('first_day_of_quarter', date(2024, 6, 13), date(2024, 4, 1)),
+			('first_day_of_quarter', date(2024, 1, 1), date(2024, 1, 1)),
+			(
+				'first_day_of_quarter',
+				datetime(2024, 12, 31, 9),
+				datetime(2024, 10, 1, 9),
+			),
+			('first_day_of_next_quarter', date(2024, 6, 13), date(2024, 7, 1)),
+			('first_day_of_next_quarter', date(2024, 11, 30), date(2025, 1, 1)),
+			('first_day_of_last_quarter', date(2024, 6, 13), date(2024, 1, 1)),
+			('first_day_of_last_quarter', date(2024, 2, 29), date(2023, 10, 1)),
+			('last_day_of_quarter', date(2024, 6, 13), date(2024, 6, 30)),
+			('last_day_of_quarter', date(2024, 2, 29), date(2024, 3, 31)),
+			('last_day_of_quarter', datetime(2024, 12, 31), datetime(2024, 12, 31)),
+			('last_day_of_next_quarter', date(2024, 6, 13), date(2024, 9, 30)),
+			('last_day_of_next_quarter', date(2024, 12, 31), date(2025, 3, 31)),
+			('last_day_of_last_quarter', date(2024, 6, 13), date(2024, 3, 31)),
+			('last_day_of_last_quarter', date(2024, 1, 1), date(2023, 12, 31)),
+		]
+
+		for index, test in enumerate(tests):
+			with self.subTest(
+				f'Testing method {test[0]} (subtest {index}) with inputs: {test}'
+			):
+				method, test_input, test_expected_output = test
+
+				self.assertEqual(
+					getattr(TemporalAdjuster, method)(test_input), test_expected_output
+				)
+
+	def test_nth_of_quarter_success(self):
+		tests = [
+			(Weekday.MONDAY, date(2024, 6, 13), 1, date(2024, 4, 1)),
+			(Weekday.FRIDAY, date(2024, 6, 13), 13, date(2024, 6, 28)),
+			(ISOWeekday.MONDAY, datetime(2024, 2, 1), 13, datetime(2024, 3, 25)),
+			('sunday', date(2024, 12, 31), 2, date(2024, 10, 13)),
+		]
+
+		for index, test in enumerate(tests):
+			with self.subTest(
+				f'Testing method nth_of_quarter (subtest {index}) with inputs: {test}'
+			):
+				(
+					test_input_weekday,
+					test_input_date,
+					test_input_n,
+					test_expected_output,
+				) = test
+
+				self.assertEqual(
+					TemporalAdjuster.nth_of_quarter(
+						test_input_weekday, test_input_date, test_input_n
+					),
+					test_expected_output,
+				)
+
+	def test_nth_of_quarter_failure(self):
+		tests = [
+			(Weekday.MONDAY, date(2024, 6, 13), 0, ValueError),
+			(Weekday.MONDAY, date(2024, 6, 13), 15, ValueError),
+			(Weekday.MONDAY, date(2024, 6, 13), 14, DateError),
+		]
+
+		for index, test in enumerate(tests):
+			with self.subTest(
+				f'Testing method nth_of_quarter (subtest {index}) with inputs: {test}'
+			):
+				test_input_weekday, test_input_date, test_input_n, exception = test
+
+				with self.assertRaises(exception):
+					TemporalAdjuster.nth_of_quarter(
+						test_input_weekday, test_input_date, test_input_n
+					)
@@ -0,0 +1,257 @@
+from datetime import date, time, timedelta
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from temporal_adjuster import StreamingAdjuster
+from temporal_adjuster.common.backends import calibration_arguments
+from temporal_adjuster.common.decorators import sequenceable
+from temporal_adjuster.common.enums import Weekday
+from temporal_adjuster.temporal_adjuster import TemporalAdjuster
+
+UNITS = ['D', 's', 'ms', 'us', 'ns']
+
+
+@sequenceable(target='date')
+def _next_day(date):
+	return date + timedelta(days=1)
+
+
+class TestScalarTypes(TestCase):
+	methods = [
+		getattr(TemporalAdjuster, name)
+		for name in dir(TemporalAdjuster)
+		if getattr(getattr(TemporalAdjuster, name), 'kernel', None) is not None
+	]
+	dates = np.datetime64('2023-12-20T17:44:59.123456789') + np.arange(
+		0, 400 * 86_400 * 10**9, 3 * 86_400 * 10**9 + 3_600 * 10**9 + 789
+	).astype('timedelta64[ns]')
+
+	def test_datetime64_same_as_batch_success(self):
+		for method in self.methods:
+			for unit in UNITS:
+				if method.time_of_day and unit == 'D':
+					continue
+
+				with self.subTest(method=method.__name__, unit=unit):
+					arguments = calibration_arguments(
+						method, self.dates.astype(f'datetime64[{unit}]')
+					)
+					values = arguments.pop(method.target)
+					expected = method(
+						**{method.target: values}, **arguments, backend='numpy'
+					)
+
+					for value, expected_value in zip(values, expected):
+						output = method(**{method.target: value}, **arguments)
+
+						self.assertIsInstance(output, np.datetime64)
+						self.assertEqual(output.dtype, values.dtype)
+						self.assertEqual(output, expected_value)
+
+	def test_timestamp_same_as_batch_success(self):
+		for method in self.methods:
+			for tz in (None, 'Europe/Paris'):
+				with self.subTest(method=method.__name__, tz=tz):
+					arguments = calibration_arguments(method, self.dates)
+					values = arguments.pop(method.target)
+					expected = pd.Series(
+						method(**{method.target: values}, **arguments, backend='numpy')
+					)
+
+					# The wall times skipped or repeated by the time zone have no single expected value.
+					if tz is not None:
+						expected = expected.dt.tz_localize(
+							tz, ambiguous='NaT', nonexistent='NaT'
+						)
+
+					for value, expected_value in zip(
+						pd.Series(values).dt.tz_localize(tz), expected
+					):
+						if expected_value is pd.NaT:
+							continue
+
+						output = method(**{method.target: value}, **arguments)
+
+						self.assertIsInstance(output, pd.Timestamp)
+						self.assertEqual(output.tz, expected_value.tz)
+						self.assertEqual(output, expected_value)
+
+	def test_scalar_success(self):
+		tests = [
+			(
+				'first_day_of_month',
+				(),
+				pd.Timestamp('2024-06-13 17:44:59.123456789'),
+				pd.Timestamp('2024-06-01 17:44:59.123456789'),
+			),
+			(
+				'first_day_of_iso_year',
+				(),
+				pd.Timestamp('2024-06-13 17:44', tz='Europe/Paris'),
+				pd.Timestamp('2024-01-01 17:44', tz='Europe/Paris'),
+			),
+			(
+				'next',
+				(Weekday.FRIDAY,),
+				pd.Timestamp('2024-06-13 17:44').as_unit('s'),
+				pd.Timestamp('2024-06-14 17:44').as_unit('s'),
+			),
+			(
+				'start_of_day',
+				(),
+				pd.Timestamp('2024-06-13 17:44:59.123456789'),
+				pd.Timestamp('2024-06-13'),
+			),
+			(
+				'next_time',
+				(time(17, 30),),
+				pd.Timestamp('2024-06-13 17:44', tz='Europe/Paris'),
+				pd.Timestamp('2024-06-14 17:30', tz='Europe/Paris'),
+			),
+			(
+				'first_day_of_month',
+				(),
+				np.datetime64('2024-06', 'M'),
+				np.datetime64('2024-06', 'M'),
+			),
+			(
+				'last_day_of_month',
+				(),
+				np.datetime64('12345-06-13'),
+				np.datetime64('12345-06-30'),
+			),
+			('last_day_of_month', (), pd.NaT, pd.NaT),
+			(
+				'next',
+				(Weekday.FRIDAY,),
+				np.datetime64('NaT', 'ns'),
+				np.datetime64('NaT', 'ns'),
+			),
+		]
+
+		for index, test in enumerate(tests):
+			with self.subTest(
+				f'Testing method {test[0]} (subtest {index}) with inputs: {test}'
+			):
+				method, test_args, test_input, test_expected_output = test
+
+				output = getattr(TemporalAdjuster, method)(*test_args, test_input)
+
+				self.assertIs(type(output), type(test_expected_output))
+
+				if test_input is pd.NaT or (
+					isinstance(test_input, np.datetime64) and np.isnat(test_input)
+				):
+					self.assertIs(output, test_input)
+
+				else:
+					self.assertEqual(output, test_expected_output)
+					self.assertEqual(
+						getattr(output, 'dtype', None),
+						getattr(test_expected_output, 'dtype', None),
+					)
+					self.assertEqual(
+						getattr(output, 'unit', None), getattr(test_input, 'unit', None)
+					)
+
+	def test_daylight_saving_gap_success(self):
+		# Equal timestamps may differ in their wall time, so their ISO formats are compared.
+		tests = [
+			(
+				'last_of_month',
+				(Weekday.SUNDAY,),
+				pd.Timestamp('2024-03-15 02:30:00.000000123', tz='Europe/Berlin'),
+				'2024-03-31T03:30:00.000000123+02:00',
+			),
+			(
+				'next_time',
+				(time(2, 30),),
+				pd.Timestamp('2024-03-30 02:30', tz='Europe/Berlin'),
+				'2024-03-31T03:30:00+02:00',
+			),
+			(
+				'last_of_month',
+				(Weekday.SUNDAY,),
+				pd.Timestamp('2024-10-15 02:30', tz='Europe/Berlin'),
+				'2024-10-27T02:30:00+02:00',
+			),
+		]
+
+		for index, test in enumerate(tests):
+			with self.subTest(
+				f'Testing method {test[0]} (subtest {index}) with inputs: {test}'
+			):
+				method, test_args, test_input, test_expected_output = test
+
+				output = getattr(TemporalAdjuster, method)(*test_args, test_input)
+
+				self.assertEqual(output.isoformat(), test_expected_output)
+
+	def test_function_without_kernel_success(self):
+		tests = [
+			(np.datetime64('2024-06-13'), np.datetime64('2024-06-14')),
+			(
+				np.datetime64('2024-06-13T17:44:59.123456789'),
+				np.datetime64('2024-06-14T17:44:59.123456'),
+			),
+			(
+				pd.Timestamp('2024-06-13 17:44:59.123456789'),
+				pd.Timestamp('2024-06-14 17:44:59.123456789'),
+			),
+		]
+
+		for index, test in enumerate(tests):
+			with self.subTest(
+				f'Testing _next_day (subtest {index}) with inputs: {test}'
+			):
+				test_input, test_expected_output = test
+
+				output = _next_day(test_input)
+
+				self.assertIs(type(output), type(test_expected_output))
+				self.assertEqual(output, test_expected_output)
+
+	def test_bound_adjuster_success(self):
+		adjuster = TemporalAdjuster.last_of_month.bind(Weekday.FRIDAY)
+
+		self.assertEqual(
+			adjuster(np.datetime64('2024-06-13T17:44:59.123456789')),
+			np.datetime64('2024-06-28T17:44:59.123456789'),
+		)
+		self.assertEqual(
+			adjuster(pd.Timestamp('2024-06-13 17:44', tz='Europe/Paris')),
+			pd.Timestamp('2024-06-28 17:44', tz='Europe/Paris'),
+		)
+		self.assertEqual(adjuster(date(2024, 6, 13)), date(2024, 6, 28))
+		self.assertEqual(
+			StreamingAdjuster(adjuster)(pd.Timestamp('2024-06-13 17:44')),
+			pd.Timestamp('2024-06-28 17:44'),
+		)
+
+	def test_failure(self):
+		tests = [
+			('start_of_day', (np.datetime64('2024-06-13'),), {}, TypeError),
+			(
+				'first_day_of_next_month',
+				(np.datetime64(np.iinfo(np.int64).max, 'ns'),),
+				{},
+				OverflowError,
+			),
+			(
+				'first_day_of_month',
+				(pd.Timestamp('2024-06-13'),),
+				{'out': np.empty(1, dtype='datetime64[ns]')},
+				TypeError,
+			),
+		]
+
+		for index, test in enumerate(tests):
+			with self.subTest(
+				f'Testing method {test[0]} (subtest {index}) with inputs: {test}'
+			):
+				method, test_args, test_kwargs, test_exception = test
+
+				with self.assertRaises(test_exception):
+					getattr(TemporalAdjuster, method)(*test_args, **test_kwargs)
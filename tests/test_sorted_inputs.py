@@ -0,0 +1,139 @@
+from unittest import TestCase
+
+import numpy as np
+
+from temporal_adjuster import FiscalCalendar, TemporalAdjuster
+from temporal_adjuster.common.decorators import sequenceable
+from temporal_adjuster.common.enums import Weekday
+from temporal_adjuster.common.exceptions import DateError
+from temporal_adjuster.modules.kernels import first_and_last_day_kernels as kernels
+from temporal_adjuster.modules.kernels import preimage_kernels as preimages
+from temporal_adjuster.modules.kernels.calendar import month_start
+
+from tests.test_vectorized import FIRST_AND_LAST_DAY_METHODS, WEEKDAY_METHODS
+
+# The number of days adjusted by each call of the kernel of `_first_day_of_month`.
+_kernel_calls = []
+
+
+def _counted_first_day_of_month(days):
+	_kernel_calls.append(days.size)
+
+	return kernels.first_day_of_month(days)
+
+
+@sequenceable(
+	target='date',
+	kernel=_counted_first_day_of_month,
+	preimage=preimages.period(month_start),
+)
+def _first_day_of_month(date):
+	return date.replace(day=1)
+
+
+class TestSortedInputs(TestCase):
+	# A time-ordered log with several items on most days, and a few gaps.
+	days = np.arange('2022-11-20', '2024-03-10', dtype='datetime64[D]')
+	dates = np.repeat(days, np.arange(days.size) % 5)
+
+	def assert_same_as_items(self, method, *args, **kwargs):
+		np.testing.assert_array_equal(
+			method(*args, self.dates, **kwargs),
+			method(*args, self.dates, **kwargs, backend='python'),
+		)
+
+	def test_first_and_last_day_methods(self):
+		for name in FIRST_AND_LAST_DAY_METHODS:
+			with self.subTest(method=name):
+				self.assert_same_as_items(getattr(TemporalAdjuster, name))
+
+	def test_weekday_methods(self):
+		for name in WEEKDAY_METHODS:
+			with self.subTest(method=name):
+				self.assert_same_as_items(
+					getattr(TemporalAdjuster, name), Weekday.SUNDAY
+				)
+
+	def test_nth_methods(self):
+		tests = [
+			(TemporalAdjuster.nth_of_month, 4),
+			(TemporalAdjuster.nth_of_quarter, 13),
+			(TemporalAdjuster.nth_of_year, 52),
+			(TemporalAdjuster.nth_from_date, 3),
+		]
+
+		for method, n in tests:
+			with self.subTest(method=method.__name__):
+				self.assert_same_as_items(method, Weekday.FRIDAY, n=n)
+
+	def test_fiscal_calendar_methods(self):
+		calendar = FiscalCalendar()
+
+		self.assert_same_as_items(calendar.last_day_of_fiscal_period)
+
+	def test_only_present_days_are_adjusted(self):
+		# Months without a 5th Friday between the items must not raise.
+		dates = np.repeat(
+			np.array(['2024-03-01', '2024-05-31'], dtype='datetime64[D]'), 10
+		)
+
+		np.testing.assert_array_equal(
+			TemporalAdjuster.nth_of_month(Weekday.FRIDAY, dates, 5),
+			np.repeat(
+				np.array(['2024-03-29', '2024-05-31'], dtype='datetime64[D]'), 10
+			),
+		)
+
+		with self.assertRaises(DateError):
+			TemporalAdjuster.nth_of_month(
+				Weekday.FRIDAY, np.append(dates, np.datetime64('2024-06-01')), 5
+			)
+
+	def test_runs_span_periods(self):
+		tests = {
+			'daily': np.arange('2000-01-01', '2024-01-01', dtype='datetime64[D]'),
+			'hourly': np.arange(
+				'2023-01-01',
+				'2024-01-01',
+				np.timedelta64(1, 'h'),
+				dtype='datetime64[h]',
+			),
+		}
+
+		for name, dates in tests.items():
+			with self.subTest(dates=name):
+				_kernel_calls.clear()
+				adjusted = _first_day_of_month(dates, backend='numpy')
+
+				np.testing.assert_array_equal(
+					adjusted,
+					TemporalAdjuster.first_day_of_month(dates, backend='python'),
+				)
+				self.assertLess(sum(_kernel_calls), dates.size // 8)
+
+	def test_multidimensional_and_out(self):
+		dates = self.dates[: self.dates.size // 4 * 4].reshape(-1, 4)
+		out = np.empty_like(dates)
+
+		TemporalAdjuster.last_of_month(Weekday.FRIDAY, dates, out=out)
+
+		np.testing.assert_array_equal(
+			out.reshape(-1),
+			TemporalAdjuster.last_of_month(
+				Weekday.FRIDAY, dates.reshape(-1), backend='python'
+			),
+		)
+
+	def test_unsorted_inputs(self):
+		tests = [
+			self.dates[::-1],
+			np.concatenate([self.dates, self.dates[:10]]),
+			np.append(self.dates, np.datetime64('NaT')),
+		]
+
+		for dates in tests:
+			with self.subTest(size=dates.size):
+				np.testing.assert_array_equal(
+					TemporalAdjuster.first_day_of_month(dates),
+					TemporalAdjuster.first_day_of_month(dates, backend='python'),
+				)
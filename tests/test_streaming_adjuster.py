@@ -0,0 +1,188 @@
+import random
+from datetime import date, datetime, timedelta, timezone
+from unittest import TestCase
+from unittest.mock import patch
+from zoneinfo import ZoneInfo
+
+import numpy as np
+from pandas import Timestamp
+
+from temporal_adjuster import FiscalCalendar, StreamingAdjuster, TemporalAdjuster
+from temporal_adjuster.common.decorators import BoundAdjuster
+from temporal_adjuster.common.enums import Weekday
+from temporal_adjuster.common.exceptions import DateError
+
+
+def _events(count, seed):
+	"""
+	Returns the given number of dates and datetimes spanning a few months, shuffled locally as the events of a stream arriving out of order.
+	"""
+	generator = random.Random(seed)
+	events = []
+
+	for index in range(count):
+		day = date(2023, 12, 1) + timedelta(
+			days=max(0, int(generator.gauss(index / 20, 10)))
+		)
+
+		if index % 2:
+			events.append(
+				datetime.combine(day, datetime.min.time(), tzinfo=timezone.utc)
+				+ timedelta(minutes=index)
+			)
+
+		else:
+			events.append(day)
+
+	return events
+
+
+class TestStreamingAdjuster(TestCase):
+	adjusters = [
+		TemporalAdjuster.first_day_of_week.bind(),
+		TemporalAdjuster.last_day_of_next_quarter.bind(),
+		TemporalAdjuster.first_day_of_iso_year.bind(),
+		TemporalAdjuster.next.bind(Weekday.FRIDAY),
+		TemporalAdjuster.last_of_month.bind(Weekday.FRIDAY),
+		TemporalAdjuster.nth_of_month.bind(weekday=Weekday.MONDAY, n=5),
+	]
+
+	def test_matches_adjuster(self):
+		for adjuster in self.adjusters:
+			for history in (0, 4):
+				with self.subTest(adjuster=adjuster, history=history):
+					stream = StreamingAdjuster(adjuster, history=history)
+
+					for event in _events(2000, seed=history):
+						try:
+							expected = adjuster(event)
+
+						except DateError:
+							with self.assertRaises(DateError):
+								stream(event)
+
+							continue
+
+						output = stream(event)
+
+						self.assertIs(type(output), type(expected))
+						self.assertEqual(output, expected)
+
+	def test_adjuster_is_called_on_boundaries(self):
+		stream = StreamingAdjuster(TemporalAdjuster.last_of_month.bind(Weekday.FRIDAY))
+		events = [
+			datetime(2024, 5, 31, 23, 59),
+			datetime(2024, 6, 1, 0, 1),
+			datetime(2024, 5, 31, 23, 59, 30),
+			datetime(2024, 6, 13),
+			datetime(2024, 6, 30),
+			datetime(2024, 7, 1),
+		]
+
+		with patch.object(
+			BoundAdjuster, 'preimage', autospec=True, side_effect=BoundAdjuster.preimage
+		) as preimage:
+			outputs = [stream(event) for event in events]
+
+		self.assertEqual(preimage.call_count, 3)
+		self.assertListEqual(
+			outputs,
+			[
+				datetime(2024, 5, 31, 23, 59),
+				datetime(2024, 6, 28, 0, 1),
+				datetime(2024, 5, 31, 23, 59, 30),
+				datetime(2024, 6, 28),
+				datetime(2024, 6, 28),
+				datetime(2024, 7, 26),
+			],
+		)
+		self.assertEqual(stream.period, (date(2024, 7, 1), date(2024, 7, 31)))
+
+	def test_time_zone_wall_time_across_dst(self):
+		adjuster = TemporalAdjuster.next.bind(Weekday.MONDAY)
+		tests = [
+			Timestamp('2024-03-08 14:30', tz='US/Eastern'),
+			Timestamp('2024-11-01 23:15', tz='US/Eastern'),
+			datetime(2024, 3, 8, 14, 30, tzinfo=ZoneInfo('Europe/London')),
+			datetime(2024, 3, 29, 8, tzinfo=ZoneInfo('Europe/London')),
+		]
+
+		for event in tests:
+			with self.subTest(event=event):
+				stream = StreamingAdjuster(adjuster)
+				output = stream(event)
+
+				self.assertEqual(output, adjuster(event))
+				self.assertEqual(output.time(), event.time())
+				self.assertEqual(output.tzinfo, event.tzinfo)
+
+		self.assertEqual(
+			StreamingAdjuster(adjuster)(tests[0]),
+			Timestamp('2024-03-11 14:30', tz='US/Eastern'),
+		)
+
+	def test_time_zone_daylight_saving_gap(self):
+		adjuster = TemporalAdjuster.last_of_month.bind(Weekday.SUNDAY)
+		event = Timestamp('2024-03-15 02:30', tz='Europe/Berlin')
+
+		# Equal timestamps may differ in their wall time, so their ISO formats are compared.
+		self.assertEqual(
+			StreamingAdjuster(adjuster)(event).isoformat(), '2024-03-31T03:30:00+02:00'
+		)
+		self.assertEqual(
+			StreamingAdjuster(adjuster)(event).isoformat(), adjuster(event).isoformat()
+		)
+
+	def test_datetime64_events(self):
+		adjuster = TemporalAdjuster.last_of_month.bind(Weekday.FRIDAY)
+		stream = StreamingAdjuster(adjuster)
+		tests = [
+			np.datetime64('2024-06-13'),
+			np.datetime64('2024-06-14T10:30'),
+			np.datetime64('2024-07-01T00:00:00.123456789'),
+			np.datetime64('NaT', 's'),
+		]
+
+		for event in tests:
+			with self.subTest(event=event):
+				output = stream(event)
+
+				self.assertEqual(output.dtype, event.dtype)
+				np.testing.assert_equal(output, adjuster(event))
+
+	def test_fiscal_calendar_method(self):
+		calendar = FiscalCalendar()
+		stream = StreamingAdjuster(calendar.first_day_of_fiscal_period)
+
+		for event in _events(500, seed=1):
+			with self.subTest(event=event):
+				self.assertEqual(
+					stream(event), calendar.first_day_of_fiscal_period(event)
+				)
+
+		self.assertEqual(
+			stream.adjuster, FiscalCalendar.first_day_of_fiscal_period.bind(calendar)
+		)
+
+	def test_period(self):
+		stream = StreamingAdjuster(TemporalAdjuster.first_day_of_week)
+
+		self.assertIsNone(stream.period)
+		self.assertEqual(stream(date(2024, 6, 13)), date(2024, 6, 10))
+		self.assertEqual(stream.period, (date(2024, 6, 10), date(2024, 6, 16)))
+		self.assertEqual(stream.adjuster, TemporalAdjuster.first_day_of_week.bind())
+
+	def test_invalid_arguments_failure(self):
+		tests = [
+			((TemporalAdjuster.next,), TypeError),
+			((TemporalAdjuster.first_day_of_week, -1), ValueError),
+		]
+
+		for index, test in enumerate(tests):
+			with self.subTest(
+				f'Testing StreamingAdjuster (subtest {index}) with inputs: {test}'
+			):
+				test_arguments, test_exception = test
+
+				with self.assertRaises(test_exception):
+					StreamingAdjuster(*test_arguments)
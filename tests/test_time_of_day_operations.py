@@ -0,0 +1,208 @@
+from datetime import date, datetime, time, timezone
+from unittest import TestCase
+
+import numpy as np
+
+from temporal_adjuster import StreamingAdjuster
+from temporal_adjuster.temporal_adjuster import TemporalAdjuster
+
+METHODS = [
+	('start_of_day', (), {}),
+	('end_of_day', (), {}),
+	('start_of_hour', (), {}),
+	('truncate_to', (), {}),
+	('truncate_to', (), {'minutes': 7}),
+	('truncate_to', (), {'minutes': 90}),
+	('next_time', ('17:30',), {}),
+	('next_time', (time(6, 15),), {}),
+	('next_or_same_time', ('17:30',), {}),
+	('next_or_same_time', (time(0),), {}),
+]
+
+
+class TestTimeOfDayOperations(TestCase):
+	def test_scalar_success(self):
+		test_input = datetime(2024, 6, 13, 17, 44, 59, 123456, tzinfo=timezone.utc)
+
+		tests = [
+			('start_of_day', (), {}, datetime(2024, 6, 13, tzinfo=timezone.utc)),
+			(
+				'end_of_day',
+				(),
+				{},
+				datetime(2024, 6, 13, 23, 59, 59, 999999, tzinfo=timezone.utc),
+			),
+			('start_of_hour', (), {}, datetime(2024, 6, 13, 17, tzinfo=timezone.utc)),
+			('truncate_to', (), {}, datetime(2024, 6, 13, 17, 30, tzinfo=timezone.utc)),
+			(
+				'truncate_to',
+				(),
+				{'minutes': 100},
+				datetime(2024, 6, 13, 16, 40, tzinfo=timezone.utc),
+			),
+			(
+				'next_time',
+				('17:30',),
+				{},
+				datetime(2024, 6, 14, 17, 30, tzinfo=timezone.utc),
+			),
+			(
+				'next_time',
+				('18:00',),
+				{},
+				datetime(2024, 6, 13, 18, tzinfo=timezone.utc),
+			),
+			(
+				'next_or_same_time',
+				(time(17, 44, 59, 123456),),
+				{},
+				test_input,
+			),
+		]
+
+		for index, test in enumerate(tests):
+			with self.subTest(
+				f'Testing method {test[0]} (subtest {index}) with inputs: {test}'
+			):
+				method, test_args, test_kwargs, test_expected_output = test
+
+				output = getattr(TemporalAdjuster, method)(
+					*test_args, test_input, **test_kwargs
+				)
+
+				self.assertEqual(output, test_expected_output)
+				self.assertEqual(output.tzinfo, timezone.utc)
+
+	def test_vectorized_same_as_datetime_success(self):
+		dates = np.datetime64('2024-06-13T17:44:59.123456') + np.arange(
+			-(10**12), 10**12, 7 * 10**9 + 123457
+		).astype('timedelta64[us]')
+		dates[:8] = np.datetime64('2024-06-13T00:00') + np.arange(8) * np.timedelta64(
+			15, 'm'
+		)
+
+		for method, test_args, test_kwargs in METHODS:
+			for unit in ('us', 's', 'm'):
+				with self.subTest(method=method, args=test_args, unit=unit):
+					test_input = dates.astype(f'datetime64[{unit}]')
+
+					output = getattr(TemporalAdjuster, method)(
+						*test_args, test_input, backend='numpy', **test_kwargs
+					)
+					expected = getattr(TemporalAdjuster, method)(
+						*test_args, test_input, backend='python', **test_kwargs
+					)
+
+					self.assertEqual(output.dtype, test_input.dtype)
+					np.testing.assert_array_equal(output, expected)
+
+	def test_nanoseconds_success(self):
+		test_input = np.array(
+			['2024-06-13T17:44:59.123456789', 'NaT', '1969-12-31T23:59:59.999999999'],
+			dtype='datetime64[ns]',
+		)
+
+		tests = [
+			('start_of_day', (), {}, ['2024-06-13', 'NaT', '1969-12-31']),
+			(
+				'end_of_day',
+				(),
+				{},
+				[
+					'2024-06-13T23:59:59.999999999',
+					'NaT',
+					'1969-12-31T23:59:59.999999999',
+				],
+			),
+			('truncate_to', (), {}, ['2024-06-13T17:30', 'NaT', '1969-12-31T23:45']),
+			(
+				'next_time',
+				('17:44:59.123456',),
+				{},
+				['2024-06-14T17:44:59.123456', 'NaT', '1970-01-01T17:44:59.123456'],
+			),
+		]
+
+		for index, test in enumerate(tests):
+			with self.subTest(
+				f'Testing method {test[0]} (subtest {index}) with inputs: {test}'
+			):
+				method, test_args, test_kwargs, test_expected_output = test
+
+				output = getattr(TemporalAdjuster, method)(
+					*test_args, test_input, **test_kwargs
+				)
+
+				np.testing.assert_array_equal(
+					output, np.array(test_expected_output, dtype='datetime64[ns]')
+				)
+
+	def test_coarse_units_success(self):
+		dates = np.arange(
+			'2024-06-13T00',
+			'2024-06-15T00',
+			np.timedelta64(90, 'm'),
+			dtype='datetime64[m]',
+		)
+
+		for unit in ('h', '2h', '12h', '90m'):
+			with self.subTest(unit=unit):
+				test_input = dates.astype(f'datetime64[{unit}]')
+				output = TemporalAdjuster.start_of_hour(test_input, backend='numpy')
+
+				self.assertEqual(output.dtype, test_input.dtype)
+				np.testing.assert_array_equal(
+					output, TemporalAdjuster.start_of_hour(test_input, backend='python')
+				)
+
+		test_input = np.array(
+			['2024-06-13T10', '2024-06-13T22'], dtype='datetime64[2h]'
+		)
+
+		np.testing.assert_array_equal(
+			TemporalAdjuster.start_of_hour(test_input), test_input
+		)
+
+	def test_broadcast_minutes_success(self):
+		output = TemporalAdjuster.truncate_to(
+			np.array(['2024-06-13T17:44', '2024-06-13T17:44'], dtype='datetime64[m]'),
+			minutes=[15, 60],
+		)
+
+		np.testing.assert_array_equal(
+			output,
+			np.array(['2024-06-13T17:30', '2024-06-13T17:00'], dtype='datetime64[m]'),
+		)
+
+	def test_failure(self):
+		tests = [
+			('start_of_day', (date(2024, 6, 13),), {}, TypeError),
+			(
+				'start_of_day',
+				(np.array(['2024-06-13', '2024-06-14'], dtype='datetime64[D]'),),
+				{},
+				TypeError,
+			),
+			('truncate_to', (datetime(2024, 6, 13),), {'minutes': 0}, ValueError),
+			(
+				'truncate_to',
+				(np.array(['2024-06-13T10', '2024-06-14T10'], dtype='datetime64[s]'),),
+				{'minutes': [15, 0]},
+				ValueError,
+			),
+			('next_time', ('25:00', datetime(2024, 6, 13)), {}, ValueError),
+			('next_time', (1730, [datetime(2024, 6, 13)]), {}, TypeError),
+		]
+
+		for index, test in enumerate(tests):
+			with self.subTest(
+				f'Testing method {test[0]} (subtest {index}) with inputs: {test}'
+			):
+				method, test_args, test_kwargs, test_exception = test
+
+				with self.assertRaises(test_exception):
+					getattr(TemporalAdjuster, method)(*test_args, **test_kwargs)
+
+	def test_streaming_failure(self):
+		with self.assertRaises(TypeError):
+			StreamingAdjuster(TemporalAdjuster.start_of_day)
@@ -0,0 +1,300 @@
+import tracemalloc
+from datetime import date, timedelta
+from unittest import TestCase
+
+import numpy as np
+
+from temporal_adjuster.common.enums import ISOWeekday, Weekday
+from temporal_adjuster.common.exceptions import DateError
+from temporal_adjuster.common.parallel.thread_pool import DEFAULT_CHUNK_SIZE
+from temporal_adjuster.temporal_adjuster import TemporalAdjuster
+
+FIRST_AND_LAST_DAY_METHODS = [
+	f'{position}_day_of_{period}'
+	for position in ('first', 'last')
+	for period in (
+		'week',
+		'next_week',
+		'last_week',
+		'month',
+		'next_month',
+		'last_month',
+		'year',
+		'next_year',
+		'last_year',
+		'quarter',
+		'next_quarter',
+		'last_quarter',
+		'iso_year',
+		'next_iso_year',
+		'last_iso_year',
+	)
+]
+
+WEEKDAY_METHODS = ['next', 'next_or_same', 'last', 'last_or_same'] + [
+	f'{position}_of_{period}'
+	for position in ('first', 'last')
+	for period in (
+		'month',
+		'next_month',
+		'last_month',
+		'year',
+		'next_year',
+		'last_year',
+	)
+]
+
+
+class TestVectorized(TestCase):
+	test_input = [date(1899, 12, 25) + timedelta(days=day) for day in range(0, 3000, 7)]
+	test_input += [
+		date(1900, 2, 28) + timedelta(days=day) for day in range(0, 3000, 11)
+	]
+	test_input += [date(2000, 2, 29), date(2024, 12, 31), date(9997, 6, 15)]
+
+	def assertVectorizedEqual(self, method, *args, **kwargs):
+		output = getattr(TemporalAdjuster, method)(
+			*args, np.array(self.test_input, dtype='datetime64[D]'), **kwargs
+		)
+		expected_output = [
+			getattr(TemporalAdjuster, method)(*args, test_input, **kwargs)
+			for test_input in self.test_input
+		]
+
+		self.assertEqual(output.dtype, np.dtype('datetime64[D]'))
+		self.assertListEqual(output.tolist(), expected_output)
+
+	def test_first_and_last_day_methods_success(self):
+		for method in FIRST_AND_LAST_DAY_METHODS:
+			with self.subTest(f'Testing vectorized method {method}'):
+				self.assertVectorizedEqual(method)
+
+	def test_weekday_methods_success(self):
+		for method in WEEKDAY_METHODS:
+			for weekday in Weekday:
+				with self.subTest(
+					f'Testing vectorized method {method} with weekday {weekday.name}'
+				):
+					self.assertVectorizedEqual(method, weekday)
+
+	def test_weekday_formats_success(self):
+		tests = [ISOWeekday.FRIDAY, 'FRIDAY', 4]
+
+		for index, test in enumerate(tests):
+			with self.subTest(
+				f'Testing vectorized method next (subtest {index}) with inputs: {test}'
+			):
+				self.assertVectorizedEqual('next', test)
+
+	def test_nth_from_date_success(self):
+		for n in range(1, 6):
+			with self.subTest(f'Testing vectorized method nth_from_date with n {n}'):
+				self.assertVectorizedEqual('nth_from_date', Weekday.TUESDAY, n=n)
+
+	def test_nth_of_quarter_success(self):
+		for n in range(1, 13):
+			with self.subTest(f'Testing vectorized method nth_of_quarter with n {n}'):
+				self.assertVectorizedEqual('nth_of_quarter', Weekday.SUNDAY, n=n)
+
+	def test_nth_of_month_and_year_success(self):
+		test_input = np.array(['2024-01-15', '2024-06-13'], dtype='datetime64[D]')
+
+		np.testing.assert_array_equal(
+			TemporalAdjuster.nth_of_month(Weekday.SUNDAY, test_input, 2),
+			np.array(['2024-01-14', '2024-06-09'], dtype='datetime64[D]'),
+		)
+		np.testing.assert_array_equal(
+			TemporalAdjuster.nth_of_year(Weekday.SUNDAY, test_input, 52),
+			np.array(['2024-12-29', '2024-12-29'], dtype='datetime64[D]'),
+		)
+
+	def test_nth_of_month_and_year_failure(self):
+		test_input = np.array(['2024-02-15', '2024-06-13'], dtype='datetime64[D]')
+
+		tests = [
+			('nth_of_month', 0, ValueError),
+			('nth_of_month', 5, DateError),
+			('nth_of_year', 55, ValueError),
+			('nth_of_year', 54, DateError),
+			('nth_of_quarter', 15, ValueError),
+			('nth_of_quarter', 14, DateError),
+		]
+
+		for index, test in enumerate(tests):
+			with self.subTest(
+				f'Testing vectorized failures (subtest {index}) with inputs: {test}'
+			):
+				method, n, exception = test
+
+				with self.assertRaises(exception):
+					getattr(TemporalAdjuster, method)(Weekday.THURSDAY, test_input, n)
+
+	def test_nat_is_kept_success(self):
+		output = TemporalAdjuster.nth_of_month(
+			Weekday.MONDAY,
+			np.array(['2024-06-13', 'NaT'], dtype='datetime64[D]'),
+			1,
+		)
+
+		np.testing.assert_array_equal(
+			output, np.array(['2024-06-03', 'NaT'], dtype='datetime64[D]')
+		)
+
+
+class TestSubDayUnits(TestCase):
+	test_input = np.array(
+		[
+			'2024-06-13T14:30:15.123456789',
+			'2024-02-29T00:00:00.000000001',
+			'1969-12-31T23:59:59.999999999',
+			'1901-01-01T12:00:00',
+		],
+		dtype='datetime64[ns]',
+	)
+
+	def test_time_of_day_is_kept_success(self):
+		for unit in ('h', 'm', 's', 'ms', 'us', 'ns'):
+			test_input = self.test_input.astype(f'datetime64[{unit}]')
+
+			for method, args, kwargs in [
+				('next', (Weekday.MONDAY,), {}),
+				('last_of_month', (Weekday.FRIDAY,), {}),
+				('nth_of_quarter', (Weekday.TUESDAY,), {'n': 2}),
+				('first_day_of_next_iso_year', (), {}),
+				('last_day_of_last_month', (), {}),
+			]:
+				with self.subTest(unit=unit, method=method):
+					adjuster = getattr(TemporalAdjuster, method)
+					output = adjuster(*args, test_input, **kwargs)
+
+					self.assertEqual(output.dtype, test_input.dtype)
+					np.testing.assert_array_equal(
+						output - output.astype('datetime64[D]'),
+						test_input - test_input.astype('datetime64[D]'),
+					)
+					np.testing.assert_array_equal(
+						output.astype('datetime64[D]'),
+						adjuster(*args, test_input.astype('datetime64[D]'), **kwargs),
+					)
+
+	def test_same_as_datetime_success(self):
+		test_input = self.test_input.astype('datetime64[us]')
+
+		self.assertListEqual(
+			TemporalAdjuster.next(Weekday.MONDAY, test_input).tolist(),
+			[
+				TemporalAdjuster.next(Weekday.MONDAY, test)
+				for test in test_input.astype(object)
+			],
+		)
+
+	def test_nat_is_kept_success(self):
+		output = TemporalAdjuster.next(
+			Weekday.MONDAY,
+			np.array(['2024-06-13T14:30', 'NaT'], dtype='datetime64[ns]'),
+		)
+
+		np.testing.assert_array_equal(
+			output, np.array(['2024-06-17T14:30', 'NaT'], dtype='datetime64[ns]')
+		)
+
+	def test_out_of_range_failure(self):
+		with self.assertRaises(OverflowError):
+			TemporalAdjuster.last_day_of_year(
+				np.array(['2262-04-01T00:00'], dtype='datetime64[ns]')
+			)
+
+
+class TestOutParameter(TestCase):
+	def test_out_success(self):
+		test_input = np.array(['2024-06-13', '2024-12-31'], dtype='datetime64[D]')
+		out = np.empty_like(test_input)
+
+		output = TemporalAdjuster.first_day_of_next_week(test_input, out=out)
+
+		self.assertIs(output, out)
+		np.testing.assert_array_equal(
+			out, np.array(['2024-06-17', '2025-01-06'], dtype='datetime64[D]')
+		)
+
+	def test_out_in_place_success(self):
+		tests = [
+			np.array(['2024-06-13', '2024-12-31'], dtype='datetime64[D]'),
+			np.array([date(2024, 6, 13), date(2024, 12, 31)], dtype=object),
+		]
+
+		for index, test in enumerate(tests):
+			with self.subTest(f'Testing in-place adjustment (subtest {index})'):
+				output = TemporalAdjuster.last_of_month(Weekday.FRIDAY, test, out=test)
+
+				self.assertIs(output, test)
+				self.assertListEqual(
+					test.tolist(), [date(2024, 6, 28), date(2024, 12, 27)]
+				)
+
+	def test_out_with_other_dtype_success(self):
+		test_input = np.array(['2024-06-13', '2024-12-31'], dtype='datetime64[D]')
+		out = np.empty(2, dtype=object)
+
+		TemporalAdjuster.next(Weekday.MONDAY, test_input, out=out)
+
+		self.assertListEqual(out.tolist(), [date(2024, 6, 17), date(2025, 1, 6)])
+
+	def test_out_allocates_chunks_success(self):
+		def peak(function, dates):
+			out = np.empty_like(dates)
+			tracemalloc.start()
+
+			try:
+				function(dates, out=out)
+
+				return tracemalloc.get_traced_memory()[1]
+
+			finally:
+				tracemalloc.stop()
+
+		tests = [
+			(TemporalAdjuster.first_day_of_month, 'datetime64[D]'),
+			(TemporalAdjuster.last_of_month.bind(Weekday.FRIDAY), 'datetime64[D]'),
+			(TemporalAdjuster.next.bind(Weekday.MONDAY), 'datetime64[ns]'),
+		]
+
+		for function, dtype in tests:
+			with self.subTest(function=function, dtype=dtype):
+				# Unsorted dates with NaT values, whose size is 8 and 32 chunks.
+				small, large = (
+					np.where(
+						np.arange(size) % 9 == 0,
+						np.datetime64('NaT'),
+						np.datetime64('1970-01-01')
+						+ (np.arange(size) * 7919 % 40_000).astype('timedelta64[D]'),
+					).astype(dtype)
+					for size in (8 * DEFAULT_CHUNK_SIZE, 32 * DEFAULT_CHUNK_SIZE)
+				)
+
+				# The memory of the temporaries only depends on the size of the chunks.
+				self.assertLess(peak(function, large), 128 * DEFAULT_CHUNK_SIZE)
+				self.assertLess(
+					peak(function, large) - peak(function, small), DEFAULT_CHUNK_SIZE
+				)
+
+	def test_out_failure(self):
+		test_input = np.array(['2024-06-13', '2024-12-31'], dtype='datetime64[D]')
+
+		tests = [
+			(date(2024, 6, 13), np.empty(1, dtype='datetime64[D]'), TypeError),
+			([date(2024, 6, 13)], np.empty(1, dtype='datetime64[D]'), TypeError),
+			(test_input, [None, None], TypeError),
+			(test_input, np.empty(3, dtype='datetime64[D]'), ValueError),
+		]
+
+		for index, test in enumerate(tests):
+			with self.subTest(
+				f'Testing out parameter failures (subtest {index}) with inputs: {test}'
+			):
+				test_input_date, test_input_out, exception = test
+
+				with self.assertRaises(exception):
+					TemporalAdjuster.first_day_of_month(
+						test_input_date, out=test_input_out
+					)
@@ -0,0 +1,157 @@
+from datetime import date, timedelta
+from unittest import TestCase
+
+import numpy as np
+
+from temporal_adjuster import AdjusterPipeline, TemporalAdjuster
+from temporal_adjuster.common.enums import (
+	ISOWeekday,
+	Weekday,
+	get_week_start,
+	set_week_start,
+	week_starting_on,
+)
+
+WEEK_METHODS = [
+	'first_day_of_week',
+	'first_day_of_next_week',
+	'first_day_of_last_week',
+	'last_day_of_week',
+	'last_day_of_next_week',
+	'last_day_of_last_week',
+]
+
+
+class TestWeekStart(TestCase):
+	dates = np.arange('2023-12-20', '2024-01-20', dtype='datetime64[D]')
+
+	def tearDown(self):
+		set_week_start(Weekday.MONDAY)
+
+	def test_week_start_success(self):
+		test_input = date(2024, 6, 13)
+
+		tests = [
+			('first_day_of_week', Weekday.MONDAY, date(2024, 6, 10)),
+			('first_day_of_week', Weekday.SUNDAY, date(2024, 6, 9)),
+			('first_day_of_week', 'saturday', date(2024, 6, 8)),
+			('first_day_of_week', ISOWeekday.THURSDAY, date(2024, 6, 13)),
+			('first_day_of_week', Weekday.FRIDAY, date(2024, 6, 7)),
+			('first_day_of_next_week', Weekday.SUNDAY, date(2024, 6, 16)),
+			('first_day_of_last_week', Weekday.SUNDAY, date(2024, 6, 2)),
+			('last_day_of_week', Weekday.SUNDAY, date(2024, 6, 15)),
+			('last_day_of_week', Weekday.FRIDAY, date(2024, 6, 13)),
+			('last_day_of_next_week', Weekday.SUNDAY, date(2024, 6, 22)),
+			('last_day_of_last_week', Weekday.SATURDAY, date(2024, 6, 7)),
+		]
+
+		for index, test in enumerate(tests):
+			with self.subTest(
+				f'Testing method {test[0]} (subtest {index}) with inputs: {test}'
+			):
+				method, test_week_start, test_expected_output = test
+
+				self.assertEqual(
+					getattr(TemporalAdjuster, method)(
+						test_input, week_start=test_week_start
+					),
+					test_expected_output,
+				)
+
+	def test_vectorized_same_as_scalar_success(self):
+		for method in WEEK_METHODS:
+			for week_start in Weekday:
+				with self.subTest(method=method, week_start=week_start):
+					output = getattr(TemporalAdjuster, method)(
+						self.dates, week_start=week_start, backend='numpy'
+					)
+
+					np.testing.assert_array_equal(
+						output,
+						getattr(TemporalAdjuster, method)(
+							self.dates, week_start=week_start, backend='python'
+						),
+					)
+
+					first_days = TemporalAdjuster.first_day_of_week(
+						self.dates, week_start=week_start
+					)
+					self.assertTrue(
+						(
+							first_days.astype(object)
+							== [
+								day - timedelta(days=(day.weekday() - week_start) % 7)
+								for day in self.dates.tolist()
+							]
+						).all()
+					)
+
+	def test_process_setting_success(self):
+		self.assertEqual(get_week_start(), Weekday.MONDAY)
+
+		set_week_start('sunday')
+
+		self.assertEqual(get_week_start(), Weekday.SUNDAY)
+		self.assertEqual(
+			TemporalAdjuster.first_day_of_week(date(2024, 6, 13)), date(2024, 6, 9)
+		)
+		np.testing.assert_array_equal(
+			TemporalAdjuster.last_day_of_week(self.dates),
+			TemporalAdjuster.last_day_of_week(self.dates, week_start=Weekday.SUNDAY),
+		)
+		self.assertEqual(
+			TemporalAdjuster.first_day_of_week(
+				date(2024, 6, 13), week_start=Weekday.MONDAY
+			),
+			date(2024, 6, 10),
+		)
+
+		codes, decoder = TemporalAdjuster.bucket([date(2024, 6, 13)], 'week')
+
+		self.assertEqual(decoder.week_start, Weekday.SUNDAY)
+		self.assertEqual(decoder(codes)[0], np.datetime64('2024-06-09'))
+
+		self.assertEqual(
+			AdjusterPipeline('first_day_of_week')(date(2024, 6, 13)), date(2024, 6, 9)
+		)
+
+	def test_context_setting_success(self):
+		with week_starting_on(Weekday.SATURDAY):
+			self.assertEqual(
+				TemporalAdjuster.first_day_of_week(date(2024, 6, 13)), date(2024, 6, 8)
+			)
+			self.assertEqual(
+				AdjusterPipeline('first_day_of_week')(date(2024, 6, 13)),
+				date(2024, 6, 8),
+			)
+
+			table = TemporalAdjuster.date_dimension(
+				date(2024, 6, 13), date(2024, 6, 13)
+			)
+
+			self.assertEqual(table['first_day_of_week'][0], np.datetime64('2024-06-08'))
+
+		self.assertEqual(get_week_start(), Weekday.MONDAY)
+		self.assertEqual(
+			AdjusterPipeline('first_day_of_week')(date(2024, 6, 13)), date(2024, 6, 10)
+		)
+
+	def test_bound_adjuster_success(self):
+		adjuster = TemporalAdjuster.last_day_of_next_week.bind(
+			week_start=Weekday.SUNDAY
+		)
+
+		self.assertEqual(adjuster(date(2024, 6, 13)), date(2024, 6, 22))
+		self.assertListEqual(
+			adjuster.preimage(date(2024, 6, 22)),
+			[(date(2024, 6, 9), date(2024, 6, 15))],
+		)
+		self.assertEqual(
+			AdjusterPipeline('last_day_of_next_week:SUN').steps, (adjuster,)
+		)
+
+	def test_invalid_week_start_failure(self):
+		for method in WEEK_METHODS:
+			with self.subTest(method=method):
+				with self.assertRaises(KeyError):
+					getattr(TemporalAdjuster, method)(self.dates, week_start='someday')